@@ -1,10 +1,16 @@
 from typing import Annotated
 from uuid import UUID
 
+from backend.app.api.dependencies.common import Variants
 from fastapi import Depends, Query
 from pydantic import BaseModel, Field
 
 
+class TagMatch(Variants):
+    any = "any"
+    all = "all"
+
+
 class FilterParams(BaseModel):
     """Параметры фильтрации выставок."""
 
@@ -23,9 +29,17 @@ class FilterParams(BaseModel):
         description="Filter exhibitions by tag IDs.",
         example=["123e4567-e89b-12d3-a456-426614174000"],
     )
+    tag_match: TagMatch = Field(
+        default=TagMatch.any,
+        description="Match exhibitions having any of the given tags or all of them.",
+        example="any",
+    )
     q: str | None = Field(
         default=None,
-        description="Search exhibitions by title or description.",
+        description=(
+            "Full-text search over title, description, tags, participants and blocks. "
+            'Supports web search syntax: "quoted phrase", or, -excluded.'
+        ),
         example="art exhibition",
     )
 
@@ -35,9 +49,12 @@ class SortParams(BaseModel):
 
     sortBy: str | None = Field(
         default=None,
-        description="Sort the exhibitions by a specific field.",
+        description=(
+            "Sort the exhibitions by a specific field. Defaults to relevance when searching "
+            "and to created_at otherwise."
+        ),
         example="created_at",
-        pattern="^(created_at|likes_count|rating|title)$",
+        pattern="^(created_at|likes_count|rating|title|relevance)$",
     )
     sortOrder: str | None = Field(
         default=None,
@@ -52,17 +69,24 @@ def filter_query_params(
     organization_id: Annotated[UUID | None, Query()] = None,
     tag_names: Annotated[list[str] | None, Query()] = None,
     tag_ids: Annotated[list[UUID] | None, Query()] = None,
+    tag_match: Annotated[TagMatch, Query()] = TagMatch.any,
     q: Annotated[str | None, Query()] = None,
 ) -> FilterParams:
-    return FilterParams(organization_id=organization_id, tag_names=tag_names, tag_ids=tag_ids, q=q)
+    return FilterParams(
+        organization_id=organization_id,
+        tag_names=tag_names,
+        tag_ids=tag_ids,
+        tag_match=tag_match,
+        q=q,
+    )
 
 
 def sort_query_params(
     sortBy: Annotated[
         str | None,
-        Query(regex="^(created_at|likes_count|rating|title)$"),
-    ] = "created_at",
-    sortOrder: Annotated[str | None, Query(regex="^(asc|desc)$")] = "asc",
+        Query(pattern="^(created_at|likes_count|rating|title|relevance)$"),
+    ] = None,
+    sortOrder: Annotated[str | None, Query(pattern="^(asc|desc)$")] = None,
 ) -> SortParams:
     return SortParams(sortBy=sortBy, sortOrder=sortOrder)
 
@@ -1,5 +1,6 @@
 from typing import Annotated
 
+from backend.app.api.dependencies.common import Variants
 from backend.app.core.config import settings
 from fastapi import Depends
 from pydantic import BaseModel, Field
@@ -18,3 +19,25 @@ class PaginationParams(BaseModel):
 
 
 PaginationDep = Annotated[PaginationParams, Depends(PaginationParams)]
+
+
+class CountMode(Variants):
+    exact = "exact"
+    estimate = "estimate"
+    none = "none"
+
+
+class CursorPaginationParams(PaginationParams):
+    """Параметры пагинации с поддержкой курсора."""
+
+    cursor: str | None = Field(
+        default=None,
+        description="Opaque cursor from `next_cursor` of the previous page; replaces `skip`",
+    )
+    count: CountMode = Field(
+        default=CountMode.exact,
+        description="How to compute the total: exact count, planner estimate or none",
+    )
+
+
+CursorPaginationDep = Annotated[CursorPaginationParams, Depends(CursorPaginationParams)]
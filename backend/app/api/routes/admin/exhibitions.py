@@ -2,7 +2,7 @@ import uuid
 
 from backend.app.api.dependencies.common import SessionDep
 from backend.app.api.dependencies.exhibition.filters import FilterDep, SortDep
-from backend.app.api.dependencies.pagination import PaginationDep
+from backend.app.api.dependencies.pagination import CursorPaginationDep
 from backend.app.api.dependencies.users import CurrentAdmin, CurrentUser, get_current_admin
 from backend.app.api.routes.exhibitions import ExhibitionOr404
 from backend.app.crud import exhibition as exhibition_crud
@@ -12,7 +12,7 @@ from backend.app.db.models.exhibition import (
     ExhibitionStatusEnum,
 )
 from backend.app.services.admin import exhibition as admin_exhibition_service
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 
 router = APIRouter()
 
@@ -20,22 +20,24 @@ router = APIRouter()
 @router.get("/", response_model=ExhibitionsPublic, dependencies=[Depends(get_current_admin)])
 async def read_exhibitions(
     session: SessionDep,
-    pagination: PaginationDep,
+    pagination: CursorPaginationDep,
     filters: FilterDep,
     sort: SortDep,
     current_user: CurrentAdmin,
     search: str | None = None,
-) -> ExhibitionsPublic:
-    exhibitions = await exhibition_crud.get_exhibitions(
+) -> Response:
+    exhibitions = await exhibition_crud.get_exhibitions_json(
         session=session,
         skip=pagination.skip,
         limit=pagination.limit,
+        cursor=pagination.cursor,
+        count_mode=pagination.count,
         filters=filters,
         sort=sort,
         current_user_id=current_user.id if current_user else None,
         search=search,
     )
-    return exhibitions
+    return Response(content=exhibitions, media_type="application/json")
 
 
 @router.get(
@@ -2,8 +2,8 @@ import uuid
 
 from backend.app.api.dependencies.common import SessionDep
 from backend.app.api.dependencies.organizations import OrganizationOr404
+from backend.app.api.dependencies.pagination import PaginationDep
 from backend.app.api.dependencies.users import CurrentUser, get_current_admin
-from backend.app.api.routes.exhibitions import PaginationDep
 from backend.app.db.models.organization import (
     OrganizationPublic,
     OrganizationsPublic,
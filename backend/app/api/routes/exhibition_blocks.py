@@ -5,7 +5,11 @@ from backend.app.api.dependencies.exhibition.exhibition import ExhibitionOr404
 from backend.app.crud import exhibition_block as exhibition_block_crud
 from backend.app.db.models.exhibition_block import (
     ExhibitionBlockCreate,
+    ExhibitionBlockIdsPublic,
     ExhibitionBlockItemCreate,
+    ExhibitionBlockMove,
+    ExhibitionBlocksImport,
+    ExhibitionBlocksOrder,
     ExhibitionBlockUpdate,
 )
 from fastapi import APIRouter, HTTPException, status
@@ -34,6 +38,49 @@ async def add_exhibition_block(
     return block
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ExhibitionBlockIdsPublic,
+)
+async def import_exhibition_blocks(
+    exhibition_id: UUID,
+    import_in: ExhibitionBlocksImport,
+    session: SessionDep,
+):
+    """
+    Append many blocks with their items at once; returns the new block ids in order.
+    """
+    try:
+        block_ids = await exhibition_block_crud.import_exhibition_blocks(
+            session=session,
+            exhibition_id=exhibition_id,
+            blocks=import_in.blocks,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return ExhibitionBlockIdsPublic(ids=block_ids)
+
+
+@router.put("/order", status_code=status.HTTP_204_NO_CONTENT)
+async def reorder_exhibition_blocks(
+    exhibition: ExhibitionOr404,
+    order_in: ExhibitionBlocksOrder,
+    session: SessionDep,
+):
+    """
+    Reorder all blocks of the exhibition at once.
+    """
+    try:
+        await exhibition_block_crud.reorder_exhibition_blocks(
+            session=session,
+            exhibition_id=exhibition.id,
+            block_ids=order_in.block_ids,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
 @router.delete("/{block_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_exhibition_block(exhibition: ExhibitionOr404, block_id: UUID, session: SessionDep):
     try:
@@ -58,3 +105,22 @@ async def update_exhibition_block(
     except ValueError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
     return block
+
+
+@router.put("/{block_id}/position")
+async def move_exhibition_block(
+    exhibition: ExhibitionOr404,
+    block_id: UUID,
+    move_in: ExhibitionBlockMove,
+    session: SessionDep,
+):
+    try:
+        block = await exhibition_block_crud.move_exhibition_block(
+            session=session,
+            exhibition_id=exhibition.id,
+            block_id=block_id,
+            position=move_in.position,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e)) from e
+    return block
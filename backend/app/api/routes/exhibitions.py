@@ -5,7 +5,7 @@ from backend.app.api.dependencies.common import SessionDep
 from backend.app.api.dependencies.exhibition.exhibition import ExhibitionOr404
 from backend.app.api.dependencies.exhibition.filters import FilterDep, SortDep
 from backend.app.api.dependencies.exhibits import ExhibitOr404
-from backend.app.api.dependencies.pagination import PaginationDep
+from backend.app.api.dependencies.pagination import CursorPaginationDep
 from backend.app.api.dependencies.users import (
     CurrentUser,
     OptionalCurrentUser,
@@ -18,39 +18,65 @@ from backend.app.db.models.exhibition import (
     Exhibition,
     ExhibitionCreate,
     ExhibitionPublic,
+    ExhibitionsPublic,
     ExhibitionUpdate,
     ExhibitionWithCommentsPublic,
 )
 from backend.app.db.models.exhibition_exhibit import ExhibitionExhibitCreate
 from backend.app.db.models.exhibition_moderation_comment import ExhibitionModerationCommentPublic
-from backend.app.db.models.user_exhibition_like import UserExhibitionLike
 from backend.app.db.schemas import Message
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import select
+from backend.app.utils.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 router = APIRouter()
 
 
-@router.get("/")
+@router.get("/", response_model=ExhibitionsPublic)
 async def read_exhibitions(
     session: SessionDep,
-    pagination: PaginationDep,
+    pagination: CursorPaginationDep,
     filters: FilterDep,
     sort: SortDep,
     current_user: OptionalCurrentUser,
+    request: Request,
 ) -> Any:
     """
     Retrieve a list of exhibitions with pagination.
+
+    Anonymous visitors get the published catalogue. Pages carry an ETag of their content,
+    so repeated requests with If-None-Match get an empty 304.
     """
-    exhibitions = await exhibition_crud.get_exhibitions(
-        session=session,
-        skip=pagination.skip,
-        limit=pagination.limit,
-        filters=filters,
-        sort=sort,
-        current_user_id=current_user.id if current_user else None,
-    )
-    return exhibitions
+    if current_user is None:
+        exhibitions = await exhibition_crud.get_published_exhibitions_json(
+            session=session,
+            skip=pagination.skip,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            count_mode=pagination.count,
+            filters=filters,
+            sort=sort,
+        )
+    else:
+        exhibitions = await exhibition_crud.get_exhibitions_json(
+            session=session,
+            skip=pagination.skip,
+            limit=pagination.limit,
+            cursor=pagination.cursor,
+            count_mode=pagination.count,
+            filters=filters,
+            sort=sort,
+            current_user_id=current_user.id,
+        )
+
+    headers = validator_headers(make_etag(exhibitions), private=current_user is not None)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+    return Response(content=exhibitions, media_type="application/json", headers=headers)
 
 
 @router.get(
@@ -177,29 +203,34 @@ async def read_exhibition_by_id(
     exhibition_id: uuid.UUID,
     session: SessionDep,
     current_user: CurrentUser,
+    request: Request,
+    response: Response,
 ) -> Any:
     """
     Retrieve full details of a specific exhibition, including likes_count and is_liked_by_current_user.
+
+    Answers If-None-Match with 304 without loading the exhibition.
     """
-    exhibition = await exhibition_crud.get_exhibition(session=session, id=exhibition_id)
-    exhibition = ExhibitionPublic(**exhibition.model_dump())
-    if not exhibition:
+    current_user_id = current_user.id if current_user else None
+    version = await exhibition_crud.get_exhibition_version(
+        session=session,
+        exhibition_id=exhibition_id,
+        current_user_id=current_user_id,
+    )
+    if not version:
         raise HTTPException(status_code=404, detail="Exhibition not found")
+    # Likes don't move updated_at, so only the ETag, which covers the likes count and the
+    # viewer's like, can validate the payload; no Last-Modified / If-Modified-Since here
+    headers = validator_headers(make_etag(exhibition_id, *version), private=True)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
 
-    # Проверяем лайк текущего пользователя
-    is_liked = None
-    if current_user:
-        like = await session.execute(
-            select(UserExhibitionLike).where(
-                UserExhibitionLike.exhibition_id == exhibition_id,
-                UserExhibitionLike.user_id == current_user.id,
-            ),
-        )
-        is_liked = like.scalar_one_or_none() is not None
-
-    # Собираем структуру ответа
-    data = {
-        **exhibition.model_dump(),
-        "is_liked_by_current_user": is_liked,
-    }
-    return ExhibitionPublic(**data)
+    exhibition = await exhibition_crud.get_exhibition_detail(
+        session=session,
+        exhibition_id=exhibition_id,
+        current_user_id=current_user_id,
+    )
+    if not exhibition:
+        raise HTTPException(status_code=404, detail="Exhibition not found")
+    response.headers.update(headers)
+    return exhibition
@@ -11,7 +11,13 @@ from backend.app.db.models.exhibit import (
     ExhibitUpdate,
 )
 from backend.app.db.schemas import Message
-from fastapi import APIRouter
+from backend.app.utils.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from fastapi import APIRouter, Request, Response
 
 router = APIRouter()
 
@@ -35,10 +41,16 @@ async def read_exhibits(session: SessionDep, pagination: PaginationDep) -> Any:
 @router.get("/{exhibit_id}", response_model=ExhibitPublic)
 async def read_exhibit_by_id(
     exhibit: ExhibitOr404,
+    request: Request,
+    response: Response,
 ) -> Any:
     """
     Retrieve an exhibit by its ID.
     """
+    headers = validator_headers(make_etag(exhibit.id, exhibit.updated_at), exhibit.updated_at)
+    if is_not_modified(request, headers["ETag"], exhibit.updated_at):
+        return not_modified(headers)
+    response.headers.update(headers)
     return exhibit
 
 
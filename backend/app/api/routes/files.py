@@ -1,9 +1,21 @@
 from typing import Any
 
-from backend.app.db.schemas import FileUploadResponse
+from backend.app.core.config import settings
+from backend.app.db.schemas import (
+    FileUploadResponse,
+    PresignedUpload,
+    PresignedUploadComplete,
+    PresignedUploadCreate,
+)
+from backend.app.utils.http_cache import (
+    immutable_headers,
+    is_not_modified,
+    not_modified,
+    parse_byte_range,
+)
 from backend.app.utils.minio import minio_client
-from fastapi import APIRouter, File, HTTPException, UploadFile
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, File, HTTPException, Request, Response, UploadFile, status
+from fastapi.responses import RedirectResponse, StreamingResponse
 
 router = APIRouter()
 
@@ -21,15 +33,75 @@ async def upload_file(file: UploadFile = None, prefix: str = "general/") -> Any:
     return FileUploadResponse(object_key=object_key, file_url=file_url)
 
 
-@router.get("/{object_key}/file")
-async def serve_exhibit_file(object_key: str):
-    """Serve a file from MinIO as a streaming response."""
-    try:
+@router.post(
+    "/presigned-uploads",
+    response_model=PresignedUpload,
+)
+async def create_presigned_upload(upload_in: PresignedUploadCreate) -> Any:
+    """Выдать подписанный запрос для загрузки файла напрямую в MinIO."""
+    return await minio_client.create_presigned_upload(upload_in.content_type, upload_in.size)
+
+
+@router.post(
+    "/presigned-uploads/complete",
+    response_model=FileUploadResponse,
+)
+async def complete_presigned_upload(upload_in: PresignedUploadComplete) -> Any:
+    """Проверить загруженный напрямую файл и вернуть его ключ и подписанный URL."""
+    object_key = await minio_client.complete_presigned_upload(upload_in)
+    file_url = await minio_client.get_file_url(object_key)
+    return FileUploadResponse(object_key=object_key, file_url=file_url)
+
+
+async def _serve_file(request: Request, object_key: str, media_type: str) -> Response:
+    if settings.FILES_SERVING_MODE == "public":
+        # Keys are never reused for other content, so the redirect itself may be cached
+        return RedirectResponse(
+            f"{settings.FILES_PUBLIC_URL.rstrip('/')}/{object_key}",
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={"Cache-Control": "public, max-age=86400"},
+        )
+    if settings.FILES_SERVING_MODE == "presigned":
+        url, max_age = await minio_client.get_cached_file_url(object_key)
+        return RedirectResponse(
+            url,
+            status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+            headers={"Cache-Control": f"private, max-age={max_age}"},
+        )
+
+    # Keys are random and never reused, so the stored object is immutable
+    head = await minio_client.head_file(object_key)
+    etag, size = head["ETag"], head["ContentLength"]
+    headers = immutable_headers(etag, head.get("LastModified")) | {"Accept-Ranges": "bytes"}
+    if is_not_modified(request, etag, head.get("LastModified")):
+        return not_modified(headers)
+    media_type = head.get("ContentType") or media_type
+
+    if_range = request.headers.get("if-range")
+    byte_range = None
+    if if_range is None or if_range == etag:
+        byte_range = parse_byte_range(request.headers.get("range"), size)
+    if byte_range is None:
         return StreamingResponse(
             content=minio_client.download_file(object_key),
-            media_type="application/octet-stream",
-            headers={"Cache-Control": "no-cache"},
+            media_type=media_type,
+            headers=headers | {"Content-Length": str(size)},
         )
+    start, end = byte_range
+    return StreamingResponse(
+        content=minio_client.download_file(object_key, byte_range),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers
+        | {"Content-Range": f"bytes {start}-{end}/{size}", "Content-Length": str(end - start + 1)},
+    )
+
+
+@router.get("/{object_key}/file")
+async def serve_exhibit_file(request: Request, object_key: str):
+    """Serve a file from MinIO, streamed or by a redirect to storage."""
+    try:
+        return await _serve_file(request, object_key, "application/octet-stream")
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -37,14 +109,10 @@ async def serve_exhibit_file(object_key: str):
 
 
 @router.get("/{object_key}/image")
-async def serve_exhibit_image(object_key: str):
-    """Serve a file from MinIO as a streaming response."""
+async def serve_exhibit_image(request: Request, object_key: str):
+    """Serve an image from MinIO, streamed or by a redirect to storage."""
     try:
-        return StreamingResponse(
-            content=minio_client.download_file(object_key),
-            media_type="image/jpeg",
-            headers={"Cache-Control": "no-cache"},
-        )
+        return await _serve_file(request, object_key, "image/jpeg")
     except HTTPException as e:
         raise e
     except Exception as e:
@@ -1,4 +1,7 @@
+from backend.app.crud.exhibition import published_first_page_flights
+from backend.app.utils.cache import cache_backend
 from backend.app.utils.healthcheck import check_postgres
+from backend.app.utils.minio import minio_client
 from fastapi import APIRouter, HTTPException
 
 router = APIRouter()
@@ -14,3 +17,11 @@ async def health_check():
         return {"status": "healthy", "details": results}
 
     raise HTTPException(status_code=503, detail={"status": "unhealthy", "details": results})
+
+
+@router.get("/health/caches")
+async def cache_stats():
+    stats = {cache.name: cache.stats() for cache in cache_backend.caches}
+    stats["published_first_page"] = published_first_page_flights.stats()
+    stats["file_urls"] = minio_client.url_cache.stats()
+    return stats
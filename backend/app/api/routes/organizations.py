@@ -19,7 +19,13 @@ from backend.app.db.models.user_organization import (
     UserOrganizationPublic,
 )
 from backend.app.services import organization as organization_service
-from fastapi import APIRouter, HTTPException, Query
+from backend.app.utils.http_cache import (
+    is_not_modified,
+    make_etag,
+    not_modified,
+    validator_headers,
+)
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
 router = APIRouter()
 
@@ -122,12 +128,27 @@ async def get_organization_profile(
     current_user: CurrentUser,
     organization_id: str,
     session: SessionDep,
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
 ):
     """
     Get organization profile with published exhibitions (paginated).
+
+    Answers If-None-Match with 304 without loading the profile.
     """
+    version = await organization_crud.get_organization_profile_version(
+        session=session,
+        organization_id=organization_id,
+        current_user_id=current_user.id,
+    )
+    if not version:
+        raise HTTPException(status_code=404, detail="Organization not found")
+    headers = validator_headers(make_etag(version, skip, limit), private=True)
+    if is_not_modified(request, headers["ETag"]):
+        return not_modified(headers)
+
     org = await organization_crud.get_organization_profile_with_exhibitions(
         session=session,
         organization_id=organization_id,
@@ -137,6 +158,7 @@ async def get_organization_profile(
     )
     if not org:
         raise HTTPException(status_code=404, detail="Organization not found")
+    response.headers.update(headers)
     return org
 
 
@@ -1,10 +1,10 @@
 import uuid
-from typing import Any
+from typing import Annotated, Any
 
 from backend.app.api.dependencies.common import (
     SessionDep,
 )
-from backend.app.api.dependencies.pagination import PaginationDep
+from backend.app.api.dependencies.pagination import CursorPaginationDep, PaginationDep
 from backend.app.api.dependencies.users import (
     CurrentUser,
     UserOr404,
@@ -21,11 +21,15 @@ from backend.app.db.models.user import (
     UsersPublic,
     UserUpdate,
 )
+from backend.app.db.models.user_exhibition_like import (
+    ExhibitionLikePublic,
+    ExhibitionLikesPublic,
+)
 from backend.app.db.schemas import (
     Message,
     UpdatePassword,
 )
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
 router = APIRouter()
 
@@ -113,26 +117,50 @@ async def update_user(
 
 @router.get(
     "/me/liked-exhibitions",
+    response_model=ExhibitionsPublic,
 )
 async def get_liked_exhibitions(
     session: SessionDep,
     current_user: CurrentUser,
-    pagination: PaginationDep,
+    pagination: CursorPaginationDep,
 ) -> Any:
     """
-    Retrieve a list of exhibitions liked by the current authenticated user.
+    Retrieve a list of exhibitions liked by the current authenticated user, most recently
+    liked first.
     """
-    liked_exhibitions = await user_crud.get_liked_exhibitions(
+    liked_exhibitions = await user_crud.get_liked_exhibitions_json(
         session=session,
         user_id=current_user.id,
         skip=pagination.skip,
         limit=pagination.limit,
+        cursor=pagination.cursor,
+        count_mode=pagination.count,
+    )
+    return Response(content=liked_exhibitions, media_type="application/json")
+
+
+@router.get(
+    "/me/exhibition-likes",
+    response_model=ExhibitionLikesPublic,
+)
+async def get_exhibition_likes(
+    session: SessionDep,
+    current_user: CurrentUser,
+    exhibition_ids: Annotated[list[uuid.UUID], Query(min_length=1, max_length=100)],
+) -> Any:
+    """
+    Likes counters and the current user's like flags of up to 100 exhibitions at once.
+    """
+    return await user_crud.get_exhibition_likes(
+        session=session,
+        user_id=current_user.id,
+        exhibition_ids=exhibition_ids,
     )
-    return ExhibitionsPublic(data=liked_exhibitions, count=len(liked_exhibitions))
 
 
 @router.post(
     "/me/liked-exhibitions/{exhibition_id}",
+    response_model=ExhibitionLikePublic,
 )
 async def like_exhibition(
     session: SessionDep,
@@ -140,18 +168,18 @@ async def like_exhibition(
     exhibition_id: uuid.UUID,
 ) -> Any:
     """
-    Like an exhibition for the current authenticated user.
+    Like an exhibition for the current authenticated user. Liking it again changes nothing.
     """
-    await user_crud.like_exhibition(
+    return await user_crud.like_exhibition(
         session=session,
         user_id=current_user.id,
         exhibition_id=exhibition_id,
     )
-    return Message(message="Exhibition liked successfully")
 
 
 @router.delete(
     "/me/liked-exhibitions/{exhibition_id}",
+    response_model=ExhibitionLikePublic,
 )
 async def unlike_exhibition(
     session: SessionDep,
@@ -159,14 +187,14 @@ async def unlike_exhibition(
     exhibition_id: uuid.UUID,
 ) -> Any:
     """
-    Unlike an exhibition for the current authenticated user.
+    Unlike an exhibition for the current authenticated user. Unliking an exhibition that
+    isn't liked changes nothing.
     """
-    await user_crud.unlike_exhibition(
+    return await user_crud.unlike_exhibition(
         session=session,
         user_id=current_user.id,
         exhibition_id=exhibition_id,
     )
-    return Message(message="Exhibition unliked successfully")
 
 
 @router.patch("/me/account/password", response_model=Message)
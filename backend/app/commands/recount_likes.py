@@ -0,0 +1,23 @@
+"""
+Recount the denormalized `exhibitions.likes_count` counters.
+
+Usage: python -m backend.app.commands.recount_likes [exhibition_id]
+"""
+
+import asyncio
+import sys
+from uuid import UUID
+
+from backend.app.api.dependencies.common import get_db_session
+from backend.app.crud import exhibition as exhibition_crud
+from backend.app.utils.logger import logger
+
+
+async def main(exhibition_id: UUID | None = None) -> None:
+    async with get_db_session() as session:
+        fixed = await exhibition_crud.recount_likes(session, exhibition_id=exhibition_id)
+    logger.info(f"Recounted likes, {fixed} exhibition counters were out of sync")
+
+
+if __name__ == "__main__":
+    asyncio.run(main(UUID(sys.argv[1]) if len(sys.argv) > 1 else None))
@@ -1,4 +1,6 @@
-from pydantic import ConfigDict, computed_field, field_validator
+from typing import Literal, Self
+
+from pydantic import ConfigDict, computed_field, field_validator, model_validator
 from pydantic_settings import BaseSettings
 
 
@@ -38,6 +40,42 @@ class Settings(BaseSettings):
     MINIO_SECRET_KEY: str
     MINIO_ENDPOINT: str
     MINIO_BUCKET: str
+    # The S3 client lives as long as the app and pools its connections
+    MINIO_MAX_POOL_CONNECTIONS: int = 50
+    MINIO_CONNECT_TIMEOUT: float = 5.0
+    MINIO_READ_TIMEOUT: float = 30.0
+    # Attempts per request, the first one included
+    MINIO_MAX_ATTEMPTS: int = 3
+    # Uploads are streamed: files above one part go through a multipart upload with up to
+    # MINIO_UPLOAD_CONCURRENCY parts (at least 5 MiB each) in memory and in flight
+    MINIO_UPLOAD_PART_SIZE: int = 8 * 1024 * 1024
+    MINIO_UPLOAD_CONCURRENCY: int = 4
+    MINIO_MAX_UPLOAD_SIZE: int = 200 * 1024 * 1024
+    # How /files serves objects: "proxy" streams them through the API, "presigned"
+    # redirects to a presigned GET URL (MINIO_ENDPOINT must then be reachable by
+    # browsers) and "public" redirects to FILES_PUBLIC_URL, a CDN or public bucket
+    FILES_SERVING_MODE: Literal["proxy", "presigned", "public"] = "proxy"
+    FILES_PUBLIC_URL: str | None = None
+    # Presigned GET URLs are reused until MINIO_PRESIGNED_URL_SLACK seconds before expiry
+    MINIO_PRESIGNED_URL_EXPIRES: int = 3600
+    MINIO_PRESIGNED_URL_SLACK: int = 300
+    MINIO_PRESIGNED_URL_CACHE_SIZE: int = 10000
+    # Direct uploads to storage through presigned requests
+    MINIO_PRESIGNED_UPLOAD_EXPIRES: int = 900
+    MINIO_UPLOAD_CONTENT_TYPES: list[str] = [
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+        "image/gif",
+        "image/tiff",
+        "application/pdf",
+    ]
+
+    @model_validator(mode="after")
+    def check_files_public_url(self) -> Self:
+        if self.FILES_SERVING_MODE == "public" and not self.FILES_PUBLIC_URL:
+            raise ValueError('FILES_PUBLIC_URL is required when FILES_SERVING_MODE is "public"')
+        return self
 
     @computed_field
     @property
@@ -73,6 +111,29 @@ class Settings(BaseSettings):
     DEFAULT_QUERY_LIMIT: int
     MIN_PASSWORD_LENGTH: int
 
+    # Extra connections a worker takes at once for reads running in parallel (0 disables them)
+    CONCURRENT_READS_LIMIT: int = 4
+
+    # Cache of read-heavy payloads: "memory" keeps it in each worker, "redis" shares it
+    # between workers through a Redis-protocol server at CACHE_URL
+    CACHE_BACKEND: str = "memory"
+    CACHE_URL: str = "redis://localhost:6379/0"
+    CACHE_KEY_PREFIX: str = "jk-museum"
+    CACHE_POOL_SIZE: int = 8
+    CACHE_TIMEOUT: float = 0.5
+    CACHE_TTL: float = 60.0
+    # Decoded payloads kept by each worker in front of the backend (size 0 disables it)
+    CACHE_LOCAL_SIZE: int = 256
+
+    # Blocks accepted by one bulk import into an exhibition, and items by each of them
+    BLOCK_IMPORT_MAX_BLOCKS: int = 500
+    BLOCK_IMPORT_MAX_ITEMS: int = 100
+
+    # Full-text search. Stored documents keep the configuration they were built with, so
+    # changing SEARCH_TEXT_CONFIG needs the exhibitions' search documents rebuilt
+    SEARCH_TEXT_CONFIG: str = "russian"
+    SEARCH_TRIGRAM_FALLBACK: bool = True
+
     model_config = ConfigDict(env_file=".env", env_file_encoding="utf-8", extra="allow")
 
 
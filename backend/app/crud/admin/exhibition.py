@@ -1,5 +1,9 @@
 import uuid
 
+from backend.app.crud.exhibition import (
+    invalidate_exhibition_cache,
+    refresh_exhibition_read_models,
+)
 from backend.app.db.models.exhibition import Exhibition, ExhibitionStatusEnum
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -13,6 +17,9 @@ async def update_exhibition_status(
     exhibition = await session.get(Exhibition, exhibition_id)
     exhibition.status = new_status
     session.add(exhibition)
+    organization_id = exhibition.organization_id
+    await refresh_exhibition_read_models(session, exhibition_id)
     await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
     await session.refresh(exhibition)
     return exhibition
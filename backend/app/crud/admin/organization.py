@@ -2,6 +2,7 @@ import uuid
 from collections.abc import Sequence
 
 from backend.app.api.dependencies.pagination import PaginationDep
+from backend.app.crud.organization import invalidate_organization_profile
 from backend.app.db.models.organization import Organization, OrgStatusEnum
 from backend.app.db.models.organization_moderation_comment import OrganizationModerationComment
 from backend.app.utils.logger import log_method_call
@@ -26,7 +27,7 @@ async def read_organizations(
                     Organization.status == status if status else True,
                 )
                 .where(
-                    Organization.name.startswith(search) if search else True,
+                    Organization.name.icontains(search, autoescape=True) if search else True,
                 )
                 .offset(pagination.skip)
                 .limit(pagination.limit),
@@ -64,4 +65,5 @@ async def update_organization_status(
     session.add(organization_moderation_comment)
     await session.commit()
     await session.refresh(organization)
+    await invalidate_organization_profile(organization.id)
     return organization
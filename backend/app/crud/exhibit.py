@@ -1,5 +1,6 @@
 from backend.app.core.config import settings
 from backend.app.db.models.exhibit import Exhibit, ExhibitCreate, ExhibitsPublic, ExhibitUpdate
+from backend.app.utils.concurrency import gather_reads, scalar, scalars
 from backend.app.utils.logger import log_method_call
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -51,6 +52,9 @@ async def get_exhibits(
     limit: int = settings.DEFAULT_QUERY_LIMIT,
 ) -> ExhibitsPublic:
     statement = select(Exhibit).offset(skip).limit(limit)
-    exhibits = (await session.execute(statement)).scalars().all()
-    count = (await session.execute(select(func.count(Exhibit.id)))).scalar_one()
+    exhibits, count = await gather_reads(
+        session,
+        scalars(statement),
+        scalar(select(func.count(Exhibit.id))),
+    )
     return ExhibitsPublic(data=exhibits, count=count)
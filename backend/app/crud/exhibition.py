@@ -1,79 +1,331 @@
+import json
 import uuid
 from collections.abc import Sequence
+from datetime import datetime
 from uuid import UUID
 
-from backend.app.api.dependencies.exhibition.filters import FilterParams, SortParams
+from backend.app.api.dependencies.exhibition.filters import FilterParams, SortParams, TagMatch
+from backend.app.api.dependencies.pagination import CountMode
 from backend.app.core.config import settings
 from backend.app.crud import organization as organization_crud
 from backend.app.crud.exhibition_participant import (
     create_exhibition_participants,
+    get_exhibition_participants,
     update_exhibition_participants,
 )
-from backend.app.crud.exhibition_tag import create_or_exist_exhibition_tags, delete_exhibition_tags
-from backend.app.crud.tag import create_or_exist_tags
+from backend.app.crud.exhibition_search import (
+    refresh_search_document,
+    search_predicate,
+    search_rank,
+)
+from backend.app.crud.exhibition_tag import (
+    create_or_exist_exhibition_tags,
+    delete_exhibition_tags,
+    get_exhibition_tags,
+)
+from backend.app.crud.tag import normalize_tag_names
 from backend.app.db.models.exhibition import (
     Exhibition,
     ExhibitionCreate,
     ExhibitionPublic,
     ExhibitionsPublic,
+    ExhibitionStatusEnum,
     ExhibitionUpdate,
 )
 from backend.app.db.models.exhibition_block import ExhibitionBlock, ExhibitionBlockPublic
 from backend.app.db.models.exhibition_block_item import ExhibitionBlockItem
+from backend.app.db.models.exhibition_catalogue_card import ExhibitionCatalogueCard
 from backend.app.db.models.exhibition_participant import ExhibitionParticipant
+from backend.app.db.models.exhibition_search_document import ExhibitionSearchDocument
 from backend.app.db.models.exhibition_tag import ExhibitionTag
 from backend.app.db.models.tag import Tag, TagPublic
 from backend.app.db.models.user_exhibition_like import UserExhibitionLike
+from backend.app.utils.cache import SharedCache
+from backend.app.utils.concurrency import gather_reads
+from backend.app.utils.cursor import decode_cursor, encode_cursor
 from backend.app.utils.logger import log_method_call
+from backend.app.utils.singleflight import SingleFlight
+from backend.app.utils.sql import estimate_rows
 from fastapi import HTTPException
-from sqlalchemy import JSON, Integer, Select, func, literal_column, select, text
+from sqlalchemy import (
+    JSON,
+    ColumnElement,
+    Exists,
+    Row,
+    ScalarSelect,
+    Text,
+    and_,
+    cast,
+    delete,
+    exists,
+    func,
+    insert,
+    literal,
+    literal_column,
+    null,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
+_EMPTY_JSON_ARRAY = literal_column("'[]'::json")
+
+
+def _json_array(element, *order_by):
+    """Aggregates ``element`` into a JSON array, returning ``[]`` instead of NULL."""
+    aggregated = aggregate_order_by(element, *order_by) if order_by else element
+    return func.coalesce(func.json_agg(aggregated, type_=JSON), _EMPTY_JSON_ARRAY)
 
-@log_method_call
-async def get_exhibition(session: AsyncSession, **filters) -> ExhibitionPublic | None:
-    statement = select(Exhibition).filter_by(**filters)
-    result = await session.execute(statement)
-    exhibition = result.scalar_one_or_none()
-    if not exhibition:
-        return None
 
-    likes_stmt = select(func.count(UserExhibitionLike.user_id)).where(
-        UserExhibitionLike.exhibition_id == exhibition.id,
+def _tags_json() -> ScalarSelect:
+    """Correlated subquery with the exhibition tags as a JSON array."""
+    return (
+        select(
+            _json_array(
+                func.json_build_object(
+                    "name",
+                    Tag.name,
+                    "id",
+                    Tag.id,
+                    "created_at",
+                    Tag.created_at,
+                ),
+                Tag.name,
+            ),
+        )
+        .select_from(ExhibitionTag)
+        .join(Tag, ExhibitionTag.tag_id == Tag.id)
+        .where(ExhibitionTag.exhibition_id == Exhibition.id)
+        .scalar_subquery()
     )
-    likes_result = await session.execute(likes_stmt)
-    likes_count = likes_result.scalar_one() or 0
 
-    participants_stmt = select(ExhibitionParticipant).where(
-        ExhibitionParticipant.exhibition_id == exhibition.id,
+
+def _participants_json() -> ScalarSelect:
+    """Correlated subquery with the exhibition participants as a JSON array."""
+    return (
+        select(
+            _json_array(
+                func.json_build_object(
+                    "name",
+                    ExhibitionParticipant.name,
+                    "id",
+                    ExhibitionParticipant.id,
+                    "exhibition_id",
+                    ExhibitionParticipant.exhibition_id,
+                    "created_at",
+                    ExhibitionParticipant.created_at,
+                ),
+                ExhibitionParticipant.created_at,
+            ),
+        )
+        .where(ExhibitionParticipant.exhibition_id == Exhibition.id)
+        .scalar_subquery()
     )
-    participants_result = await session.execute(participants_stmt)
-    participants = [p.model_dump() for p in participants_result.scalars().all()]
 
-    tags_stmt = (
-        select(Tag)
-        .join(ExhibitionTag, Tag.id == ExhibitionTag.tag_id)
-        .where(ExhibitionTag.exhibition_id == exhibition.id)
+
+def _block_items_json() -> ScalarSelect:
+    """Correlated subquery with the items of a block ordered by position."""
+    return (
+        select(
+            _json_array(
+                func.json_build_object(
+                    "image_key",
+                    ExhibitionBlockItem.image_key,
+                    "text",
+                    ExhibitionBlockItem.text,
+                    "position",
+                    ExhibitionBlockItem.position,
+                ),
+                ExhibitionBlockItem.position,
+            ),
+        )
+        .where(ExhibitionBlockItem.block_id == ExhibitionBlock.id)
+        .scalar_subquery()
+    )
+
+
+def _blocks_json() -> ScalarSelect:
+    """Correlated subquery with the exhibition blocks and their items ordered by position."""
+    return (
+        select(
+            _json_array(
+                func.json_build_object(
+                    "type",
+                    ExhibitionBlock.type,
+                    "content",
+                    ExhibitionBlock.content,
+                    "settings",
+                    ExhibitionBlock.settings,
+                    "position",
+                    ExhibitionBlock.position,
+                    "id",
+                    ExhibitionBlock.id,
+                    "created_at",
+                    ExhibitionBlock.created_at,
+                    "updated_at",
+                    ExhibitionBlock.updated_at,
+                    "items",
+                    _block_items_json(),
+                ),
+                ExhibitionBlock.position,
+            ),
+        )
+        .where(ExhibitionBlock.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+
+
+def _is_liked_by(user_id: UUID) -> Exists:
+    """Whether the given user liked the exhibition."""
+    return exists().where(
+        UserExhibitionLike.exhibition_id == Exhibition.id,
+        UserExhibitionLike.user_id == user_id,
     )
-    tags_result = await session.execute(tags_stmt)
-    tags = [t.model_dump() for t in tags_result.scalars().all()]
-
-    blocks_stmt = select(ExhibitionBlock).where(ExhibitionBlock.exhibition_id == exhibition.id)
-    blocks_result = await session.execute(blocks_stmt)
-    blocks = []
-    for block in blocks_result.scalars().all():
-        items_stmt = select(ExhibitionBlockItem).where(ExhibitionBlockItem.block_id == block.id)
-        items_result = await session.execute(items_stmt)
-        items = [item.model_dump() for item in items_result.scalars().all()]
-        blocks.append({**block.model_dump(), "items": items})
+
+
+def _exhibition_fields(current_user_id: UUID | None = None) -> dict[str, ColumnElement]:
+    """Columns of an `ExhibitionPublic` document in the field order of the model."""
+    return {
+        "title": Exhibition.title,
+        "description": Exhibition.description,
+        "cover_image_key": Exhibition.cover_image_key,
+        "cover_type": Exhibition.cover_type,
+        "status": Exhibition.status,
+        "rating": Exhibition.rating,
+        "settings": Exhibition.settings,
+        "id": Exhibition.id,
+        "organization_id": Exhibition.organization_id,
+        "created_at": Exhibition.created_at,
+        "updated_at": Exhibition.updated_at,
+        "participants": _participants_json(),
+        "tags": _tags_json(),
+        "is_liked_by_current_user": _is_liked_by(current_user_id) if current_user_id else null(),
+        "likes_count": Exhibition.likes_count,
+        "blocks": _blocks_json(),
+    }
+
+
+def _build_object(function, fields: dict[str, ColumnElement]) -> ColumnElement:
+    return function(*(arg for key, value in fields.items() for arg in (key, value)))
+
+
+def _exhibition_json(current_user_id: UUID | None = None) -> ColumnElement:
+    """The whole `ExhibitionPublic` document of an exhibition rendered as JSON text.
+
+    Keys follow the field order of `ExhibitionPublic`, so the output matches what the
+    response model would produce.
+    """
+    return cast(_build_object(func.json_build_object, _exhibition_fields(current_user_id)), Text)
+
+
+@log_method_call
+async def get_exhibition(
+    session: AsyncSession,
+    current_user_id: UUID | None = None,
+    **filters,
+) -> ExhibitionPublic | None:
+    """
+    Load the whole exhibition aggregate (participants, tags, blocks with ordered items,
+    likes count and the viewer's like flag) in a single statement.
+    """
+    columns = [
+        Exhibition,
+        _participants_json().label("participants"),
+        _tags_json().label("tags"),
+        _blocks_json().label("blocks"),
+    ]
+    if current_user_id:
+        columns.append(_is_liked_by(current_user_id).label("is_liked_by_current_user"))
+
+    statement = select(*columns).filter_by(**filters)
+    row = (await session.execute(statement)).mappings().one_or_none()
+    if row is None:
+        return None
 
     return ExhibitionPublic(
-        **exhibition.model_dump(),
-        participants=participants,
-        tags=tags,
-        likes_count=likes_count,
-        blocks=blocks,
+        **row["Exhibition"].model_dump(),
+        participants=row["participants"],
+        tags=row["tags"],
+        is_liked_by_current_user=row.get("is_liked_by_current_user"),
+        blocks=row["blocks"],
+    )
+
+
+@log_method_call
+async def get_exhibition_version(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    current_user_id: UUID | None = None,
+) -> Row | None:
+    """
+    Cheap probe of what the exhibition detail depends on, for conditional requests: the
+    last change time, the likes counter and the viewer's like flag.
+    """
+    columns = [Exhibition.updated_at, Exhibition.likes_count]
+    if current_user_id:
+        columns.append(_is_liked_by(current_user_id).label("is_liked_by_current_user"))
+    statement = select(*columns).where(Exhibition.id == exhibition_id)
+    return (await session.execute(statement)).one_or_none()
+
+
+exhibition_cache = SharedCache("exhibition_detail", ExhibitionPublic)
+
+
+@log_method_call
+async def get_exhibition_detail(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    current_user_id: UUID | None = None,
+) -> ExhibitionPublic | None:
+    """
+    Cached `get_exhibition` by id; concurrent misses share one load. The cache holds the
+    viewer-independent aggregate; the viewer's like flag is looked up on every call.
+    """
+    exhibition = await exhibition_cache.get_or_load(
+        exhibition_id,
+        lambda: get_exhibition(session, id=exhibition_id),
     )
+    if exhibition is None:
+        return None
+
+    is_liked = None
+    if current_user_id:
+        is_liked = exhibition_id in await get_liked_exhibition_ids(
+            session,
+            current_user_id,
+            [exhibition_id],
+        )
+    return exhibition.model_copy(update={"is_liked_by_current_user": is_liked})
+
+
+async def get_liked_exhibition_ids(
+    session: AsyncSession,
+    user_id: UUID,
+    exhibition_ids: Sequence[UUID],
+) -> set[UUID]:
+    """Which of the given exhibitions the user liked."""
+    if not exhibition_ids:
+        return set()
+    statement = select(UserExhibitionLike.exhibition_id).where(
+        UserExhibitionLike.user_id == user_id,
+        UserExhibitionLike.exhibition_id.in_(exhibition_ids),
+    )
+    return set((await session.scalars(statement)).all())
+
+
+async def invalidate_exhibition_cache(
+    exhibition_id: UUID,
+    organization_id: UUID | None = None,
+) -> None:
+    """
+    Evicts the cached detail of an exhibition, and the profile of its organization when
+    given, in every worker; call after committing a change to it.
+    """
+    await exhibition_cache.invalidate(exhibition_id)
+    if organization_id:
+        await organization_crud.invalidate_organization_profile(organization_id)
 
 
 async def _validate_organization(session: AsyncSession, organization_id: UUID) -> None:
@@ -91,6 +343,10 @@ async def create_exhibition(
     session: AsyncSession,
     exhibition_in: ExhibitionCreate,
 ) -> ExhibitionPublic:
+    """
+    Create the exhibition with its participants and tags in one transaction: readers see
+    all of it or nothing, and each part is written with a single statement.
+    """
     await _validate_exhibition_data(session, exhibition_in)
     exhibition = await _create_base_exhibition(session, exhibition_in)
     exhibition_id = exhibition.id
@@ -101,6 +357,9 @@ async def create_exhibition(
         exhibition_id,
     )
     tags = await _add_exhibition_tags(session, exhibition_in.tags, exhibition_id)
+    exhibition["updated_at"] = await refresh_exhibition_read_models(session, exhibition_id)
+    await session.commit()
+    await organization_crud.invalidate_organization_profile(exhibition_in.organization_id)
     return ExhibitionPublic(
         **exhibition,
         participants=participants,
@@ -113,11 +372,9 @@ async def _create_base_exhibition(
     session: AsyncSession,
     exhibition_in: ExhibitionCreate,
 ) -> Exhibition:
-    await create_or_exist_tags(session, exhibition_in.tags)
     exhibition = Exhibition(**exhibition_in.model_dump(exclude={"participants", "tags"}))
     session.add(exhibition)
-    await session.commit()
-    await session.refresh(exhibition)
+    await session.flush()
     return exhibition
 
 
@@ -155,18 +412,26 @@ async def update_exhibition(
     exhibition_id: UUID,
     exhibition_in: ExhibitionUpdate,
 ) -> ExhibitionPublic:
+    """
+    Update the exhibition in one transaction. Participants and tags are replaced when
+    given and otherwise read back as they are.
+    """
     exhibition = await session.get(Exhibition, exhibition_id)
     if not exhibition:
         raise ValueError(f"Exhibition {exhibition_id} not found")
 
     base_data = exhibition_in.model_dump(exclude={"participants", "tags"}, exclude_unset=True)
     exhibition.sqlmodel_update(base_data)
+    session.add(exhibition)
 
-    participants = await update_exhibition_participants(
-        session,
-        exhibition_in.participants,
-        exhibition_id,
-    )
+    if exhibition_in.participants is not None:
+        participants = await update_exhibition_participants(
+            session,
+            exhibition_in.participants,
+            exhibition_id,
+        )
+    else:
+        participants = await get_exhibition_participants(session, exhibition_id)
 
     if exhibition_in.tags is not None:
         await delete_exhibition_tags(session, exhibition_in.tags, exhibition_id)
@@ -175,22 +440,27 @@ async def update_exhibition(
             tags=exhibition_in.tags,
             exhibition_id=exhibition_id,
         )
+    else:
+        tags = await get_exhibition_tags(session, exhibition_id)
 
-    session.add(exhibition)
+    updated_at = await refresh_exhibition_read_models(session, exhibition_id)
+    exhibition_data = exhibition.model_dump() | {"updated_at": updated_at}
     await session.commit()
-    await session.refresh(exhibition)
+    await invalidate_exhibition_cache(exhibition_id, exhibition_data["organization_id"])
 
     return ExhibitionPublic(
-        **exhibition.model_dump(),
-        participants=participants,
-        tags=tags,
+        **exhibition_data,
+        participants=[p.model_dump() for p in participants],
+        tags=[t.model_dump() for t in tags],
     )
 
 
 @log_method_call
 async def delete_exhibition(session: AsyncSession, exhibition: Exhibition) -> Exhibition:
+    exhibition_id, organization_id = exhibition.id, exhibition.organization_id
     await session.delete(exhibition)
     await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
     return exhibition
 
 
@@ -203,9 +473,14 @@ async def get_exhibitions(
     limit: int = settings.DEFAULT_QUERY_LIMIT,
     current_user_id: UUID | None = None,
     search: str | None = None,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.exact,
 ) -> ExhibitionsPublic:
     """
     Retrieve a paginated list of exhibitions with filtering, sorting, and related data.
+
+    `search` (or `filters.q`) runs a full-text search; results are then ordered by
+    relevance unless another sorting is requested. When `cursor` is given the page is selected with keyset pagination and `skip` is ignored.
     """
     query_builder = ExhibitionQueryBuilder(
         session,
@@ -215,10 +490,78 @@ async def get_exhibitions(
         limit,
         current_user_id,
         search,
+        cursor,
+        count_mode,
     )
     return await query_builder.execute()
 
 
+@log_method_call
+async def get_exhibitions_json(
+    session: AsyncSession,
+    sort: SortParams = SortParams(),  # noqa: B008
+    filters: FilterParams = FilterParams(),  # noqa: B008
+    skip: int = 0,
+    limit: int = settings.DEFAULT_QUERY_LIMIT,
+    current_user_id: UUID | None = None,
+    search: str | None = None,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.exact,
+) -> bytes:
+    """
+    Same as `get_exhibitions`, but returns the serialized `ExhibitionsPublic` document.
+
+    The JSON is built by Postgres, which avoids constructing and validating models for
+    every row of large pages.
+    """
+    query_builder = ExhibitionQueryBuilder(
+        session,
+        filters,
+        sort,
+        skip,
+        limit,
+        current_user_id,
+        search,
+        cursor,
+        count_mode,
+    )
+    return await query_builder.execute_json()
+
+
+@log_method_call
+async def get_published_exhibitions_json(
+    session: AsyncSession,
+    sort: SortParams = SortParams(),  # noqa: B008
+    filters: FilterParams = FilterParams(),  # noqa: B008
+    skip: int = 0,
+    limit: int = settings.DEFAULT_QUERY_LIMIT,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.exact,
+) -> bytes:
+    """
+    Serialized `ExhibitionsPublic` page of published exhibitions for anonymous viewers,
+    read from the catalogue cards only.
+
+    Concurrent requests for the same first page share one query.
+    """
+    query_builder = CatalogueQueryBuilder(
+        session,
+        filters,
+        sort,
+        skip,
+        limit,
+        cursor=cursor,
+        count_mode=count_mode,
+    )
+    if skip or cursor:
+        return await query_builder.execute_json()
+    key = (sort.model_dump_json(), filters.model_dump_json(), limit, count_mode)
+    return await published_first_page_flights.do(key, query_builder.execute_json)
+
+
+published_first_page_flights = SingleFlight()
+
+
 @log_method_call
 async def get_user_exhibition_likes(
     session: AsyncSession,
@@ -239,8 +582,175 @@ async def get_user_exhibition_likes(
     )
 
 
+@log_method_call
+async def shift_likes_count(session: AsyncSession, exhibition_id: UUID, delta: int) -> Row | None:
+    """
+    Atomically shifts the denormalized likes counter of an exhibition, never below zero.
+
+    Returns the new `likes_count` and the `organization_id` of the exhibition, or None
+    when it doesn't exist.
+    """
+    result = await session.execute(
+        update(Exhibition)
+        .where(Exhibition.id == exhibition_id)
+        .values(
+            likes_count=func.greatest(Exhibition.likes_count + delta, 0),
+            updated_at=Exhibition.updated_at,
+        )
+        .returning(Exhibition.likes_count, Exhibition.organization_id)
+        .execution_options(synchronize_session=False),
+    )
+    state = result.one_or_none()
+    await session.execute(
+        update(ExhibitionCatalogueCard)
+        .where(ExhibitionCatalogueCard.exhibition_id == exhibition_id)
+        .values(likes_count=func.greatest(ExhibitionCatalogueCard.likes_count + delta, 0))
+        .execution_options(synchronize_session=False),
+    )
+    return state
+
+
+@log_method_call
+async def recount_likes(session: AsyncSession, exhibition_id: UUID | None = None) -> int:
+    """
+    Recalculate the denormalized likes_count from user_exhibition_likes.
+
+    Returns the number of exhibitions whose counter was out of sync.
+    """
+    actual_count = (
+        select(func.count(UserExhibitionLike.user_id))
+        .where(UserExhibitionLike.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    statement = (
+        update(Exhibition)
+        .where(Exhibition.likes_count != actual_count)
+        .values(likes_count=actual_count, updated_at=Exhibition.updated_at)
+        .execution_options(synchronize_session=False)
+    )
+    if exhibition_id:
+        statement = statement.where(Exhibition.id == exhibition_id)
+    result = await session.execute(statement)
+    await session.execute(
+        update(ExhibitionCatalogueCard)
+        .where(
+            ExhibitionCatalogueCard.exhibition_id == Exhibition.id,
+            ExhibitionCatalogueCard.likes_count != Exhibition.likes_count,
+        )
+        .values(likes_count=Exhibition.likes_count)
+        .execution_options(synchronize_session=False),
+    )
+    await session.commit()
+    await exhibition_cache.clear()
+    await organization_crud.organization_profile_cache.clear()
+    return result.rowcount
+
+
+@log_method_call
+async def refresh_catalogue_card(session: AsyncSession, exhibition_id: UUID) -> None:
+    """
+    Rebuilds the catalogue card of an exhibition inside the caller's transaction: the card
+    is (re)created while the exhibition is published and removed otherwise. Expects the
+    search document to be up to date.
+    """
+    await session.execute(
+        delete(ExhibitionCatalogueCard).where(
+            ExhibitionCatalogueCard.exhibition_id == exhibition_id,
+        ),
+    )
+    fields = _exhibition_fields()
+    fields.pop("likes_count")
+    tag_ids = (
+        select(func.coalesce(func.array_agg(ExhibitionTag.tag_id), literal_column("'{}'")))
+        .where(ExhibitionTag.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    tag_names = (
+        select(func.coalesce(func.array_agg(Tag.name), literal_column("'{}'")))
+        .join(ExhibitionTag, ExhibitionTag.tag_id == Tag.id)
+        .where(ExhibitionTag.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    card = (
+        select(
+            Exhibition.id,
+            Exhibition.organization_id,
+            Exhibition.title,
+            Exhibition.rating,
+            Exhibition.likes_count,
+            Exhibition.created_at,
+            tag_ids,
+            tag_names,
+            ExhibitionSearchDocument.document,
+            _build_object(func.jsonb_build_object, fields),
+        )
+        .join(ExhibitionSearchDocument, ExhibitionSearchDocument.exhibition_id == Exhibition.id)
+        .where(
+            Exhibition.id == exhibition_id,
+            Exhibition.status == ExhibitionStatusEnum.published,
+        )
+    )
+    await session.execute(
+        insert(ExhibitionCatalogueCard).from_select(
+            [
+                "exhibition_id",
+                "organization_id",
+                "title",
+                "rating",
+                "likes_count",
+                "created_at",
+                "tag_ids",
+                "tag_names",
+                "document",
+                "card",
+            ],
+            card,
+        ),
+    )
+
+
+@log_method_call
+async def refresh_exhibition_read_models(
+    session: AsyncSession,
+    exhibition_id: UUID,
+) -> datetime | None:
+    """
+    Marks the exhibition as changed and rebuilds its search document and catalogue card;
+    call after any change to the exhibition or to its blocks, items, tags or participants.
+    Returns the new `updated_at`.
+    """
+    await session.flush()
+    updated_at = await session.scalar(
+        update(Exhibition)
+        .where(Exhibition.id == exhibition_id)
+        .values(updated_at=datetime.now())
+        .returning(Exhibition.updated_at)
+        .execution_options(synchronize_session=False),
+    )
+    await refresh_search_document(session, exhibition_id)
+    await refresh_catalogue_card(session, exhibition_id)
+    return updated_at
+
+
 class ExhibitionQueryBuilder:
-    """Handles query construction and execution for exhibitions with filtering, sorting, and pagination."""
+    """Handles query construction and execution for exhibitions with filtering, sorting, and pagination.
+
+    The list query runs in two phases: the page of exhibition ids is selected first with
+    filters, sorting and offset/limit applied, and tags, participants, blocks and likes are
+    aggregated only for the exhibitions of that page.
+
+    Besides offset pagination the builder supports keyset pagination: the cursor holds the
+    sort key and id of the last row of the previous page, and the next page starts right
+    after it, so deep pages cost the same as the first one.
+
+    Search matches the precomputed full-text documents (see `crud.exhibition_search`);
+    the `relevance` sort orders by their rank.
+
+    The page and the count are independent reads and run concurrently on separate
+    connections.
+    """
+
+    model = Exhibition
 
     def __init__(
         self,
@@ -251,263 +761,405 @@ class ExhibitionQueryBuilder:
         limit: int,
         current_user_id=None,
         search: str | None = None,
+        cursor: str | None = None,
+        count_mode: CountMode = CountMode.exact,
     ):
         self.session = session
         self.filters = filters
         self.sort = sort
         self.skip = skip
         self.limit = limit
+        self.page_statement = None
+        self.sort_column = None
+        self.sort_key = None
         self.statement = None
-        self.count_statement = select(func.count(Exhibition.id))
-        self._needs_likes = True
         self.current_user_id = current_user_id
-        self.search = search
+        self.search = search or filters.q
+        self.cursor = cursor
+        self.count_mode = count_mode
+        self.next_cursor = None
 
     async def execute(self) -> ExhibitionsPublic:
         """Builds and executes the query, returning paginated results."""
         self._build_query()
-        result = await self._fetch_results()
-        count = await self._fetch_count()
-        return ExhibitionsPublic(data=result, count=count)
+        if self.count_mode == CountMode.none:
+            result, count = await self._fetch_results(self.session), None
+        else:
+            result, count = await gather_reads(
+                self.session,
+                self._fetch_results,
+                self._fetch_count,
+            )
+        if self._is_last_offset_page(len(result)):
+            count = self.skip + len(result)
+        return ExhibitionsPublic(data=result, count=count, next_cursor=self.next_cursor)
 
-    def _build_query(self) -> None:
-        """Constructs the main query with subqueries, filters, and sorting."""
-        tags_subquery = self._build_tags_subquery()
-        participants_subquery = self._build_participants_subquery()
-        blocks_subquery = self._build_blocks_subquery()
+    async def execute_json(self) -> bytes:
+        """Builds and executes the query, returning the `ExhibitionsPublic` JSON document.
+
+        Every row is rendered to JSON by Postgres and the rows are only joined here, so no
+        models are built for the page.
+        """
+        self._build_json_query()
+        if self.count_mode == CountMode.none:
+            documents, count = await self._fetch_json(self.session), None
+        else:
+            documents, count = await gather_reads(
+                self.session,
+                self._fetch_json,
+                self._fetch_count,
+            )
+        if self._is_last_offset_page(len(documents)):
+            count = self.skip + len(documents)
+        return b"".join(
+            [
+                b'{"data":[',
+                ",".join(documents).encode(),
+                b'],"count":',
+                json.dumps(count).encode(),
+                b',"next_cursor":',
+                json.dumps(self.next_cursor).encode(),
+                b"}",
+            ],
+        )
 
-        likes_subquery = self._build_likes_subquery()
+    def _build_json_query(self) -> None:
+        """Constructs the page subquery and renders the documents of its exhibitions."""
+        self._build_page_query()
+        page = self.page_statement.subquery("page")
+        self.statement = (
+            select(self._document().label("document"), page.c.sort_key, page.c.id)
+            .join(page, self._id_column == page.c.id)
+            .order_by(*self._order_by(page.c.sort_key, page.c.id))
+        )
+
+    def _document(self) -> ColumnElement:
+        """The JSON text of an `ExhibitionPublic` document."""
+        return _exhibition_json(self.current_user_id)
+
+    def _build_query(self) -> None:
+        """Constructs the page subquery and the aggregation query on top of it."""
+        self._build_page_query()
+        page = self.page_statement.subquery("page")
 
         select_columns = [
             Exhibition,
-            tags_subquery.c.tags,
-            participants_subquery.c.participants,
-            blocks_subquery.c.blocks,
+            page.c.sort_key,
+            page.c.id,
+            _tags_json().label("tags"),
+            _participants_json().label("participants"),
+            _blocks_json().label("blocks"),
         ]
-
-        if likes_subquery is not None:
+        if self.current_user_id:
             select_columns.append(
-                func.coalesce(likes_subquery.c.likes_count, 0).label("likes_count"),
+                _is_liked_by(self.current_user_id).label("is_liked_by_current_user"),
             )
 
-        self.statement = select(*select_columns)
-
-        self.statement = self.statement.outerjoin(
-            tags_subquery,
-            Exhibition.id == tags_subquery.c.exhibition_id,
-        ).outerjoin(participants_subquery, Exhibition.id == participants_subquery.c.exhibition_id)
-
-        self.statement = self.statement.outerjoin(
-            blocks_subquery,
-            Exhibition.id == blocks_subquery.c.exhibition_id,
+        self.statement = (
+            select(*select_columns)
+            .join(page, Exhibition.id == page.c.id)
+            .order_by(*self._order_by(page.c.sort_key, page.c.id))
         )
 
-        if likes_subquery is not None:
-            self.statement = self.statement.outerjoin(
-                likes_subquery,
-                Exhibition.id == likes_subquery.c.exhibition_id,
-            )
-
-        self._apply_filters()
-        self._apply_search()
+    def _build_page_query(self) -> None:
+        """Constructs the first phase: ids of the requested page with filters and sorting."""
+        self.sort_column = self._sort_column()
+        self.sort_key = self.sort_column.label("sort_key")
+        self.page_statement = self._apply_where(
+            select(self._id_column.label("id"), self.sort_key),
+        )
         self._apply_sorting()
         self._apply_pagination()
-        if (
-            self.sort.sortBy == "likes_count"
-            or hasattr(self.filters, "likes_min")
-            or hasattr(self.filters, "likes_max")
-        ):
-            return (
-                select(
-                    UserExhibitionLike.exhibition_id,
-                    func.count(UserExhibitionLike.user_id).label("likes_count"),
+
+    def _sort_column(self):
+        """Returns the column the exhibitions are sorted by."""
+        if self._sort_by == "relevance":
+            if not self.search:
+                raise HTTPException(
+                    status_code=400,
+                    detail="Sorting by relevance requires a search query",
                 )
-                .group_by(UserExhibitionLike.exhibition_id)
-                .subquery()
+            return self._search_rank()
+        sort_column = getattr(self.model, self._sort_by, None)
+        if sort_column is None:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid sort field: {self._sort_by}",
             )
-        return None
+        return sort_column
 
-    def _build_tags_subquery(self) -> Select:
-        """Builds a subquery to fetch tags for each exhibition as a JSON array."""
-        return (
-            select(
-                ExhibitionTag.exhibition_id,
-                func.coalesce(
-                    func.array_agg(
-                        func.json_build_object(
-                            "id",
-                            Tag.id,
-                            "name",
-                            Tag.name,
-                            "created_at",
-                            Tag.created_at,
-                        ),
-                    ),
-                    list([]),
-                ).label("tags"),
-            )
-            .join(Tag, ExhibitionTag.tag_id == Tag.id)
-            .group_by(ExhibitionTag.exhibition_id)
-            .subquery()
-        )
+    def _order_by(self, sort_column, id_column) -> list:
+        """Returns ORDER BY clauses with the id as a tie-breaker.
 
-    def _build_blocks_subquery(self):
-        """Builds subquery for exhibition blocks and their items using raw SQL."""
-        raw_sql = """
-            SELECT
-                exhibition_blocks.exhibition_id,
-                ARRAY_AGG(
-                    JSON_BUILD_OBJECT(
-                        'id', exhibition_blocks.id,
-                        'type', exhibition_blocks.type,
-                        'content', exhibition_blocks.content,
-                        'settings', exhibition_blocks.settings,
-                        'position', exhibition_blocks.position,
-                        'created_at', exhibition_blocks.created_at,
-                        'updated_at', exhibition_blocks.updated_at,
-                        'items', COALESCE(items_subquery.items, ARRAY[]::json[])
-                    )
-                ) AS blocks
-            FROM exhibition_blocks
-            LEFT OUTER JOIN (
-                SELECT
-                    exhibition_block_items.block_id,
-                    ARRAY_AGG(
-                        JSON_BUILD_OBJECT(
-                            'id', exhibition_block_items.id,
-                            'text', exhibition_block_items.text,
-                            'image_key', exhibition_block_items.image_key,
-                            'position', exhibition_block_items.position,
-                            'created_at', exhibition_block_items.created_at,
-                            'updated_at', exhibition_block_items.updated_at
-                        ) ORDER BY exhibition_block_items.position
-                    ) AS items
-                FROM exhibition_block_items
-                GROUP BY exhibition_block_items.block_id
-            ) AS items_subquery
-            ON exhibition_blocks.id = items_subquery.block_id
-            GROUP BY exhibition_blocks.exhibition_id
+        Sort columns are NOT NULL, so no NULLS LAST here: it would stop Postgres from
+        scanning the (sort column, id) indexes backwards for descending order.
         """
-        # Явно указываем столбцы подзапроса
-        return text(raw_sql).columns(exhibition_id=Integer, blocks=JSON).subquery()
-
-    def _build_participants_subquery(self) -> Select:
-        """Builds subquery for exhibition participants."""
-        return (
-            select(
-                ExhibitionParticipant.exhibition_id,
-                func.array_agg(
-                    func.json_build_object(
-                        "id",
-                        ExhibitionParticipant.id,
-                        "name",
-                        ExhibitionParticipant.name,
-                        "created_at",
-                        ExhibitionParticipant.created_at,
-                    ),
-                ).label("participants"),
-            )
-            .group_by(ExhibitionParticipant.exhibition_id)
-            .subquery()
-        )
+        if self._sort_order == "desc":
+            return [sort_column.desc(), id_column.desc()]
+        return [sort_column.asc(), id_column.asc()]
+
+    def _apply_pagination(self) -> None:
+        """Applies offset or keyset pagination to the page query.
 
-    def _build_likes_subquery(self):
-        """Builds a subquery to count likes for each exhibition."""
-        return (
-            select(
-                UserExhibitionLike.exhibition_id,
-                func.count(UserExhibitionLike.user_id).label("likes_count"),
+        One extra row is requested to find out whether there is a next page.
+        """
+        if self.cursor:
+            self._apply_cursor()
+        else:
+            self.page_statement = self.page_statement.offset(self.skip)
+        self.page_statement = self.page_statement.limit(self.limit + 1)
+
+    def _apply_cursor(self) -> None:
+        """Continues the page query right after the position stored in the cursor."""
+        payload = decode_cursor(self.cursor)
+        if payload.get("sortBy") != self._sort_by or payload.get("sortOrder") != self._sort_order:
+            raise HTTPException(
+                status_code=400,
+                detail="Cursor does not match the requested sorting",
             )
-            .group_by(UserExhibitionLike.exhibition_id)
-            .subquery()
+        try:
+            key = self._parse_sort_key(payload["key"])
+            last_id = UUID(payload["id"])
+        except (KeyError, TypeError, ValueError) as err:
+            raise HTTPException(status_code=400, detail="Invalid cursor") from err
+
+        position = tuple_(self.sort_column, self._id_column)
+        last_position = tuple_(literal(key), literal(last_id))
+        self.page_statement = self.page_statement.where(
+            position < last_position if self._sort_order == "desc" else position > last_position,
         )
 
-    def _apply_pagination(self) -> None:
-        """Applies pagination to the query."""
+    @property
+    def _id_column(self):
+        return self.model.id
+
+    @property
+    def _sort_by(self) -> str:
+        if self.sort.sortBy:
+            return self.sort.sortBy
+        return "relevance" if self.search else "created_at"
+
+    @property
+    def _sort_order(self) -> str:
+        if self.sort.sortOrder:
+            return self.sort.sortOrder
+        return "desc" if self._sort_by == "relevance" else "asc"
+
+    def _parse_sort_key(self, value):
+        """Restores the python type of a sort key read from a cursor."""
+        if self._sort_by == "created_at":
+            return datetime.fromisoformat(value)
+        if self._sort_by in {"rating", "relevance"}:
+            return float(value)
+        if self._sort_by == "likes_count":
+            return int(value)
+        return str(value)
+
+    def _encode_cursor(self, row) -> str:
+        return encode_cursor(
+            {
+                "sortBy": self._sort_by,
+                "sortOrder": self._sort_order,
+                "key": row["sort_key"],
+                "id": row["id"],
+            },
+        )
 
-        self.statement = self.statement.offset(self.skip).limit(self.limit)
+    def _apply_sorting(self) -> None:
+        """Applies sorting to the page query."""
+        self.page_statement = self.page_statement.order_by(
+            *self._order_by(self.sort_key, self._id_column),
+        )
 
-    def _apply_search(self) -> None:
-        """Applies search filtering to the query."""
+    def _apply_where(self, statement):
+        """Applies the filters and the search shared by the page and count queries."""
+        statement = statement.where(*self._filter_predicates())
         if self.search:
-            self.statement = self.statement.where(
-                Exhibition.title.startswith(self.search),
-            )
+            statement = self._apply_search(statement)
+        return statement
 
-    def _apply_sorting(self) -> None:
-        """Applies sorting to the query."""
-        if not self.sort.sortBy or not self.sort.sortOrder:
-            return
+    def _apply_search(self, statement):
+        """Joins the search documents and keeps the exhibitions matching the search."""
+        return statement.outerjoin_from(
+            Exhibition,
+            ExhibitionSearchDocument,
+            ExhibitionSearchDocument.exhibition_id == Exhibition.id,
+        ).where(search_predicate(self.search))
 
-        if self.sort.sortBy == "likes_count":
-            if not self._needs_likes:
-                raise ValueError("Likes subquery required for sorting by likes_count")
+    def _search_rank(self) -> ColumnElement:
+        return search_rank(self.search)
 
-            order_column = literal_column("likes_count")
-        else:
-            order_column = getattr(Exhibition, self.sort.sortBy, None)
-            if not order_column:
-                raise HTTPException(
-                    status_code=400,
-                    detail=f"Invalid sort field: {self.sort.sortBy}",
-                )
+    def _filter_predicates(self) -> list:
+        """Returns the predicates of the requested filters."""
+        predicates = []
+        if self.filters.organization_id:
+            predicates.append(self.model.organization_id == self.filters.organization_id)
+        if self.filters.tag_ids:
+            predicates.append(self._tag_ids_predicate(list(dict.fromkeys(self.filters.tag_ids))))
+        # Tag names are stored normalized, so the requested ones are matched the same way
+        tag_names = normalize_tag_names(self.filters.tag_names or [])
+        if tag_names:
+            predicates.append(self._tag_names_predicate(tag_names))
+        return predicates
+
+    def _tag_ids_predicate(self, tag_ids: list[UUID]) -> ColumnElement:
+        return self._tags_predicate(tag_ids, self._tag_id_in)
+
+    def _tag_names_predicate(self, names: list[str]) -> ColumnElement:
+        return self._tags_predicate(names, self._tag_name_in)
+
+    def _tags_predicate(self, values: list, tag_condition) -> ColumnElement:
+        """Semi-joins exhibition_tags to keep exhibitions having any or all of the tags.
+
+        "All" is expressed as one EXISTS per tag, so every check is a single lookup in
+        the (exhibition_id, tag_id) primary key.
+        """
+        if self.filters.tag_match == TagMatch.all:
+            return and_(*(self._has_tag(tag_condition([value])) for value in values))
+        return self._has_tag(tag_condition(values))
 
-        self.statement = self.statement.order_by(
-            order_column.asc().nullslast()
-            if self.sort.sortOrder == "asc"
-            else order_column.desc().nullslast(),
-        )
+    @staticmethod
+    def _has_tag(condition) -> Exists:
+        return exists().where(ExhibitionTag.exhibition_id == Exhibition.id, condition)
 
-    def _apply_filters(self) -> None:
-        """Applies filters to both main and count queries."""
-        if self.filters.organization_id:
-            self.statement = self.statement.where(
-                Exhibition.organization_id == self.filters.organization_id,
-            )
+    @staticmethod
+    def _tag_id_in(tag_ids: list[UUID]) -> ColumnElement:
+        return ExhibitionTag.tag_id.in_(tag_ids)
 
-    async def _fetch_results(self) -> list[ExhibitionPublic]:
-        result = await self.session.execute(self.statement)
+    @staticmethod
+    def _tag_name_in(names: list[str]) -> ColumnElement:
+        return ExhibitionTag.tag_id.in_(select(Tag.id).where(Tag.name.in_(names)))
+
+    async def _fetch_rows(self, session: AsyncSession) -> list:
+        """Fetches the page rows, trimming the extra row that signals a next page."""
+        result = await session.execute(self.statement)
         rows = list(result.mappings())
-        exhibition_ids = [row["Exhibition"].id for row in rows]
-        liked_ids = set()
-
-        # Проверяем лайки текущего пользователя, если он авторизован
-        if self.current_user_id and exhibition_ids:
-            like_rows = await self.session.execute(
-                select(UserExhibitionLike.exhibition_id).where(
-                    UserExhibitionLike.exhibition_id.in_(exhibition_ids),
-                    UserExhibitionLike.user_id == self.current_user_id,
-                ),
-            )
-            liked_ids = set(str(lid) for lid in like_rows.scalars().all())
+        if len(rows) > self.limit:
+            rows = rows[: self.limit]
+            self.next_cursor = self._encode_cursor(rows[-1])
+        return rows
+
+    async def _fetch_json(self, session: AsyncSession) -> list[str]:
+        return [row["document"] for row in await self._fetch_rows(session)]
+
+    async def _fetch_results(self, session: AsyncSession) -> list[ExhibitionPublic]:
+        rows = await self._fetch_rows(session)
 
         exhibitions = []
         for row in rows:
-            exhibition_id = str(row["Exhibition"].id)
-            blocks_data = row.get("blocks", [])  # Переносим получение blocks_data внутрь цикла
             data = {
                 **row["Exhibition"].model_dump(),
-                "tags": [TagPublic(**tag) for tag in (row["tags"] or [])],
-                "participants": [ExhibitionParticipant(**p) for p in (row["participants"] or [])],
-                "likes_count": row.get("likes_count", 0),
-                "is_liked_by_current_user": exhibition_id in liked_ids
-                if self.current_user_id
-                else None,
-                "blocks": [ExhibitionBlockPublic(**block) for block in blocks_data]
-                if blocks_data
-                else [],
+                "tags": [TagPublic(**tag) for tag in row["tags"]],
+                "participants": [ExhibitionParticipant(**p) for p in row["participants"]],
+                "is_liked_by_current_user": row.get("is_liked_by_current_user"),
+                "blocks": [ExhibitionBlockPublic(**block) for block in row["blocks"]],
             }
             exhibitions.append(ExhibitionPublic(**data))
 
         return exhibitions
 
-    async def _fetch_count(self) -> int:
-        """Fetches the total count of exhibitions with applied filters."""
-        count_stmt = self.count_statement
-        if self.filters.organization_id:
-            count_stmt = count_stmt.where(
-                Exhibition.organization_id == self.filters.organization_id,
-            )
+    def _is_last_offset_page(self, page_size: int) -> bool:
+        """
+        Whether the page ends an offset listing, so the total is known without counting.
+        Never true with the `none` count mode, which always answers a null count.
+        """
+        if self.count_mode == CountMode.none:
+            return False
+        return not self.cursor and not self.next_cursor and bool(page_size or not self.skip)
+
+    async def _fetch_count(self, session: AsyncSession) -> int:
+        """Fetches the total of exhibitions matching the list query, exact or estimated."""
+        statement = self._apply_where(select(self._id_column))
+        if self.count_mode == CountMode.estimate:
+            return await estimate_rows(session, statement)
+        count_statement = select(func.count()).select_from(statement.subquery())
+        return (await session.execute(count_statement)).scalar_one()
+
+
+class CatalogueQueryBuilder(ExhibitionQueryBuilder):
+    """Lists published exhibitions from the `ExhibitionCatalogueCard` read model.
+
+    Supports the same filters, search, sorting and pagination as `ExhibitionQueryBuilder`,
+    but every step reads the cards table only: tags are matched against the tag arrays,
+    search against the copied document, and the rows are the prebuilt cards. The viewer's
+    like flag is not part of a card, so it serves anonymous requests.
+    """
+
+    model = ExhibitionCatalogueCard
+
+    @property
+    def _id_column(self):
+        return ExhibitionCatalogueCard.exhibition_id
+
+    def _document(self) -> ColumnElement:
+        card = ExhibitionCatalogueCard.card.op("||")(
+            func.jsonb_build_object("likes_count", ExhibitionCatalogueCard.likes_count),
+        )
+        return cast(card, Text)
+
+    def _build_query(self) -> None:
+        self._build_json_query()
+
+    async def _fetch_results(self, session: AsyncSession) -> list[ExhibitionPublic]:
+        return [
+            ExhibitionPublic.model_validate_json(document)
+            for document in await self._fetch_json(session)
+        ]
+
+    def _apply_search(self, statement):
+        return statement.where(
+            search_predicate(
+                self.search,
+                ExhibitionCatalogueCard.document,
+                ExhibitionCatalogueCard.title,
+            ),
+        )
+
+    def _search_rank(self) -> ColumnElement:
+        return search_rank(
+            self.search,
+            ExhibitionCatalogueCard.document,
+            ExhibitionCatalogueCard.title,
+        )
+
+    def _tag_ids_predicate(self, tag_ids: list[UUID]) -> ColumnElement:
+        return self._tag_array_predicate(ExhibitionCatalogueCard.tag_ids, tag_ids)
+
+    def _tag_names_predicate(self, names: list[str]) -> ColumnElement:
+        return self._tag_array_predicate(ExhibitionCatalogueCard.tag_names, names)
+
+    def _tag_array_predicate(self, column, values: list) -> ColumnElement:
+        """Matches the tag array with the GIN-indexed `@>` (all) or `&&` (any) operators."""
+        if self.filters.tag_match == TagMatch.all:
+            return column.contains(values)
+        return column.overlap(values)
+
+
+class LikedExhibitionQueryBuilder(ExhibitionQueryBuilder):
+    """Lists the exhibitions liked by `current_user_id`, most recently liked first.
+
+    The like rows are joined into the page and count queries; the position of an
+    exhibition is the time it was liked, which also drives keyset pagination.
+    """
+
+    def _apply_where(self, statement):
+        statement = statement.join_from(
+            Exhibition,
+            UserExhibitionLike,
+            UserExhibitionLike.exhibition_id == Exhibition.id,
+        ).where(UserExhibitionLike.user_id == self.current_user_id)
+        return super()._apply_where(statement)
+
+    def _sort_column(self):
+        return UserExhibitionLike.created_at
+
+    @property
+    def _sort_by(self) -> str:
+        return "liked_at"
+
+    @property
+    def _sort_order(self) -> str:
+        return "desc"
 
-        result = await self.session.execute(count_stmt)
-        return result.scalar_one() if result else 0
+    def _parse_sort_key(self, value):
+        return datetime.fromisoformat(value)
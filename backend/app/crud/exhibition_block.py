@@ -1,29 +1,99 @@
 # crud/exhibition_block.py
 
-from uuid import UUID
+import asyncio
+from collections import defaultdict, deque
+from datetime import datetime
+from uuid import UUID, uuid4
 
+from backend.app.crud.exhibition import (
+    invalidate_exhibition_cache,
+    refresh_exhibition_read_models,
+)
 from backend.app.db.models.exhibition import Exhibition, ExhibitionStatusEnum
 from backend.app.db.models.exhibition_block import (
     ExhibitionBlock,
     ExhibitionBlockCreate,
+    ExhibitionBlockImport,
     ExhibitionBlockItemCreate,
     ExhibitionBlockUpdate,
     ExhibitionBlockUpdateBase,
 )
 from backend.app.db.models.exhibition_block_item import ExhibitionBlockItem
 from backend.app.utils.logger import log_method_call
+from backend.app.utils.positions import POSITION_GAP, position_between, spaced_positions
 from backend.app.utils.sanitizer import sanitize_html
-from sqlalchemy import delete, select
+from fastapi import HTTPException
+from sqlalchemy import Integer, Uuid, column, delete, func, insert, select, update, values
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
 @log_method_call
-async def validate_exhibition(session: AsyncSession, exhibition_id: UUID) -> None:
+async def validate_exhibition(session: AsyncSession, exhibition_id: UUID) -> Exhibition:
     exhibition = await session.get(Exhibition, exhibition_id)
     if not exhibition:
         raise ValueError(f"Exhibition {exhibition_id} not found")
     if exhibition.status not in [ExhibitionStatusEnum.draft, ExhibitionStatusEnum.published]:
         raise ValueError("Exhibition must be in draft or published status")
+    return exhibition
+
+
+async def _get_organization_id(session: AsyncSession, exhibition_id: UUID) -> UUID | None:
+    return await session.scalar(
+        select(Exhibition.organization_id).where(Exhibition.id == exhibition_id),
+    )
+
+
+@log_method_call
+async def rebalance_block_positions(session: AsyncSession, exhibition_id: UUID) -> None:
+    """Space out the positions of all blocks of the exhibition again, in one statement."""
+    ranked = (
+        select(
+            ExhibitionBlock.id,
+            (
+                func.row_number().over(
+                    order_by=(ExhibitionBlock.position, ExhibitionBlock.created_at),
+                )
+                - 1
+            ).label("rank"),
+        )
+        .where(ExhibitionBlock.exhibition_id == exhibition_id)
+        .subquery()
+    )
+    await session.execute(
+        update(ExhibitionBlock)
+        .where(ExhibitionBlock.id == ranked.c.id)
+        .values(position=ranked.c.rank * POSITION_GAP)
+        .execution_options(synchronize_session=False),
+    )
+
+
+async def _neighbour_positions(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    index: int,
+    exclude_block_id: UUID | None,
+) -> tuple[int | None, int | None]:
+    """Positions of the blocks that would surround a block placed at `index`."""
+    statement = select(ExhibitionBlock.position).where(
+        ExhibitionBlock.exhibition_id == exhibition_id,
+    )
+    if exclude_block_id is not None:
+        statement = statement.where(ExhibitionBlock.id != exclude_block_id)
+
+    neighbours = (
+        await session.scalars(
+            statement.order_by(ExhibitionBlock.position).offset(max(index - 1, 0)).limit(2),
+        )
+    ).all()
+    if index == 0:
+        return None, neighbours[0] if neighbours else None
+    if not neighbours:
+        # Past the end of the list: append
+        last = await session.scalar(
+            statement.with_only_columns(func.max(ExhibitionBlock.position)),
+        )
+        return last, None
+    return neighbours[0], neighbours[1] if len(neighbours) > 1 else None
 
 
 @log_method_call
@@ -31,20 +101,30 @@ async def adjust_block_positions(
     session: AsyncSession,
     exhibition_id: UUID,
     requested_position: int,
+    exclude_block_id: UUID | None = None,
 ) -> int:
-    stmt = select(ExhibitionBlock).where(ExhibitionBlock.exhibition_id == exhibition_id)
-    result = await session.execute(stmt)
-    blocks = result.scalars().all()
-
-    if requested_position < len(blocks):
-        for block in blocks:
-            if block.position >= requested_position:
-                block.position += 1
-                session.add(block)
-    else:
-        requested_position = len(blocks)
-
-    return requested_position
+    """
+    Position key that places a block at the given index of the exhibition's block list.
+    Only the placed block has to be written, unless its neighbours have no room left
+    between them and the list gets spaced out first.
+    """
+    before, after = await _neighbour_positions(
+        session,
+        exhibition_id,
+        requested_position,
+        exclude_block_id,
+    )
+    position = position_between(before, after)
+    if position is None:
+        await rebalance_block_positions(session, exhibition_id)
+        before, after = await _neighbour_positions(
+            session,
+            exhibition_id,
+            requested_position,
+            exclude_block_id,
+        )
+        position = position_between(before, after)
+    return position
 
 
 @log_method_call
@@ -59,11 +139,7 @@ def sanitize_block_items(
     if not items:
         return None
     return [
-        ExhibitionBlockItemCreate(
-            image_key=item.image_key,
-            text=sanitize_html(item.text) if item.text else None,
-            position=item.position,
-        )
+        item.model_copy(update={"text": sanitize_html(item.text) if item.text else None})
         for item in items
     ]
 
@@ -93,14 +169,84 @@ async def persist_block_items(
     if not items:
         return
     sanitized_items = sanitize_block_items(items)
-    for i, item in enumerate(sanitized_items):
-        db_item = ExhibitionBlockItem(
-            block_id=block_id,
-            image_key=item.image_key,
-            text=item.text,
-            position=i,
+    await session.execute(
+        insert(ExhibitionBlockItem),
+        [_new_item_row(block_id, item, position) for position, item in enumerate(sanitized_items)],
+    )
+
+
+def _new_item_row(block_id: UUID, item: ExhibitionBlockItemCreate, position: int) -> dict:
+    now = datetime.now()
+    return {
+        "id": uuid4(),
+        "block_id": block_id,
+        "image_key": item.image_key,
+        "text": item.text,
+        "position": position,
+        "created_at": now,
+        "updated_at": now,
+    }
+
+
+def diff_block_items(
+    block_id: UUID,
+    current: list[ExhibitionBlockItem],
+    items: list[ExhibitionBlockItemCreate],
+) -> tuple[list[dict], list[dict], list[UUID]]:
+    """
+    Rows to insert, rows to update and ids to delete to turn the current items of a block
+    into the given list. Items carry no id, so a current item is reused for a wanted item
+    with the same image (in order); it is rewritten only if its text or position changed.
+    """
+    reusable: dict[str, deque[ExhibitionBlockItem]] = defaultdict(deque)
+    for item in sorted(current, key=lambda item: item.position):
+        reusable[item.image_key].append(item)
+
+    to_insert, to_update = [], []
+    for position, item in enumerate(items):
+        candidates = reusable[item.image_key]
+        if not candidates:
+            to_insert.append(_new_item_row(block_id, item, position))
+            continue
+        existing = candidates.popleft()
+        if existing.text != item.text or existing.position != position:
+            to_update.append(
+                {
+                    "id": existing.id,
+                    "text": item.text,
+                    "position": position,
+                    "updated_at": datetime.now(),
+                },
+            )
+    to_delete = [item.id for candidates in reusable.values() for item in candidates]
+    return to_insert, to_update, to_delete
+
+
+@log_method_call
+async def sync_block_items(
+    session: AsyncSession,
+    block_id: UUID,
+    items: list[ExhibitionBlockItemCreate],
+) -> None:
+    """Write only the difference between the stored items of the block and `items`."""
+    current = (
+        await session.scalars(
+            select(ExhibitionBlockItem).where(ExhibitionBlockItem.block_id == block_id),
+        )
+    ).all()
+    to_insert, to_update, to_delete = diff_block_items(
+        block_id,
+        list(current),
+        sanitize_block_items(items) or [],
+    )
+    if to_delete:
+        await session.execute(
+            delete(ExhibitionBlockItem).where(ExhibitionBlockItem.id.in_(to_delete)),
         )
-        session.add(db_item)
+    if to_update:
+        await session.execute(update(ExhibitionBlockItem), to_update)
+    if to_insert:
+        await session.execute(insert(ExhibitionBlockItem), to_insert)
 
 
 @log_method_call
@@ -109,11 +255,14 @@ async def create_exhibition_block(
     block_in: ExhibitionBlockCreate,
     items: list[ExhibitionBlockItemCreate] | None = None,
 ) -> ExhibitionBlock:
-    await validate_exhibition(session, block_in.exhibition_id)
+    exhibition = await validate_exhibition(session, block_in.exhibition_id)
+    organization_id = exhibition.organization_id
     position = await adjust_block_positions(session, block_in.exhibition_id, block_in.position or 0)
     block = await persist_exhibition_block(session, block_in, position)
     await persist_block_items(session, block.id, items)
+    await refresh_exhibition_read_models(session, block_in.exhibition_id)
     await session.commit()
+    await invalidate_exhibition_cache(block_in.exhibition_id, organization_id)
     await session.refresh(block)
     return block
 
@@ -139,23 +288,27 @@ async def update_exhibition_block(
     if "content" in base_data:
         base_data["content"] = sanitize_block_content(base_data["content"])
 
+    # Like on create and move, the position sent by the editor is an index in the block list
+    requested_position = base_data.pop("position", None)
+    exhibition_id = block.exhibition_id
+    if requested_position is not None:
+        base_data["position"] = await adjust_block_positions(
+            session,
+            exhibition_id,
+            requested_position,
+            exclude_block_id=block.id,
+        )
+
     block.sqlmodel_update(base_data)
     session.add(block)
 
     if block_in.items is not None:
-        await delete_block_items_by_block_id(session, block.id)
-
-        sanitized_items = sanitize_block_items(block_in.items)
-        for i, item in enumerate(sanitized_items):
-            db_item = ExhibitionBlockItem(
-                block_id=block.id,
-                image_key=item.image_key,
-                text=item.text,
-                position=i,
-            )
-            session.add(db_item)
+        await sync_block_items(session, block.id, block_in.items)
 
+    organization_id = await _get_organization_id(session, exhibition_id)
+    await refresh_exhibition_read_models(session, exhibition_id)
     await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
     await session.refresh(block)
     return block
 
@@ -165,5 +318,146 @@ async def delete_exhibition_block(session: AsyncSession, block_id: UUID) -> None
     block = await session.get(ExhibitionBlock, block_id)
     if not block:
         raise ValueError(f"Block {block_id} not found")
+    exhibition_id = block.exhibition_id
+    organization_id = await _get_organization_id(session, exhibition_id)
     await session.delete(block)
+    await refresh_exhibition_read_models(session, exhibition_id)
+    await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
+
+
+@log_method_call
+async def move_exhibition_block(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    block_id: UUID,
+    position: int,
+) -> ExhibitionBlock:
+    """Move the block to the given index of its exhibition's block list."""
+    block = await session.scalar(
+        select(ExhibitionBlock).where(
+            ExhibitionBlock.id == block_id,
+            ExhibitionBlock.exhibition_id == exhibition_id,
+        ),
+    )
+    if not block:
+        raise ValueError(f"Block {block_id} not found in exhibition {exhibition_id}")
+    block.position = await adjust_block_positions(
+        session,
+        exhibition_id,
+        position,
+        exclude_block_id=block_id,
+    )
+    session.add(block)
+    organization_id = await _get_organization_id(session, exhibition_id)
+    await refresh_exhibition_read_models(session, exhibition_id)
+    await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
+    await session.refresh(block)
+    return block
+
+
+@log_method_call
+async def reorder_exhibition_blocks(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    block_ids: list[UUID],
+) -> None:
+    """Apply a whole new order of the exhibition's blocks with a single update."""
+    exhibition = await validate_exhibition(session, exhibition_id)
+    organization_id = exhibition.organization_id
+    current_ids = (
+        await session.scalars(
+            select(ExhibitionBlock.id).where(ExhibitionBlock.exhibition_id == exhibition_id),
+        )
+    ).all()
+    if len(block_ids) != len(current_ids) or set(block_ids) != set(current_ids):
+        raise HTTPException(
+            status_code=400,
+            detail="The new order must list every block of the exhibition exactly once",
+        )
+
+    new_order = values(
+        column("id", Uuid),
+        column("position", Integer),
+        name="new_order",
+    ).data(list(zip(block_ids, spaced_positions(len(block_ids)), strict=True)))
+    await session.execute(
+        update(ExhibitionBlock)
+        .where(ExhibitionBlock.id == new_order.c.id)
+        .values(position=new_order.c.position, updated_at=datetime.now())
+        .execution_options(synchronize_session=False),
+    )
+    await refresh_exhibition_read_models(session, exhibition_id)
+    await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
+
+
+def _sanitize_import(
+    blocks: list[ExhibitionBlockImport],
+) -> list[tuple[str | None, list[ExhibitionBlockItemCreate]]]:
+    """Sanitized content and items of imported blocks."""
+    return [
+        (sanitize_block_content(block.content), sanitize_block_items(block.items) or [])
+        for block in blocks
+    ]
+
+
+@log_method_call
+async def import_exhibition_blocks(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    blocks: list[ExhibitionBlockImport],
+) -> list[UUID]:
+    """
+    Append the blocks with their items to the exhibition in one transaction and return
+    the ids of the new blocks in order. Blocks and items are written with multi-row
+    inserts, whatever their number.
+    """
+    exhibition = await validate_exhibition(session, exhibition_id)
+    organization_id = exhibition.organization_id
+
+    # Cleaning HTML is CPU bound; keep it off the event loop
+    sanitized = await asyncio.to_thread(_sanitize_import, blocks)
+
+    last = await session.scalar(
+        select(func.max(ExhibitionBlock.position)).where(
+            ExhibitionBlock.exhibition_id == exhibition_id,
+        ),
+    )
+    first = 0 if last is None else last + POSITION_GAP
+    now = datetime.now()
+    block_rows, item_rows = [], []
+    for index, (block, (content, items)) in enumerate(zip(blocks, sanitized, strict=True)):
+        block_id = uuid4()
+        block_rows.append(
+            {
+                "id": block_id,
+                "exhibition_id": exhibition_id,
+                "type": block.type,
+                "content": content,
+                "settings": block.settings,
+                "position": first + index * POSITION_GAP,
+                "created_at": now,
+                "updated_at": now,
+            },
+        )
+        item_rows.extend(
+            _new_item_row(block_id, item, position) for position, item in enumerate(items)
+        )
+
+    # With RETURNING the rows are sent as multi-row INSERT ... VALUES batches
+    block_ids = await session.scalars(
+        insert(ExhibitionBlock).returning(ExhibitionBlock.id, sort_by_parameter_order=True),
+        block_rows,
+    )
+    block_ids = list(block_ids.all())
+    if item_rows:
+        await session.execute(
+            insert(ExhibitionBlockItem).returning(ExhibitionBlockItem.id),
+            item_rows,
+        )
+    await refresh_exhibition_read_models(session, exhibition_id)
     await session.commit()
+    await invalidate_exhibition_cache(exhibition_id, organization_id)
+    return block_ids
@@ -1,10 +1,11 @@
-from uuid import UUID
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
 
 from backend.app.db.models.exhibition_participant import (
     ExhibitionParticipant,
 )
 from backend.app.utils.logger import log_method_call
-from sqlalchemy import delete, select
+from sqlalchemy import delete, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -25,17 +26,32 @@ async def create_exhibition_participants(
     exhibition_participant_names: list[str],
     exhibition_id: UUID,
 ) -> list[ExhibitionParticipant]:
-    exhibition_participant_list = []
-    for exhibition_participant_name in exhibition_participant_names:
-        exhibition_participant = ExhibitionParticipant(
-            name=exhibition_participant_name,
-            exhibition_id=exhibition_id,
-        )
-        session.add(exhibition_participant)
-        await session.commit()
-        await session.refresh(exhibition_participant)
-        exhibition_participant_list.append(exhibition_participant)
-    return exhibition_participant_list
+    """
+    Insert the participants with a single multi-row statement and get them back in the
+    given order. Left for the caller to commit.
+    """
+    if not exhibition_participant_names:
+        return []
+    # Participants are listed by creation time, so space the rows a microsecond apart to
+    # keep the given order
+    now = datetime.now()
+    rows = [
+        {
+            "id": uuid4(),
+            "name": name,
+            "exhibition_id": exhibition_id,
+            "created_at": now + timedelta(microseconds=position),
+        }
+        for position, name in enumerate(exhibition_participant_names)
+    ]
+    result = await session.scalars(
+        insert(ExhibitionParticipant).returning(
+            ExhibitionParticipant,
+            sort_by_parameter_order=True,
+        ),
+        rows,
+    )
+    return list(result.all())
 
 
 @log_method_call
@@ -49,7 +65,6 @@ async def update_exhibition_participants(
     await session.execute(
         delete(ExhibitionParticipant).where(ExhibitionParticipant.exhibition_id == exhibition_id),
     )
-    await session.commit()
     return await create_exhibition_participants(session, participants_in, exhibition_id)
 
 
@@ -58,7 +73,11 @@ async def get_exhibition_participants(
     session: AsyncSession,
     exhibition_id: UUID,
 ) -> list[ExhibitionParticipant] | None:
-    statement = select(ExhibitionParticipant).filter_by(exhibition_id=exhibition_id)
+    statement = (
+        select(ExhibitionParticipant)
+        .filter_by(exhibition_id=exhibition_id)
+        .order_by(ExhibitionParticipant.created_at)
+    )
     result = await session.execute(statement)
     exhibition_participants = result.scalars().all()
     return exhibition_participants
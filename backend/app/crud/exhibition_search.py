@@ -0,0 +1,111 @@
+from uuid import UUID
+
+from backend.app.core.config import settings
+from backend.app.db.models.exhibition import Exhibition
+from backend.app.db.models.exhibition_block import ExhibitionBlock
+from backend.app.db.models.exhibition_block_item import ExhibitionBlockItem
+from backend.app.db.models.exhibition_participant import ExhibitionParticipant
+from backend.app.db.models.exhibition_search_document import ExhibitionSearchDocument
+from backend.app.db.models.exhibition_tag import ExhibitionTag
+from backend.app.db.models.tag import Tag
+from backend.app.utils.logger import log_method_call
+from sqlalchemy import ColumnElement, cast, func, literal, literal_column, or_, select
+from sqlalchemy.dialects.postgresql import REGCONFIG, TSVECTOR, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def _text_config() -> ColumnElement:
+    return cast(literal(settings.SEARCH_TEXT_CONFIG), REGCONFIG)
+
+
+def _weighted(text: ColumnElement, weight: str) -> ColumnElement:
+    """Builds a tsvector of `text` with the given weight (A is the most important)."""
+    return func.setweight(
+        func.to_tsvector(_text_config(), func.coalesce(text, "")),
+        literal_column(f"'{weight}'"),
+        type_=TSVECTOR,
+    )
+
+
+def _document() -> ColumnElement:
+    """Full-text document of an exhibition: title, tags, participants, description and blocks."""
+    tags_text = (
+        select(func.string_agg(Tag.name, " "))
+        .join(ExhibitionTag, ExhibitionTag.tag_id == Tag.id)
+        .where(ExhibitionTag.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    participants_text = (
+        select(func.string_agg(ExhibitionParticipant.name, " "))
+        .where(ExhibitionParticipant.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    blocks_text = (
+        select(func.string_agg(ExhibitionBlock.content, " "))
+        .where(ExhibitionBlock.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    items_text = (
+        select(func.string_agg(ExhibitionBlockItem.text, " "))
+        .join(ExhibitionBlock, ExhibitionBlockItem.block_id == ExhibitionBlock.id)
+        .where(ExhibitionBlock.exhibition_id == Exhibition.id)
+        .scalar_subquery()
+    )
+    parts = [
+        _weighted(Exhibition.title, "A"),
+        _weighted(tags_text, "B"),
+        _weighted(participants_text, "B"),
+        _weighted(Exhibition.description, "C"),
+        _weighted(blocks_text, "D"),
+        _weighted(items_text, "D"),
+    ]
+    document = parts[0]
+    for part in parts[1:]:
+        document = document.op("||", return_type=TSVECTOR)(part)
+    return document
+
+
+@log_method_call
+async def refresh_search_document(session: AsyncSession, exhibition_id: UUID) -> None:
+    """Rebuilds the full-text document of an exhibition inside the caller's transaction."""
+    statement = insert(ExhibitionSearchDocument).from_select(
+        ["exhibition_id", "document"],
+        select(Exhibition.id, _document()).where(Exhibition.id == exhibition_id),
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[ExhibitionSearchDocument.exhibition_id],
+        set_={"document": statement.excluded.document},
+    )
+    await session.execute(statement)
+
+
+def search_query(search: str) -> ColumnElement:
+    """Parses user input with the web search syntax (quotes, `or`, `-`)."""
+    return func.websearch_to_tsquery(_text_config(), search)
+
+
+def search_predicate(
+    search: str,
+    document: ColumnElement = ExhibitionSearchDocument.document,
+    title: ColumnElement = Exhibition.title,
+) -> ColumnElement:
+    """
+    Matches the full-text document, or the title by trigram similarity when the typo
+    tolerant fallback is enabled. By default requires a join with ExhibitionSearchDocument.
+    """
+    predicate = document.op("@@")(search_query(search))
+    if settings.SEARCH_TRIGRAM_FALLBACK:
+        predicate = or_(predicate, title.op("%")(search))
+    return predicate
+
+
+def search_rank(
+    search: str,
+    document: ColumnElement = ExhibitionSearchDocument.document,
+    title: ColumnElement = Exhibition.title,
+) -> ColumnElement:
+    """Relevance of an exhibition for the search, higher is better."""
+    rank = func.coalesce(func.ts_rank_cd(document, search_query(search)), 0)
+    if settings.SEARCH_TRIGRAM_FALLBACK:
+        rank = func.greatest(rank, func.similarity(title, search))
+    return rank
@@ -1,17 +1,17 @@
 from uuid import UUID
 
-from backend.app.crud.tag import create_tag, get_tag
+from backend.app.crud.tag import create_or_exist_tags
 from backend.app.db.models.exhibition_tag import (
     ExhibitionTag,
     ExhibitionTagCreate,
 )
 from backend.app.db.models.tag import (
     Tag,
-    TagCreate,
     TagPublic,
 )
 from backend.app.utils.logger import log_method_call
 from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -25,16 +25,14 @@ async def get_exhibition_tag(session: AsyncSession, **filters) -> ExhibitionTag
 
 @log_method_call
 async def get_exhibition_tags(session: AsyncSession, exhibition_id: UUID) -> list[Tag] | None:
-    statement = select(ExhibitionTag).filter_by(exhibition_id=exhibition_id)
+    statement = (
+        select(Tag)
+        .join(ExhibitionTag, ExhibitionTag.tag_id == Tag.id)
+        .where(ExhibitionTag.exhibition_id == exhibition_id)
+        .order_by(Tag.name)
+    )
     result = await session.execute(statement)
-    exhibition_tags = result.scalars().all()
-    tags = []
-    for exhibition_tag in exhibition_tags:
-        tag = await session.execute(select(Tag).filter_by(id=exhibition_tag.tag_id))
-        tag = tag.scalar_one_or_none()
-        if tag is not None:
-            tags.append(tag)
-    return tags
+    return list(result.scalars().all())
 
 
 @log_method_call
@@ -55,19 +53,16 @@ async def create_or_exist_exhibition_tags(
     tags: list[str],
     exhibition_id: UUID,
 ) -> list[TagPublic]:
-    tag_list = []
-    for raw_tag_name in tags:
-        tag_name = raw_tag_name.lower()
-        tag = await get_tag(session=session, name=tag_name)
-        if tag is None:
-            tag = await create_tag(session=session, tag_in=TagCreate(name=tag_name))
-        tag_list.append(TagPublic.model_validate(tag))
-        await create_exhibition_tag(
-            session=session,
-            exhibition_tag_in=ExhibitionTagCreate(
-                tag_id=tag.id,
-                exhibition_id=exhibition_id,
-            ),
+    """
+    Link the exhibition to the named tags, creating the missing ones. Two statements
+    whatever the number of tags, both left for the caller to commit.
+    """
+    tag_list = await create_or_exist_tags(session=session, tags=tags)
+    if tag_list:
+        await session.execute(
+            insert(ExhibitionTag)
+            .values([{"exhibition_id": exhibition_id, "tag_id": tag.id} for tag in tag_list])
+            .on_conflict_do_nothing(),
         )
     return tag_list
 
@@ -81,4 +76,3 @@ async def delete_exhibition_tags(
     if tags_in is None:
         return None
     await session.execute(delete(ExhibitionTag).where(ExhibitionTag.exhibition_id == exhibition_id))
-    await session.commit()
@@ -1,12 +1,14 @@
+from functools import partial
 from uuid import UUID
 
 from backend.app.api.dependencies.exhibition.filters import FilterParams, SortParams
 from backend.app.core.config import settings
-from backend.app.crud.exhibition import get_exhibitions
+from backend.app.crud import exhibition as exhibition_crud
 from backend.app.db.models.exhibition import (
     Exhibition,
-    ExhibitionPublic,
+    ExhibitionsPublic,
     ExhibitionsPublicWithPagination,
+    ExhibitionStatusEnum,
 )
 from backend.app.db.models.organization import (
     MyOrganization,
@@ -18,10 +20,14 @@ from backend.app.db.models.organization import (
     OrganizationsPublic,
     OrgStatusEnum,
 )
+from backend.app.db.models.user_exhibition_like import UserExhibitionLike
 from backend.app.db.models.user_organization import UserOrganization
+from backend.app.utils.cache import SharedCache
+from backend.app.utils.concurrency import gather_reads, scalar, scalars
 from backend.app.utils.logger import log_method_call
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import Text, cast, exists, func, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -69,6 +75,7 @@ async def update_organization(
     session.add(organization)
     await session.commit()
     await session.refresh(organization)
+    await invalidate_organization_profile(organization.id)
     return organization
 
 
@@ -83,13 +90,16 @@ async def update_organization_profile(
     session.add(organization)
     await session.commit()
     await session.refresh(organization)
+    await invalidate_organization_profile(organization.id)
     return organization
 
 
 @log_method_call
 async def delete_organization(session: AsyncSession, organization: Organization) -> Organization:
+    organization_id = organization.id
     await session.delete(organization)
     await session.commit()
+    await invalidate_organization_profile(organization_id)
     return organization
 
 
@@ -100,10 +110,13 @@ async def get_organizations(
     limit: int = settings.DEFAULT_QUERY_LIMIT,
 ) -> OrganizationsPublic:
     statement = select(Organization).offset(skip).limit(limit)
-    organizations = (await session.execute(statement)).scalars().all()
+    organizations, count = await gather_reads(
+        session,
+        scalars(statement),
+        scalar(select(func.count(Organization.id))),
+    )
     # Преобразуем к OrganizationPublicShort
     orgs_short = [OrganizationPublicShort(**org.model_dump()) for org in organizations]
-    count = (await session.execute(select(func.count(Organization.id)))).scalar_one()
     return OrganizationsPublic(data=orgs_short, count=count)
 
 
@@ -113,6 +126,7 @@ async def confirm_organization(session: AsyncSession, organization: Organization
     session.add(organization)
     await session.commit()
     await session.refresh(organization)
+    await invalidate_organization_profile(organization.id)
     return organization
 
 
@@ -122,9 +136,13 @@ async def reject_organization(session: AsyncSession, organization: Organization)
     session.add(organization)
     await session.commit()
     await session.refresh(organization)
+    await invalidate_organization_profile(organization.id)
     return organization
 
 
+organization_profile_cache = SharedCache("organization_profile", OrganizationPublic)
+
+
 @log_method_call
 async def get_organization_profile_with_exhibitions(
     session: AsyncSession,
@@ -132,38 +150,118 @@ async def get_organization_profile_with_exhibitions(
     current_user_id: UUID,
     skip: int = 0,
     limit: int = 10,
+) -> OrganizationPublic | None:
+    """
+    Organization with a page of its published exhibitions, most liked first.
+
+    Pages are cached without the viewer's like flags, which are looked up on every call;
+    concurrent misses share one load.
+    Every page of an organization is dropped at once by `invalidate_organization_profile`.
+    """
+    generation = await organization_profile_cache.generation(organization_id)
+    load = partial(_load_organization_profile, session, organization_id, skip, limit)
+    if generation is None:
+        profile = await load()
+    else:
+        profile = await organization_profile_cache.get_or_load(
+            (organization_id, generation, skip, limit),
+            load,
+        )
+    if profile is None:
+        return None
+
+    exhibitions = profile.exhibitions.data
+    liked_ids = await exhibition_crud.get_liked_exhibition_ids(
+        session,
+        current_user_id,
+        [exhibition.id for exhibition in exhibitions],
+    )
+    data = [
+        exhibition.model_copy(
+            update={"is_liked_by_current_user": exhibition.id in liked_ids},
+        )
+        for exhibition in exhibitions
+    ]
+    return profile.model_copy(
+        update={"exhibitions": profile.exhibitions.model_copy(update={"data": data})},
+    )
+
+
+async def _load_organization_profile(
+    session: AsyncSession,
+    organization_id: UUID,
+    skip: int,
+    limit: int,
 ) -> OrganizationPublic | None:
     org = await get_organization(session, id=organization_id)
     if not org:
         return None
-    exhibition_objs = (
-        await get_exhibitions(
+    page = ExhibitionsPublic.model_validate_json(
+        await exhibition_crud.get_published_exhibitions_json(
             session=session,
             filters=FilterParams(organization_id=organization_id),
-            sort=SortParams(sort_by="likes_count", sort_order="desc"),
-            current_user_id=current_user_id,
-        )
-    ).data
-    exhibitions = [
-        ExhibitionPublic(
-            **exh.model_dump(),
-        )
-        for exh in exhibition_objs
-    ]
-    count_stmt = select(func.count(Exhibition.id)).where(
-        Exhibition.organization_id == organization_id,
-        Exhibition.status == "published",
+            sort=SortParams(sortBy="likes_count", sortOrder="desc"),
+            skip=skip,
+            limit=limit,
+        ),
     )
-    count = (await session.execute(count_stmt)).scalar_one()
     exhibitions_paginated = ExhibitionsPublicWithPagination(
-        data=exhibitions,
-        count=count,
+        data=page.data,
+        count=page.count,
         skip=skip,
         limit=limit,
     )
     return OrganizationPublic(**org.model_dump(), exhibitions=exhibitions_paginated)
 
 
+@log_method_call
+async def get_organization_profile_version(
+    session: AsyncSession,
+    organization_id: UUID,
+    current_user_id: UUID,
+) -> str | None:
+    """
+    Cheap fingerprint of what the organization profile depends on, for conditional
+    requests: the organization row and the id, last change time, likes counter and viewer's
+    like flag of each published exhibition. None when the organization doesn't exist.
+    """
+    is_liked = exists().where(
+        UserExhibitionLike.exhibition_id == Exhibition.id,
+        UserExhibitionLike.user_id == current_user_id,
+    )
+    exhibitions = (
+        select(
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_array(
+                        Exhibition.id,
+                        Exhibition.updated_at,
+                        Exhibition.likes_count,
+                        is_liked,
+                    ),
+                    Exhibition.id,
+                ),
+            ),
+        )
+        .where(
+            Exhibition.organization_id == Organization.id,
+            Exhibition.status == ExhibitionStatusEnum.published,
+        )
+        .scalar_subquery()
+    )
+    statement = select(
+        func.md5(
+            func.concat(cast(Organization.__table__.table_valued(), Text), cast(exhibitions, Text)),
+        ),
+    ).where(Organization.id == organization_id)
+    return await session.scalar(statement)
+
+
+async def invalidate_organization_profile(organization_id: UUID) -> None:
+    """Drops every cached profile page of the organization in all workers."""
+    await organization_profile_cache.bump(organization_id)
+
+
 @log_method_call
 async def get_my_organizations(
     session: AsyncSession,
@@ -1,6 +1,11 @@
-from backend.app.db.models.tag import Tag, TagCreate
+from datetime import datetime
+from uuid import uuid4
+
+from backend.app.db.models.tag import Tag, TagCreate, TagPublic
+from backend.app.utils.cache import SharedCache
 from backend.app.utils.logger import log_method_call
-from sqlalchemy import select
+from sqlalchemy import false, select, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -12,16 +17,67 @@ async def get_tag(session: AsyncSession, **filters) -> Tag | None:
     return tag
 
 
+# Committed tags by name. At runtime a name always keeps its tag, so entries are never
+# invalidated; migrations merging or renaming tags (like a3e6f0c2d5b8) bump the version
+tag_cache = SharedCache("tag", TagPublic, version=2)
+
+
+def normalize_tag_names(names: list[str]) -> list[str]:
+    """Lowercase and strip tag names, dropping blanks and repeats but keeping the order."""
+    return list(dict.fromkeys(name for name in (raw.strip().lower() for raw in names) if name))
+
+
 @log_method_call
-async def create_or_exist_tags(session: AsyncSession, tags: list[str]) -> list[Tag]:
-    tag_list = []
-    for raw_tag_name in tags:
-        tag_name = raw_tag_name.lower()
-        tag = await get_tag(session=session, name=tag_name)
-        if not tag:
-            tag = await create_tag(session=session, tag_in=TagCreate(name=tag_name))
-        tag_list.append(tag)
-    return tag_list
+async def create_or_exist_tags(session: AsyncSession, tags: list[str]) -> list[TagPublic]:
+    """
+    Get the tags with the given names, from the tag cache when they are known and inserting
+    the missing ones in a single statement otherwise. Nothing is committed: the new tags
+    belong to the caller's transaction, which is also why only existing tags get cached.
+    """
+    names = normalize_tag_names(tags)
+    if not names:
+        return []
+
+    found = {}
+    for name in names:
+        if (tag := await tag_cache.get(name)) is not None:
+            found[name] = tag
+    if missing := [name for name in names if name not in found]:
+        found.update(await _upsert_tags(session, missing))
+    return [found[name] for name in names]
+
+
+async def _upsert_tags(session: AsyncSession, names: list[str]) -> dict[str, TagPublic]:
+    inserted = (
+        insert(Tag)
+        .values([{"id": uuid4(), "name": name, "created_at": datetime.now()} for name in names])
+        .on_conflict_do_nothing(index_elements=[Tag.name])
+        .returning(*Tag.__table__.c)
+        .cte("inserted")
+    )
+    # The outer select runs on the statement snapshot, so it sees the tags that existed
+    # before and the CTE contributes the ones it has just inserted
+    statement = select(inserted, true().label("created")).union_all(
+        select(*Tag.__table__.c, false().label("created")).where(
+            Tag.name.in_(names),
+            Tag.name.not_in(select(inserted.c.name)),
+        ),
+    )
+    found = {}
+    existing = []
+    for row in await session.execute(statement):
+        found[row.name] = TagPublic.model_validate(row, from_attributes=True)
+        if not row.created:
+            existing.append(found[row.name])
+    if missing := [name for name in names if name not in found]:
+        # Committed by a concurrent transaction after our snapshot was taken
+        result = await session.execute(select(Tag).where(Tag.name.in_(missing)))
+        for tag in result.scalars():
+            found[tag.name] = TagPublic.model_validate(tag)
+            existing.append(found[tag.name])
+    for tag in existing:
+        await tag_cache.set(tag.name, tag)
+    return found
 
 
 @log_method_call
@@ -1,17 +1,32 @@
+from datetime import datetime
+from uuid import UUID
+
+from backend.app.api.dependencies.exhibition.filters import FilterParams, SortParams
+from backend.app.api.dependencies.pagination import CountMode
 from backend.app.core.config import settings
 from backend.app.core.security import get_password_hash, verify_password
-from backend.app.crud.exhibition import get_exhibition
-from backend.app.db.models.exhibition import ExhibitionPublic
+from backend.app.crud.exhibition import (
+    LikedExhibitionQueryBuilder,
+    invalidate_exhibition_cache,
+    shift_likes_count,
+)
+from backend.app.db.models.exhibition import Exhibition, ExhibitionsPublic
 from backend.app.db.models.user import (
     StatusEnum,
     User,
     UserCreate,
     UsersPublic,
 )
-from backend.app.db.models.user_exhibition_like import UserExhibitionLike
+from backend.app.db.models.user_exhibition_like import (
+    ExhibitionLikePublic,
+    ExhibitionLikesPublic,
+    UserExhibitionLike,
+)
+from backend.app.utils.concurrency import gather_reads, scalar, scalars
 from backend.app.utils.logger import log_method_call
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import and_, delete, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
@@ -42,8 +57,11 @@ async def get_users(
     limit: int = settings.DEFAULT_QUERY_LIMIT,
 ) -> UsersPublic:
     statement = select(User).offset(skip).limit(limit)
-    users = (await session.execute(statement)).scalars().all()
-    count = (await session.execute(select(func.count(User.id)))).scalar_one()
+    users, count = await gather_reads(
+        session,
+        scalars(statement),
+        scalar(select(func.count(User.id))),
+    )
     return UsersPublic(data=users, count=count)
 
 
@@ -153,68 +171,151 @@ async def unban_user(session: AsyncSession, user: User) -> User:
 @log_method_call
 async def get_liked_exhibitions(
     session: AsyncSession,
-    user_id: str,
+    user_id: UUID,
     skip: int = 0,
     limit: int = settings.DEFAULT_QUERY_LIMIT,
-) -> list[User]:
-    liked_exhibitions_ids = (
-        (
-            await session.execute(
-                select(UserExhibitionLike).where(UserExhibitionLike.user_id == user_id),
-            )
-        )
-        .scalars()
-        .all()
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.exact,
+) -> ExhibitionsPublic:
+    """Page of the exhibitions liked by the user, most recently liked first."""
+    query_builder = LikedExhibitionQueryBuilder(
+        session,
+        FilterParams(),
+        SortParams(),
+        skip,
+        limit,
+        current_user_id=user_id,
+        cursor=cursor,
+        count_mode=count_mode,
     )
-    exhibitions = []
-    for exhibition in liked_exhibitions_ids:
-        db_exhibition = await get_exhibition(session=session, id=exhibition.exhibition_id)
-        db_exhibition.is_liked_by_current_user = True
-        exhibitions.append(db_exhibition)
-    return exhibitions
+    return await query_builder.execute()
 
 
 @log_method_call
-async def like_exhibition(
+async def get_liked_exhibitions_json(
     session: AsyncSession,
-    exhibition_id: str,
-    user_id: str,
-) -> ExhibitionPublic:
-    exhibition = await get_exhibition(session=session, id=exhibition_id)
-    if not exhibition:
+    user_id: UUID,
+    skip: int = 0,
+    limit: int = settings.DEFAULT_QUERY_LIMIT,
+    cursor: str | None = None,
+    count_mode: CountMode = CountMode.exact,
+) -> bytes:
+    """Same as `get_liked_exhibitions`, but returns the serialized `ExhibitionsPublic`."""
+    query_builder = LikedExhibitionQueryBuilder(
+        session,
+        FilterParams(),
+        SortParams(),
+        skip,
+        limit,
+        current_user_id=user_id,
+        cursor=cursor,
+        count_mode=count_mode,
+    )
+    return await query_builder.execute_json()
+
+
+async def _set_like(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    user_id: UUID,
+    liked: bool,
+) -> ExhibitionLikePublic:
+    """
+    Idempotently sets the user's like of an exhibition. The counter only moves when the
+    like actually appears or disappears, so repeated and concurrent calls are safe.
+    """
+    if liked:
+        statement = (
+            insert(UserExhibitionLike)
+            .from_select(
+                ["exhibition_id", "user_id", "created_at"],
+                select(
+                    Exhibition.id,
+                    literal(user_id, UserExhibitionLike.user_id.type),
+                    literal(datetime.now()),
+                ).where(Exhibition.id == exhibition_id),
+            )
+            .on_conflict_do_nothing()
+        )
+    else:
+        statement = delete(UserExhibitionLike).where(
+            UserExhibitionLike.exhibition_id == exhibition_id,
+            UserExhibitionLike.user_id == user_id,
+        )
+    result = await session.execute(statement.returning(UserExhibitionLike.exhibition_id))
+    changed = result.first() is not None
+
+    if changed:
+        state = await shift_likes_count(session, exhibition_id, 1 if liked else -1)
+    else:
+        state = (
+            await session.execute(
+                select(Exhibition.likes_count, Exhibition.organization_id).where(
+                    Exhibition.id == exhibition_id,
+                ),
+            )
+        ).one_or_none()
+    if state is None:
         raise HTTPException(status_code=404, detail="Exhibition not found")
 
-    user_exhibition_like = UserExhibitionLike(exhibition_id=exhibition.id, user_id=user_id)
-    session.add(user_exhibition_like)
     await session.commit()
-    await session.refresh(user_exhibition_like)
+    if changed:
+        await invalidate_exhibition_cache(exhibition_id, state.organization_id)
+    return ExhibitionLikePublic(
+        exhibition_id=exhibition_id,
+        likes_count=state.likes_count,
+        is_liked_by_current_user=liked,
+    )
 
-    exhibition.is_liked_by_current_user = True
-    return ExhibitionPublic.model_validate(exhibition)
+
+@log_method_call
+async def like_exhibition(
+    session: AsyncSession,
+    exhibition_id: UUID,
+    user_id: UUID,
+) -> ExhibitionLikePublic:
+    return await _set_like(session, exhibition_id, user_id, liked=True)
 
 
 @log_method_call
 async def unlike_exhibition(
     session: AsyncSession,
-    exhibition_id: str,
-    user_id: str,
-) -> ExhibitionPublic:
-    exhibition = await get_exhibition(session=session, id=exhibition_id)
-    if not exhibition:
-        raise HTTPException(status_code=404, detail="Exhibition not found")
-
-    user_exhibition_like = await session.execute(
-        select(UserExhibitionLike).where(
-            UserExhibitionLike.exhibition_id == exhibition.id,
-            UserExhibitionLike.user_id == user_id,
-        ),
-    )
-    user_exhibition_like = user_exhibition_like.scalar_one_or_none()
-    if not user_exhibition_like:
-        raise HTTPException(status_code=404, detail="Like not found")
+    exhibition_id: UUID,
+    user_id: UUID,
+) -> ExhibitionLikePublic:
+    return await _set_like(session, exhibition_id, user_id, liked=False)
 
-    await session.delete(user_exhibition_like)
-    await session.commit()
 
-    exhibition.is_liked_by_current_user = False
-    return ExhibitionPublic.model_validate(exhibition)
+@log_method_call
+async def get_exhibition_likes(
+    session: AsyncSession,
+    user_id: UUID,
+    exhibition_ids: list[UUID],
+) -> ExhibitionLikesPublic:
+    """
+    Likes counters and the user's like flags of the given exhibitions, in the order of
+    `exhibition_ids`, with one query; unknown ids are left out.
+    """
+    statement = (
+        select(
+            Exhibition.id.label("exhibition_id"),
+            Exhibition.likes_count,
+            UserExhibitionLike.user_id.is_not(None).label("is_liked_by_current_user"),
+        )
+        .outerjoin(
+            UserExhibitionLike,
+            and_(
+                UserExhibitionLike.exhibition_id == Exhibition.id,
+                UserExhibitionLike.user_id == user_id,
+            ),
+        )
+        .where(Exhibition.id.in_(exhibition_ids))
+    )
+    rows = {row.exhibition_id: row for row in await session.execute(statement)}
+    return ExhibitionLikesPublic(
+        data=[
+            ExhibitionLikePublic.model_validate(rows[exhibition_id], from_attributes=True)
+            for exhibition_id in dict.fromkeys(exhibition_ids)
+            if exhibition_id in rows
+        ],
+    )
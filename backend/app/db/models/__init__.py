@@ -2,10 +2,12 @@ from .admin_action import AdminActionPublic
 from .exhibition import ExhibitionPublic, ExhibitionsPublic, ExhibitionsPublicWithPagination
 from .exhibition_block import ExhibitionBlockPublic
 from .exhibition_block_item import ExhibitionBlockItem
+from .exhibition_catalogue_card import ExhibitionCatalogueCard
 from .exhibition_exhibit import ExhibitionExhibit
 from .exhibition_moderation_comment import ExhibitionModerationComment
 from .exhibition_participant import ExhibitionParticipant
 from .exhibition_rating import ExhibitionRating
+from .exhibition_search_document import ExhibitionSearchDocument
 from .exhibition_tag import ExhibitionTag
 from .organization import OrganizationPublic, OrganizationResponse, OrganizationsPublic
 from .organization_moderation_comment import OrganizationModerationComment
@@ -27,11 +29,13 @@ __all__ = (
     "AdminActionPublic",
     "ExhibitionBlockItem",
     "ExhibitionBlockPublic",
+    "ExhibitionCatalogueCard",
     "ExhibitionExhibit",
     "ExhibitionModerationComment",
     "ExhibitionParticipant",
     "ExhibitionPublic",
     "ExhibitionRating",
+    "ExhibitionSearchDocument",
     "ExhibitionTag",
     "ExhibitionsPublic",
     "ExhibitionsPublicWithPagination",
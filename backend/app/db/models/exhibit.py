@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from backend.app.api.dependencies.common import Variants
+from backend.app.db.schemas import check_stored_file_key
+from pydantic import field_validator
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -51,6 +53,10 @@ class Exhibit(ExhibitBase, table=True):
 class ExhibitCreate(ExhibitBase):
     organization_id: UUID
 
+    @field_validator("image_key")
+    def check_image_key(cls, v: str | None) -> str | None:
+        return check_stored_file_key(v)
+
 
 class ExhibitUpdate(SQLModel):
     title: str | None = None
@@ -63,6 +69,10 @@ class ExhibitUpdate(SQLModel):
     start_year: int | None = None
     end_year: int | None = None
 
+    @field_validator("image_key")
+    def check_image_key(cls, v: str | None) -> str | None:
+        return check_stored_file_key(v)
+
 
 class ExhibitPublic(ExhibitBase):
     id: UUID
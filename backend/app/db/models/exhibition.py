@@ -6,7 +6,9 @@ from backend.app.api.dependencies.common import Variants
 from backend.app.db.models.exhibition_block import ExhibitionBlockPublic
 from backend.app.db.models.exhibition_moderation_comment import ExhibitionModerationCommentPublic
 from backend.app.db.models.exhibition_participant import ExhibitionParticipant
-from sqlalchemy import Column
+from backend.app.db.schemas import check_stored_file_key
+from pydantic import field_validator
+from sqlalchemy import Column, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -53,10 +55,27 @@ class ExhibitionBase(SQLModel):
 
 class Exhibition(ExhibitionBase, table=True):
     __tablename__ = "exhibitions"
+    __table_args__ = (
+        Index("ix_exhibitions_created_at_id", "created_at", "id"),
+        Index("ix_exhibitions_rating_id", "rating", "id"),
+        Index("ix_exhibitions_title_id", "title", "id"),
+        Index("ix_exhibitions_likes_count_id", "likes_count", "id"),
+        Index(
+            "ix_exhibitions_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id: UUID = Field(primary_key=True, nullable=False, default_factory=uuid4)
 
     organization_id: UUID | None = Field(foreign_key="organizations.id", nullable=True)
+    likes_count: int = Field(
+        default=0,
+        nullable=False,
+        sa_column_kwargs={"server_default": "0"},
+    )
 
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(
@@ -77,12 +96,20 @@ class ExhibitionCreate(ExhibitionBase):
     participants: list[str]
     tags: list[str]
 
+    @field_validator("cover_image_key")
+    def check_cover_image_key(cls, v: str | None) -> str | None:
+        return check_stored_file_key(v)
+
 
 class ExhibitionUpdate(ExhibitionBase):
     organization_id: UUID | None = None
     tags: list[str] | None = None
     participants: list[str] | None = None
 
+    @field_validator("cover_image_key")
+    def check_cover_image_key(cls, v: str | None) -> str | None:
+        return check_stored_file_key(v)
+
 
 class ExhibitionPublic(ExhibitionBase):
     id: UUID
@@ -102,7 +129,8 @@ class ExhibitionWithCommentsPublic(ExhibitionPublic):
 
 class ExhibitionsPublic(SQLModel):
     data: list["ExhibitionPublic"]
-    count: int
+    count: int | None
+    next_cursor: str | None = None
 
 
 class ExhibitionsPublicWithPagination(SQLModel):
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from backend.app.api.dependencies.common import Variants
+from backend.app.core.config import settings
 from backend.app.db.models.exhibition_block_item import ExhibitionBlockItemCreate
 from sqlalchemy import Column
 from sqlalchemy.dialects.postgresql import JSONB
@@ -77,3 +78,34 @@ class ExhibitionBlockPublic(ExhibitionBlockBase):
 class ExhibitionBlocksPublic(SQLModel):
     data: list[ExhibitionBlockPublic]
     count: int
+
+
+class ExhibitionBlockMove(SQLModel):
+    # Index in the exhibition's block list to move the block to
+    position: int = Field(ge=0)
+
+
+class ExhibitionBlocksOrder(SQLModel):
+    block_ids: list[UUID]
+
+
+class ExhibitionBlockImport(SQLModel):
+    type: ExhibitionBlockTypeEnum
+    content: str | None = None
+    settings: dict
+    items: list[ExhibitionBlockItemCreate] | None = Field(
+        default=None,
+        max_length=settings.BLOCK_IMPORT_MAX_ITEMS,
+    )
+
+
+class ExhibitionBlocksImport(SQLModel):
+    # Appended after the existing blocks, in this order
+    blocks: list[ExhibitionBlockImport] = Field(
+        min_length=1,
+        max_length=settings.BLOCK_IMPORT_MAX_BLOCKS,
+    )
+
+
+class ExhibitionBlockIdsPublic(SQLModel):
+    ids: list[UUID]
@@ -2,6 +2,8 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from backend.app.db.schemas import check_stored_file_key
+from pydantic import field_validator
 from sqlmodel import Field, SQLModel
 
 if TYPE_CHECKING:
@@ -18,7 +20,12 @@ class ExhibitionBlockItem(ExhibitionBlockItemBase, table=True):
     __tablename__ = "exhibition_block_items"
 
     id: UUID = Field(primary_key=True, nullable=False, default_factory=uuid4)
-    block_id: UUID = Field(foreign_key="exhibition_blocks.id", nullable=False, ondelete="CASCADE")
+    block_id: UUID = Field(
+        foreign_key="exhibition_blocks.id",
+        nullable=False,
+        index=True,
+        ondelete="CASCADE",
+    )
 
     created_at: datetime = Field(default_factory=datetime.now)
     updated_at: datetime = Field(
@@ -28,4 +35,6 @@ class ExhibitionBlockItem(ExhibitionBlockItemBase, table=True):
 
 
 class ExhibitionBlockItemCreate(ExhibitionBlockItemBase):
-    pass
+    @field_validator("image_key")
+    def check_image_key(cls, v: str | None) -> str | None:
+        return check_stored_file_key(v)
@@ -0,0 +1,48 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Column, Index, String, Uuid
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
+from sqlmodel import Field, SQLModel
+
+
+class ExhibitionCatalogueCard(SQLModel, table=True):
+    """Read model of a published exhibition for the public feed.
+
+    Holds the sort and filter keys of the exhibition and its prebuilt `ExhibitionPublic`
+    document (`card`, without the likes counter), so the feed is served from this table
+    alone. Rows are maintained by `crud.exhibition.refresh_exhibition_read_models`.
+    """
+
+    __tablename__ = "exhibition_catalogue_cards"
+    __table_args__ = (
+        Index("ix_exhibition_catalogue_cards_created_at_id", "created_at", "exhibition_id"),
+        Index("ix_exhibition_catalogue_cards_rating_id", "rating", "exhibition_id"),
+        Index("ix_exhibition_catalogue_cards_title_id", "title", "exhibition_id"),
+        Index("ix_exhibition_catalogue_cards_likes_count_id", "likes_count", "exhibition_id"),
+        Index("ix_exhibition_catalogue_cards_tag_ids", "tag_ids", postgresql_using="gin"),
+        Index("ix_exhibition_catalogue_cards_tag_names", "tag_names", postgresql_using="gin"),
+        Index("ix_exhibition_catalogue_cards_document", "document", postgresql_using="gin"),
+        Index(
+            "ix_exhibition_catalogue_cards_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
+
+    exhibition_id: UUID = Field(
+        foreign_key="exhibitions.id",
+        primary_key=True,
+        nullable=False,
+        ondelete="CASCADE",
+    )
+    organization_id: UUID | None = Field(default=None, nullable=True, index=True)
+    title: str = Field(max_length=255, nullable=False)
+    rating: float = Field(nullable=False)
+    likes_count: int = Field(nullable=False)
+    created_at: datetime = Field(nullable=False)
+    tag_ids: list[UUID] = Field(sa_column=Column(ARRAY(Uuid), nullable=False))
+    tag_names: list[str] = Field(sa_column=Column(ARRAY(String), nullable=False))
+    document: str = Field(sa_column=Column(TSVECTOR, nullable=False))
+    card: dict = Field(sa_column=Column(JSONB, nullable=False))
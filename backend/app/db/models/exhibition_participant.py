@@ -16,7 +16,12 @@ class ExhibitionParticipant(ExhibitionParticipantBase, table=True):
     __tablename__ = "exhibition_participants"
 
     id: UUID = Field(primary_key=True, nullable=False, default_factory=uuid4)
-    exhibition_id: UUID = Field(foreign_key="exhibitions.id", nullable=False, ondelete="CASCADE")
+    exhibition_id: UUID = Field(
+        foreign_key="exhibitions.id",
+        nullable=False,
+        index=True,
+        ondelete="CASCADE",
+    )
 
     created_at: datetime = Field(default_factory=datetime.now)
 
@@ -0,0 +1,24 @@
+from uuid import UUID
+
+from sqlalchemy import Column, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlmodel import Field, SQLModel
+
+
+class ExhibitionSearchDocument(SQLModel, table=True):
+    __tablename__ = "exhibition_search_documents"
+    __table_args__ = (
+        Index(
+            "ix_exhibition_search_documents_document",
+            "document",
+            postgresql_using="gin",
+        ),
+    )
+
+    exhibition_id: UUID = Field(
+        foreign_key="exhibitions.id",
+        primary_key=True,
+        nullable=False,
+        ondelete="CASCADE",
+    )
+    document: str = Field(sa_column=Column(TSVECTOR, nullable=False))
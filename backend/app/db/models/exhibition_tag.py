@@ -1,6 +1,7 @@
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -10,6 +11,7 @@ if TYPE_CHECKING:
 
 class ExhibitionTag(SQLModel, table=True):
     __tablename__ = "exhibition_tags"
+    __table_args__ = (Index("ix_exhibition_tags_tag_id_exhibition_id", "tag_id", "exhibition_id"),)
 
     exhibition_id: UUID = Field(
         foreign_key="exhibitions.id",
@@ -7,7 +7,7 @@ from backend.app.db.models.exhibit import Exhibit
 from backend.app.db.models.exhibition import ExhibitionsPublicWithPagination
 from backend.app.db.models.user_organization import UserOrganization
 from pydantic import EmailStr
-from sqlalchemy import Column
+from sqlalchemy import Column, Index
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlmodel import Field, Relationship, SQLModel
 
@@ -48,6 +48,15 @@ class OrganizationBase(SQLModel):
 
 class Organization(OrganizationBase, table=True):
     __tablename__ = "organizations"
+    __table_args__ = (
+        Index(
+            "ix_organizations_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     status: str | None = Field(default=OrgStatusEnum.draft, nullable=True)
 
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 if TYPE_CHECKING:
@@ -14,6 +15,7 @@ class TagBase(SQLModel):
 
 class Tag(TagBase, table=True):
     __tablename__ = "tags"
+    __table_args__ = (Index("ix_tags_name", "name", unique=True),)
 
     id: UUID = Field(primary_key=True, nullable=False, default_factory=uuid4)
     created_at: datetime = Field(default_factory=datetime.now)
@@ -1,13 +1,27 @@
 from datetime import datetime
 from uuid import UUID
 
+from sqlalchemy import Index
 from sqlmodel import Field, SQLModel
 
 
 class UserExhibitionLike(SQLModel, table=True):
     __tablename__ = "user_exhibition_likes"
+    __table_args__ = (
+        Index("ix_user_exhibition_likes_user_id_created_at", "user_id", "created_at"),
+    )
 
     exhibition_id: UUID = Field(foreign_key="exhibitions.id", primary_key=True, nullable=False)
     user_id: UUID = Field(foreign_key="users.id", primary_key=True, nullable=False)
 
     created_at: datetime = Field(default_factory=datetime.now)
+
+
+class ExhibitionLikePublic(SQLModel):
+    exhibition_id: UUID
+    likes_count: int
+    is_liked_by_current_user: bool
+
+
+class ExhibitionLikesPublic(SQLModel):
+    data: list[ExhibitionLikePublic]
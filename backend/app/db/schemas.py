@@ -2,6 +2,17 @@ from backend.app.api.dependencies.common import Variants
 from fastapi import Form
 from sqlmodel import Field, SQLModel
 
+# Direct uploads wait under this prefix until they are verified, and the bucket drops
+# those left there after a day
+PENDING_UPLOAD_PREFIX = "pending/"
+
+
+def check_stored_file_key(key: str | None) -> str | None:
+    """Rejects the key of a direct upload that was not completed yet."""
+    if key is not None and key.startswith(PENDING_UPLOAD_PREFIX):
+        raise ValueError("Complete the upload before using its key")
+    return key
+
 
 class Message(SQLModel):
     message: str
@@ -35,6 +46,40 @@ class FileUploadResponse(SQLModel):
     file_url: str
 
 
+class PresignedUploadCreate(SQLModel):
+    content_type: str
+    size: int = Field(gt=0)
+
+
+class PresignedUploadPart(SQLModel):
+    part_number: int
+    url: str
+
+
+class PresignedUpload(SQLModel):
+    upload_key: str
+    expires_in: int
+    # Files of one part: POST a form with `fields` and the file to `url`
+    url: str | None = None
+    fields: dict[str, str] | None = None
+    # Larger files: PUT each part of `part_size` bytes to its url, then complete the
+    # upload with the ETags of the parts
+    upload_id: str | None = None
+    part_size: int | None = None
+    parts: list[PresignedUploadPart] | None = None
+
+
+class CompletedUploadPart(SQLModel):
+    part_number: int
+    etag: str
+
+
+class PresignedUploadComplete(SQLModel):
+    upload_key: str
+    upload_id: str | None = None
+    parts: list[CompletedUploadPart] | None = None
+
+
 class LoginType(Variants):
     user = "user"
     organization = "organization"
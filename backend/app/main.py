@@ -2,6 +2,7 @@ from contextlib import asynccontextmanager
 
 from backend.app.api.main import api_router
 from backend.app.core.config import settings
+from backend.app.utils.cache import cache_backend
 from backend.app.utils.logger import logger
 from backend.app.utils.middleware import LoggingMiddleware
 from backend.app.utils.minio import minio_client
@@ -17,9 +18,13 @@ async def lifespan(app: FastAPI):
     It initializes the application and performs any necessary cleanup on shutdown.
     """
     logger.info("Starting FastAPI application...")
+    await minio_client.start()
     await minio_client.initialize_bucket()
+    await cache_backend.start()
     yield
     logger.info("Shutting down FastAPI application...")
+    await cache_backend.close()
+    await minio_client.close()
 
 
 app = FastAPI(lifespan=lifespan)
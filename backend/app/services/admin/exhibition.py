@@ -18,20 +18,14 @@ async def read_exhibition(
     current_user_id: uuid.UUID,
 ) -> ExhibitionPublic:
     if (
-        exhibition := await exhibition_crud.get_exhibition(session=session, id=exhibition_id)
+        exhibition := await exhibition_crud.get_exhibition(
+            session=session,
+            current_user_id=current_user_id,
+            id=exhibition_id,
+        )
     ) is None:
         raise HTTPException(status_code=404, detail="Exhibition not found")
-    exhibition.is_liked_by_current_user = (
-        await exhibition_crud.get_user_exhibition_likes(
-            session,
-            exhibition_id,
-            current_user_id,
-        )
-    ) is not None or exhibition.is_liked_by_current_user
-
-    return ExhibitionPublic(
-        **exhibition.model_dump(),
-    )
+    return exhibition
 
 
 async def update_exhibition_status(
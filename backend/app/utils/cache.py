@@ -0,0 +1,550 @@
+import asyncio
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+from urllib.parse import unquote, urlsplit
+from uuid import uuid4
+
+from backend.app.core.config import settings
+from backend.app.utils.logger import logger
+from backend.app.utils.singleflight import SingleFlight
+from pydantic import BaseModel
+
+_MISSING = object()
+
+# Called with an evicted key, a key prefix ending with ":" or None when anything may be stale
+InvalidationHandler = Callable[[str | None], None]
+
+
+class TTLLRUCache:
+    """Bounded in-process cache: least recently used entries are evicted first and every
+    entry expires `ttl` seconds after it was stored.
+
+    Not thread-safe; meant to be used from the event loop of one worker.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key, _MISSING)
+        if entry is _MISSING:
+            self.misses += 1
+            return default
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = (time.monotonic() + (self.ttl if ttl is None else ttl), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        for key in [key for key in self._entries if str(key).startswith(prefix)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class CacheError(Exception):
+    """The cache server rejected a command or could not be reached."""
+
+
+class CacheBackend(ABC):
+    """
+    Storage shared by the `SharedCache`s of a worker: byte values with a TTL, counters and
+    an invalidation channel that reaches every worker using the same backend.
+    """
+
+    def __init__(self):
+        self.caches: list[SharedCache] = []
+        self._handlers: list[InvalidationHandler] = []
+
+    def register(self, cache: "SharedCache") -> None:
+        self.caches.append(cache)
+        self._handlers.append(cache.evict_local)
+
+    def _notify(self, message: str | None) -> None:
+        for handler in self._handlers:
+            handler(message)
+
+    async def start(self) -> None:  # noqa: B027
+        """Starts listening for invalidations published by other workers."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Releases the connections of the backend."""
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None: ...
+
+    @abstractmethod
+    async def get_many(self, keys: list[str]) -> list[bytes | None]: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None: ...
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> None: ...
+
+    @abstractmethod
+    async def incr(self, key: str) -> int: ...
+
+    @abstractmethod
+    async def publish(self, message: str) -> None: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """Keeps everything in the current process; invalidations only reach this worker."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__()
+        self._entries = TTLLRUCache(maxsize, ttl)
+        self._counters: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        if key in self._counters:
+            return str(self._counters[key]).encode()
+        return self._entries.get(key)
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [await self.get(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries.set(key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        self._entries.invalidate(key)
+        self._counters.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        self._entries.invalidate_prefix(prefix)
+        for key in [key for key in self._counters if key.startswith(prefix)]:
+            del self._counters[key]
+
+    async def incr(self, key: str) -> int:
+        self._counters[key] = self._counters.get(key, 0) + 1
+        return self._counters[key]
+
+    async def publish(self, message: str) -> None:
+        self._notify(message)
+
+
+def _encode_command(*args: str | bytes | int | float) -> bytes:
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        value = arg if isinstance(arg, bytes) else str(arg).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+    return b"".join(parts)
+
+
+async def _read_reply(reader: asyncio.StreamReader) -> Any:
+    """Reads one RESP2 reply. Error replies are returned, not raised, so that the
+    connection stays usable."""
+    line = await reader.readuntil(b"\r\n")
+    kind, payload = line[:1], line[1:-2]
+    if kind == b"+":
+        return payload.decode()
+    if kind == b"-":
+        return CacheError(payload.decode())
+    if kind == b":":
+        return int(payload)
+    if kind in {b"$", b"*"}:
+        length = int(payload)
+        if length < 0:
+            return None
+        if kind == b"$":
+            return (await reader.readexactly(length + 2))[:-2]
+        return [await _read_reply(reader) for _ in range(length)]
+    raise CacheError(f"Unexpected reply from the cache server: {line!r}")
+
+
+class _RedisConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *args: str | bytes | int | float) -> Any:
+        self.writer.write(_encode_command(*args))
+        await self.writer.drain()
+        return await _read_reply(self.reader)
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Talks RESP2 to a Redis-compatible server (Redis, Valkey, KeyDB, ...) over a small pool
+    of connections; invalidations travel over a pub/sub channel.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        channel: str,
+        pool_size: int = 8,
+        timeout: float = 0.5,
+        reconnect_delay: float = 1.0,
+    ):
+        super().__init__()
+        parts = urlsplit(url)
+        self.host = parts.hostname or "localhost"
+        self.port = parts.port or 6379
+        self.username = unquote(parts.username) if parts.username else None
+        self.password = unquote(parts.password) if parts.password else None
+        self.db = int(parts.path.lstrip("/") or 0)
+        self.channel = channel
+        self.timeout = timeout
+        self.reconnect_delay = reconnect_delay
+        self._slots = asyncio.Semaphore(pool_size)
+        self._idle: list[_RedisConnection] = []
+        self._listener: asyncio.Task | None = None
+
+    async def _connect(self) -> _RedisConnection:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        connection = _RedisConnection(reader, writer)
+        commands = []
+        if self.password:
+            commands.append(
+                ("AUTH", self.username, self.password)
+                if self.username
+                else ("AUTH", self.password),
+            )
+        if self.db:
+            commands.append(("SELECT", self.db))
+        for command in commands:
+            reply = await connection.execute(*command)
+            if isinstance(reply, CacheError):
+                connection.close()
+                raise reply
+        return connection
+
+    async def _execute(self, *args: str | bytes | int | float) -> Any:
+        async with self._slots:
+            connection = None
+            try:
+                async with asyncio.timeout(self.timeout):
+                    connection = self._idle.pop() if self._idle else await self._connect()
+                    reply = await connection.execute(*args)
+            except BaseException:
+                # The reply may still be on its way; the connection can't be reused
+                if connection is not None:
+                    connection.close()
+                raise
+            self._idle.append(connection)
+        if isinstance(reply, CacheError):
+            raise reply
+        return reply
+
+    async def start(self) -> None:
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                connection = await self._connect()
+                try:
+                    await connection.execute("SUBSCRIBE", self.channel)
+                    # Anything published while we were not subscribed is lost
+                    self._notify(None)
+                    while True:
+                        kind, _, message = await _read_reply(connection.reader)
+                        if kind == b"message":
+                            self._notify(message.decode())
+                finally:
+                    connection.close()
+            except (CacheError, OSError, asyncio.IncompleteReadError, ValueError) as err:
+                logger.warning(f"Cache invalidation listener disconnected: {err!r}")
+                await asyncio.sleep(self.reconnect_delay)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self._execute("GET", key)
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return await self._execute("MGET", *keys)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._execute("SET", key, value, "PX", int(ttl * 1000))
+
+    async def delete(self, key: str) -> None:
+        await self._execute("DEL", key)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        cursor = b"0"
+        while True:
+            cursor, keys = await self._execute("SCAN", cursor, "MATCH", f"{prefix}*", "COUNT", 500)
+            if keys:
+                await self._execute("DEL", *keys)
+            if cursor == b"0":
+                return
+
+    async def incr(self, key: str) -> int:
+        return await self._execute("INCR", key)
+
+    async def publish(self, message: str) -> None:
+        await self._execute("PUBLISH", self.channel, message)
+
+
+def create_cache_backend() -> CacheBackend:
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(
+            settings.CACHE_URL,
+            channel=f"{settings.CACHE_KEY_PREFIX}:invalidate",
+            pool_size=settings.CACHE_POOL_SIZE,
+            timeout=settings.CACHE_TIMEOUT,
+        )
+    return MemoryCacheBackend(settings.CACHE_LOCAL_SIZE, settings.CACHE_TTL)
+
+
+cache_backend = create_cache_backend()
+
+_BACKEND_ERRORS = (CacheError, OSError, TimeoutError, asyncio.IncompleteReadError)
+
+
+class SharedCache:
+    """
+    Cache of `model` payloads shared by all workers through the cache backend, with a
+    per-worker copy of decoded payloads in front of it.
+
+    Keys are versioned: bump `version` when the shape of `model` changes so that workers
+    running different releases don't read each other's payloads. Groups of keys can be
+    dropped at once by embedding `generation(group)` in them and calling `bump(group)`.
+    Invalidations are published to every worker and leave a mark on the key, so that a
+    load racing with one does not store what it read before it. When the backend is
+    unavailable the cache reads as empty and writes are skipped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        model: type[BaseModel],
+        *,
+        version: int = 1,
+        backend: CacheBackend = cache_backend,
+        ttl: float = settings.CACHE_TTL,
+        local_size: int = settings.CACHE_LOCAL_SIZE,
+    ):
+        self.name = name
+        self.model = model
+        self.backend = backend
+        self.ttl = ttl
+        self.prefix = f"{settings.CACHE_KEY_PREFIX}:{name}:v{version}:"
+        # Outside of `prefix`, so that clear() counts instead of resetting it
+        self.clears_key = f"{settings.CACHE_KEY_PREFIX}:{name}:v{version}~clears"
+        self.local = TTLLRUCache(local_size, ttl)
+        self.hits = 0
+        self.misses = 0
+        self.errors = 0
+        self._flights = SingleFlight()
+        backend.register(self)
+
+    def key(self, key: Hashable) -> str:
+        parts = key if isinstance(key, tuple) else (key,)
+        return self.prefix + ":".join(map(str, parts))
+
+    def evict_local(self, message: str | None) -> None:
+        if message is None:
+            self.local.clear()
+        elif message.endswith(":"):
+            self.local.invalidate_prefix(message)
+        else:
+            self.local.invalidate(message)
+
+    def _failed(self, action: str, err: Exception) -> None:
+        self.errors += 1
+        logger.warning(f"Cache {self.name}: {action} failed: {err!r}")
+
+    async def get(self, key: Hashable) -> BaseModel | None:
+        full_key = self.key(key)
+        value = self.local.get(full_key)
+        if value is not None:
+            return value
+        try:
+            payload = await self.backend.get(full_key)
+        except _BACKEND_ERRORS as err:
+            self._failed("get", err)
+            return None
+        if payload is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        value = self.model.model_validate_json(payload)
+        self.local.set(full_key, value)
+        return value
+
+    async def set(self, key: Hashable, value: BaseModel) -> None:
+        full_key = self.key(key)
+        self.local.set(full_key, value)
+        try:
+            await self.backend.set(full_key, value.model_dump_json().encode(), self.ttl)
+        except _BACKEND_ERRORS as err:
+            self._failed("set", err)
+
+    async def get_or_load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[BaseModel | None]],
+    ) -> BaseModel | None:
+        """
+        Cached value of `key`, loaded and stored on a miss. Concurrent misses of the same
+        key in this worker share one backend read and load; a failed or empty load stores
+        nothing.
+        """
+        full_key = self.key(key)
+        value = self.local.get(full_key)
+        if value is None:
+            value = await self._flights.do(full_key, lambda: self._load(key, load))
+        return value
+
+    def _marks(self, full_key: str) -> list[str]:
+        """Keys that change when `full_key` is invalidated or the cache is cleared."""
+        return [f"{full_key}~invalidated", self.clears_key]
+
+    async def _load(
+        self,
+        key: Hashable,
+        load: Callable[[], Awaitable[BaseModel | None]],
+    ) -> BaseModel | None:
+        """
+        Read the key with its invalidation marks, and on a miss load and store the value.
+        The load may have read data from before a commit whose invalidation ran meanwhile:
+        an invalidation marks the key before deleting it, so a mark moved after the store
+        means that the stored value may be stale and it is dropped again.
+        """
+        full_key = self.key(key)
+        marks = self._marks(full_key)
+        try:
+            payload, *seen = await self.backend.get_many([full_key, *marks])
+        except _BACKEND_ERRORS as err:
+            self._failed("get", err)
+            return await load()
+        if payload is not None:
+            self.hits += 1
+            value = self.model.model_validate_json(payload)
+            self.local.set(full_key, value)
+            return value
+        self.misses += 1
+
+        value = await load()
+        if value is None:
+            return value
+        await self.set(key, value)
+        try:
+            if await self.backend.get_many(marks) == seen:
+                return value
+            self.evict_local(full_key)
+            await self.backend.delete(full_key)
+        except _BACKEND_ERRORS as err:
+            self.evict_local(full_key)
+            self._failed("set", err)
+        return value
+
+    async def _evict(
+        self,
+        key: str,
+        drop: Callable[[str], Awaitable[Any]],
+        mark: Callable[[], Awaitable[Any]] | None = None,
+    ) -> None:
+        self.evict_local(key)
+        try:
+            if mark is not None:
+                await mark()
+            await drop(key)
+            await self.backend.publish(key)
+        except _BACKEND_ERRORS as err:
+            self._failed("invalidate", err)
+
+    async def invalidate(self, key: Hashable) -> None:
+        full_key = self.key(key)
+        # A fresh token rather than a counter, so that the mark expires with the entries
+        mark_key = self._marks(full_key)[0]
+        await self._evict(
+            full_key,
+            self.backend.delete,
+            lambda: self.backend.set(mark_key, uuid4().hex.encode(), self.ttl),
+        )
+
+    async def clear(self) -> None:
+        await self._evict(
+            self.prefix,
+            self.backend.delete_prefix,
+            lambda: self.backend.incr(self.clears_key),
+        )
+
+    async def generation(self, group: Hashable) -> int | None:
+        """Current generation of a group of keys, or None when the backend can't be reached
+        (nothing should be cached then)."""
+        full_key = self.key(("generation", group))
+        value = self.local.get(full_key)
+        if value is not None:
+            return value
+        try:
+            value = int(await self.backend.get(full_key) or 0)
+        except _BACKEND_ERRORS as err:
+            self._failed("generation", err)
+            return None
+        self.local.set(full_key, value)
+        return value
+
+    async def bump(self, group: Hashable) -> None:
+        """Orphans every key built with the current `generation(group)`."""
+        await self._evict(self.key(("generation", group)), self.backend.incr)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "local": self.local.stats(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "errors": self.errors,
+            "loads": self._flights.stats(),
+        }
+
+
+async def clear_caches() -> None:
+    for cache in cache_backend.caches:
+        await cache.clear()
@@ -0,0 +1,117 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+from weakref import WeakKeyDictionary
+
+from backend.app.core.config import settings
+from sqlalchemy import Executable, event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session, SessionTransaction
+
+Read = Callable[[AsyncSession], Awaitable[Any]]
+
+_semaphores: WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = WeakKeyDictionary()
+
+# Set in `Session.info` once the session's transaction has written something, be it a flush
+# or a DML statement; other connections can't see those writes until the commit
+_WROTE = "concurrency:wrote"
+
+
+@event.listens_for(Session, "after_flush")
+def _mark_flush(session: Session, flush_context: Any) -> None:
+    session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _mark_statement(orm_execute_state: ORMExecuteState) -> None:
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[_WROTE] = True
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _clear_mark(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None:
+        session.info.pop(_WROTE, None)
+
+
+def has_uncommitted_writes(session: AsyncSession) -> bool:
+    """Whether `session` has pending changes, or flushed or executed writes not yet committed."""
+    sync_session = session.sync_session
+    pending = sync_session.new or sync_session.dirty or sync_session.deleted
+    return bool(pending) or sync_session.info.get(_WROTE, False)
+
+
+def _semaphore() -> asyncio.Semaphore:
+    """Semaphore of the running loop bounding the extra connections taken by parallel reads."""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = asyncio.Semaphore(max(settings.CONCURRENT_READS_LIMIT, 0))
+        _semaphores[loop] = semaphore
+    return semaphore
+
+
+async def _run_read(session: AsyncSession, read: Read, semaphore: asyncio.Semaphore) -> Any:
+    """Run the read on its own connection and give back the slot taken for it."""
+    try:
+        async with AsyncSession(session.bind) as read_session:
+            return await read(read_session)
+    finally:
+        semaphore.release()
+
+
+async def gather_reads(session: AsyncSession, *reads: Read) -> list:
+    """
+    Run independent read-only callables, the first on `session` and the others alongside
+    it, each on an extra pooled connection.
+
+    An extra connection is only taken while the worker has a free slot of
+    CONCURRENT_READS_LIMIT; the semaphore is never waited on, so a request holding a
+    connection never blocks for another one, and reads that get no slot run after the
+    first one on `session`. A transaction of `session` that only read (like the one begun
+    by loading the current user) doesn't matter, but when it holds uncommitted writes,
+    which other connections would not see, all reads run one by one on `session`.
+    Reads on extra connections must fully load what they return before their session
+    closes.
+    """
+    if len(reads) <= 1 or has_uncommitted_writes(session):
+        return [await read(session) for read in reads]
+
+    first, *others = reads
+    semaphore = _semaphore()
+    parallel = []
+    for read in others:
+        if semaphore.locked():
+            break
+        await semaphore.acquire()  # a slot is free, so this returns without waiting
+        parallel.append(read)
+    tasks = [asyncio.create_task(_run_read(session, read, semaphore)) for read in parallel]
+    try:
+        results = [await first(session)]
+        for read in others[len(parallel) :]:
+            results.append(await read(session))
+        parallel_results = await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    return [results[0], *parallel_results, *results[1:]]
+
+
+def scalars(statement: Executable) -> Read:
+    """Read returning all scalars of the statement."""
+
+    async def read(session: AsyncSession) -> Sequence[Any]:
+        return (await session.execute(statement)).scalars().all()
+
+    return read
+
+
+def scalar(statement: Executable) -> Read:
+    """Read returning the single scalar of the statement."""
+
+    async def read(session: AsyncSession) -> Any:
+        return (await session.execute(statement)).scalar_one()
+
+    return read
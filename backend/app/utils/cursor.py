@@ -0,0 +1,23 @@
+import base64
+import binascii
+import json
+
+from fastapi import HTTPException
+
+
+def encode_cursor(payload: dict) -> str:
+    """Encode a keyset position into an opaque url-safe cursor."""
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """Decode a cursor produced by `encode_cursor`."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError) as err:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from err
+    if not isinstance(payload, dict):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return payload
@@ -0,0 +1,114 @@
+import hashlib
+import re
+from datetime import UTC, datetime
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import HTTPException, Request, Response, status
+
+# Long enough to count as forever for browsers and proxies
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+_BYTE_RANGE = re.compile(r"bytes=(\d*)-(\d*)", re.IGNORECASE)
+
+
+def make_etag(*parts: object) -> str:
+    """Weak entity tag derived from the given version parts (or a whole payload)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(part if isinstance(part, bytes) else str(part).encode())
+        digest.update(b"\0")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored naive, in server time, which is UTC in our deployments
+    return value.replace(tzinfo=UTC) if value.tzinfo is None else value.astimezone(UTC)
+
+
+def validator_headers(
+    etag: str,
+    last_modified: datetime | None = None,
+    private: bool = False,
+) -> dict[str, str]:
+    """
+    Validator headers of a response that clients and proxies may store but must
+    revalidate before reuse.
+    """
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, no-cache" if private else "no-cache",
+        "Vary": "Authorization",
+    }
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def immutable_headers(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    """
+    Validator headers of a response that never changes under its URL, so that anyone may
+    store it for a year without revalidating.
+    """
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={IMMUTABLE_MAX_AGE}, immutable"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(",")
+    )
+
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime | None = None) -> bool:
+    """
+    Whether a GET can be answered with 304. If-None-Match wins over If-Modified-Since when
+    both are sent.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    # Last-Modified has a one second resolution
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
+def parse_byte_range(value: str | None, size: int) -> tuple[int, int] | None:
+    """
+    First and last byte (inclusive) of a single `bytes=` range of a body of `size` bytes,
+    or None to send the whole body: no header, a malformed one or several ranges.
+    Raises 416 when the range starts past the end of the body.
+    """
+    match = _BYTE_RANGE.fullmatch(value.strip()) if value else None
+    if match is None or not any(match.groups()):
+        return None
+    first, last = match.groups()
+    if first:
+        start, end = int(first), int(last) if last else size - 1
+        if last and end < start:
+            return None
+    else:
+        # A suffix: the last N bytes, none of which exist when N is 0
+        suffix = int(last)
+        start, end = (max(size - suffix, 0) if suffix else size), size - 1
+    if start >= size:
+        raise HTTPException(
+            status_code=416,
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    return start, min(end, size - 1)
@@ -1,29 +1,76 @@
+import asyncio
+import base64
+import hashlib
+import time
 import uuid
 from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
 from aiobotocore.session import get_session
 from backend.app.core.config import settings
+from backend.app.db.schemas import (
+    PENDING_UPLOAD_PREFIX,
+    PresignedUpload,
+    PresignedUploadComplete,
+    PresignedUploadPart,
+)
+from backend.app.utils.cache import TTLLRUCache
+from backend.app.utils.logger import logger
 from botocore.config import Config
 from fastapi import HTTPException, UploadFile
 
 
 class MinIOClient:
-    def __init__(self):
+    def __init__(self, client=None):
         self.bucket_name = settings.MINIO_BUCKET
         self.endpoint_url = settings.MINIO_ENDPOINT
         self.access_key = settings.MINIO_ACCESS_KEY
         self.secret_key = settings.MINIO_SECRET_KEY
         self.session = get_session()
+        self.config = Config(
+            signature_version="s3v4",
+            max_pool_connections=settings.MINIO_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.MINIO_CONNECT_TIMEOUT,
+            read_timeout=settings.MINIO_READ_TIMEOUT,
+            retries={"total_max_attempts": settings.MINIO_MAX_ATTEMPTS, "mode": "standard"},
+        )
+        # An already open client (such as a test double) is used as the shared one
+        self._client = client
+        self._exit_stack: AsyncExitStack | None = None
+        self.url_cache = TTLLRUCache(
+            maxsize=settings.MINIO_PRESIGNED_URL_CACHE_SIZE,
+            ttl=settings.MINIO_PRESIGNED_URL_EXPIRES - settings.MINIO_PRESIGNED_URL_SLACK,
+        )
 
-    async def _get_client(self) -> AsyncGenerator:
-        """Create and return an async S3 client."""
-        async with self.session.create_client(
+    def _create_client(self):
+        return self.session.create_client(
             "s3",
             endpoint_url=self.endpoint_url,
             aws_access_key_id=self.access_key,
             aws_secret_access_key=self.secret_key,
-            config=Config(signature_version="s3v4"),
-        ) as client:
+            config=self.config,
+        )
+
+    async def start(self) -> None:
+        """Open the client shared by all requests for the app lifetime."""
+        if self._client is not None:
+            return
+        self._exit_stack = AsyncExitStack()
+        self._client = await self._exit_stack.enter_async_context(self._create_client())
+
+    async def close(self) -> None:
+        """Close the shared client and its connection pool."""
+        if self._exit_stack is not None:
+            await self._exit_stack.aclose()
+        self._client = None
+        self._exit_stack = None
+
+    async def _get_client(self) -> AsyncGenerator:
+        """Yield the shared client, or a short-lived one when it hasn't been started."""
+        if self._client is not None:
+            yield self._client
+            return
+        async with self._create_client() as client:
             yield client
 
     async def initialize_bucket(self):
@@ -37,20 +84,156 @@ class MinIOClient:
                     await client.create_bucket(Bucket=self.bucket_name)
                 else:
                     raise
+            await self._expire_pending_uploads(client)
+
+    async def _expire_pending_uploads(self, client) -> None:
+        """
+        Let the bucket drop direct uploads that were never completed. The rule is merged
+        into the bucket's lifecycle configuration, keeping the rules set up by others.
+        """
+        rule = {
+            "ID": "expire-pending-uploads",
+            "Filter": {"Prefix": PENDING_UPLOAD_PREFIX},
+            "Status": "Enabled",
+            "Expiration": {"Days": 1},
+            "AbortIncompleteMultipartUpload": {"DaysAfterInitiation": 1},
+        }
+        try:
+            rules = await self._lifecycle_rules(client)
+            if rule in rules:
+                return
+            await client.put_bucket_lifecycle_configuration(
+                Bucket=self.bucket_name,
+                LifecycleConfiguration={
+                    "Rules": [other for other in rules if other.get("ID") != rule["ID"]] + [rule],
+                },
+            )
+        except client.exceptions.ClientError as e:
+            logger.warning(f"Could not set the lifecycle of pending uploads: {e}")
+
+    async def _lifecycle_rules(self, client) -> list[dict]:
+        try:
+            response = await client.get_bucket_lifecycle_configuration(Bucket=self.bucket_name)
+        except client.exceptions.ClientError as e:
+            if e.response["Error"]["Code"] == "NoSuchLifecycleConfiguration":
+                return []
+            raise
+        return response["Rules"]
 
     async def upload_file(self, file: UploadFile, prefix: str = "") -> str:
-        """Upload a file to MinIO and return the object key."""
+        """
+        Stream a file to MinIO and return the object key. Files larger than one part go
+        through a multipart upload; each request carries a Content-MD5 for the server to
+        check, and the size is capped at MINIO_MAX_UPLOAD_SIZE.
+        """
+        if file.size is not None and file.size > settings.MINIO_MAX_UPLOAD_SIZE:
+            raise _too_large()
         file_key = f"{uuid.uuid4()}"
-        file_content = await file.read()
+        part_size = settings.MINIO_UPLOAD_PART_SIZE
 
+        first = await file.read(part_size)
+        second = await file.read(part_size)
         async for client in self._get_client():
-            await client.put_object(
+            if not second:
+                await client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=file_key,
+                    Body=first,
+                    ContentType=file.content_type,
+                    ContentMD5=_content_md5(first),
+                )
+            else:
+                await self._upload_multipart(client, file_key, file, [first, second])
+        return file_key
+
+    async def _upload_multipart(
+        self,
+        client,
+        file_key: str,
+        file: UploadFile,
+        parts: list[bytes],
+    ) -> None:
+        upload = await client.create_multipart_upload(
+            Bucket=self.bucket_name,
+            Key=file_key,
+            ContentType=file.content_type,
+        )
+        upload_id = upload["UploadId"]
+        try:
+            uploaded = await self._upload_parts(client, file_key, upload_id, file, parts)
+            await client.complete_multipart_upload(
                 Bucket=self.bucket_name,
                 Key=file_key,
-                Body=file_content,
-                ContentType=file.content_type,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": uploaded},
             )
-        return file_key
+        except BaseException:
+            # Otherwise the parts already stored would linger in the bucket
+            await asyncio.shield(
+                client.abort_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=file_key,
+                    UploadId=upload_id,
+                ),
+            )
+            raise
+
+    async def _upload_parts(
+        self,
+        client,
+        file_key: str,
+        upload_id: str,
+        file: UploadFile,
+        parts: list[bytes],
+    ) -> list[dict]:
+        """
+        Upload the parts concurrently. A part is read only once a slot is free, so at
+        most MINIO_UPLOAD_CONCURRENCY parts are held in memory.
+        """
+        slots = asyncio.Semaphore(settings.MINIO_UPLOAD_CONCURRENCY)
+        uploaded: dict[int, str] = {}
+        errors: list[BaseException] = []
+
+        async def upload_part(number: int, body: bytes) -> None:
+            try:
+                response = await client.upload_part(
+                    Bucket=self.bucket_name,
+                    Key=file_key,
+                    UploadId=upload_id,
+                    PartNumber=number,
+                    Body=body,
+                    ContentMD5=_content_md5(body),
+                )
+                uploaded[number] = response["ETag"]
+            except Exception as err:
+                errors.append(err)
+            finally:
+                slots.release()
+
+        tasks = []
+        size = 0
+        try:
+            while True:
+                await slots.acquire()
+                if errors:
+                    raise errors[0]
+                body = parts.pop(0) if parts else await file.read(settings.MINIO_UPLOAD_PART_SIZE)
+                if not body:
+                    slots.release()
+                    break
+                size += len(body)
+                if size > settings.MINIO_MAX_UPLOAD_SIZE:
+                    raise _too_large()
+                tasks.append(asyncio.create_task(upload_part(len(tasks) + 1, body)))
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        if errors:
+            raise errors[0]
+        return [{"PartNumber": number, "ETag": uploaded[number]} for number in sorted(uploaded)]
 
     async def get_file_url(self, file_key: str, expires_in: int = 3600) -> str:
         """Generate a presigned URL for a file."""
@@ -62,16 +245,157 @@ class MinIOClient:
             )
             return url
 
+    async def get_cached_file_url(self, file_key: str) -> tuple[str, int]:
+        """
+        Presigned GET URL of a file, reused by this worker until shortly before it
+        expires, and the number of seconds it can still be handed out for.
+        """
+        cached = self.url_cache.get(file_key)
+        if cached is None:
+            url = await self.get_file_url(file_key, settings.MINIO_PRESIGNED_URL_EXPIRES)
+            cached = (url, time.monotonic() + self.url_cache.ttl)
+            self.url_cache.set(file_key, cached)
+        url, reusable_until = cached
+        return url, max(int(reusable_until - time.monotonic()), 0)
+
+    async def create_presigned_upload(self, content_type: str, size: int) -> PresignedUpload:
+        """
+        Let the client upload a file straight to the bucket. The object goes under a
+        pending key and only becomes usable once `complete_presigned_upload` verified it.
+        Files of one part get a POST policy pinning their type and size; larger ones a
+        multipart upload with a presigned URL per part.
+        """
+        _check_upload(content_type, size)
+        upload_key = f"{PENDING_UPLOAD_PREFIX}{uuid.uuid4()}"
+        expires_in = settings.MINIO_PRESIGNED_UPLOAD_EXPIRES
+        part_size = settings.MINIO_UPLOAD_PART_SIZE
+
+        async for client in self._get_client():
+            if size <= part_size:
+                post = await client.generate_presigned_post(
+                    Bucket=self.bucket_name,
+                    Key=upload_key,
+                    Fields={"Content-Type": content_type},
+                    Conditions=[
+                        {"Content-Type": content_type},
+                        ["content-length-range", size, size],
+                    ],
+                    ExpiresIn=expires_in,
+                )
+                return PresignedUpload(
+                    upload_key=upload_key,
+                    expires_in=expires_in,
+                    url=post["url"],
+                    fields=post["fields"],
+                )
+
+            upload = await client.create_multipart_upload(
+                Bucket=self.bucket_name,
+                Key=upload_key,
+                ContentType=content_type,
+            )
+            parts = [
+                PresignedUploadPart(
+                    part_number=number,
+                    url=await client.generate_presigned_url(
+                        ClientMethod="upload_part",
+                        Params={
+                            "Bucket": self.bucket_name,
+                            "Key": upload_key,
+                            "UploadId": upload["UploadId"],
+                            "PartNumber": number,
+                        },
+                        ExpiresIn=expires_in,
+                    ),
+                )
+                for number in range(1, -(-size // part_size) + 1)
+            ]
+            return PresignedUpload(
+                upload_key=upload_key,
+                expires_in=expires_in,
+                upload_id=upload["UploadId"],
+                part_size=part_size,
+                parts=parts,
+            )
+
+    async def complete_presigned_upload(self, upload_in: PresignedUploadComplete) -> str:
+        """
+        Check a direct upload with a HEAD request and move it to its final key, which is
+        returned. Uploads of a wrong type or size are deleted.
+        """
+        upload_key = upload_in.upload_key
+        if not upload_key.startswith(PENDING_UPLOAD_PREFIX):
+            raise HTTPException(status_code=400, detail="Not a pending upload")
+        file_key = upload_key.removeprefix(PENDING_UPLOAD_PREFIX)
+
+        async for client in self._get_client():
+            if upload_in.upload_id is not None:
+                try:
+                    await client.complete_multipart_upload(
+                        Bucket=self.bucket_name,
+                        Key=upload_key,
+                        UploadId=upload_in.upload_id,
+                        MultipartUpload={
+                            "Parts": [
+                                {"PartNumber": part.part_number, "ETag": part.etag}
+                                for part in upload_in.parts or []
+                            ],
+                        },
+                    )
+                except client.exceptions.ClientError as err:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Could not complete the upload: {err.response['Error']['Code']}",
+                    ) from err
+
+            try:
+                head = await client.head_object(Bucket=self.bucket_name, Key=upload_key)
+            except client.exceptions.ClientError as err:
+                raise HTTPException(status_code=404, detail="Upload not found") from err
+            try:
+                _check_upload(head.get("ContentType", ""), head["ContentLength"])
+            except HTTPException:
+                await client.delete_object(Bucket=self.bucket_name, Key=upload_key)
+                raise
+
+            # A server-side copy: the bytes don't pass through the API
+            await client.copy_object(
+                Bucket=self.bucket_name,
+                Key=file_key,
+                CopySource={"Bucket": self.bucket_name, "Key": upload_key},
+            )
+            await client.delete_object(Bucket=self.bucket_name, Key=upload_key)
+        return file_key
+
     async def delete_file(self, file_key: str):
         """Delete a file from MinIO."""
         async for client in self._get_client():
             await client.delete_object(Bucket=self.bucket_name, Key=file_key)
 
-    async def download_file(self, file_key: str) -> AsyncGenerator[bytes, None]:
-        """Download a file from MinIO as a stream."""
+    async def head_file(self, file_key: str) -> dict:
+        """Metadata of a stored file: ContentLength, ContentType, ETag, LastModified."""
+        async for client in self._get_client():
+            try:
+                return await client.head_object(Bucket=self.bucket_name, Key=file_key)
+            except client.exceptions.ClientError as err:
+                if err.response["Error"]["Code"] in ("404", "NoSuchKey"):
+                    raise HTTPException(status_code=404, detail="File not found") from err
+                raise
+
+    async def download_file(
+        self,
+        file_key: str,
+        byte_range: tuple[int, int] | None = None,
+    ) -> AsyncGenerator[bytes, None]:
+        """Download a file, or the given inclusive range of its bytes, from MinIO as a stream."""
+        params = {"Range": "bytes={}-{}".format(*byte_range)} if byte_range else {}
         async for client in self._get_client():
             try:
-                response = await client.get_object(Bucket=self.bucket_name, Key=file_key)
+                response = await client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=file_key,
+                    **params,
+                )
                 async for chunk in response["Body"].iter_chunks():
                     yield chunk
             except client.exceptions.NoSuchKey as err:
@@ -87,5 +411,23 @@ class MinIOClient:
                     response["Body"].close()
 
 
+def _content_md5(body: bytes) -> str:
+    return base64.b64encode(hashlib.md5(body, usedforsecurity=False).digest()).decode()
+
+
+def _check_upload(content_type: str, size: int) -> None:
+    if content_type not in settings.MINIO_UPLOAD_CONTENT_TYPES:
+        raise HTTPException(status_code=400, detail=f"Unsupported content type {content_type}")
+    if size > settings.MINIO_MAX_UPLOAD_SIZE:
+        raise _too_large()
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=413,
+        detail=f"File is larger than {settings.MINIO_MAX_UPLOAD_SIZE} bytes",
+    )
+
+
 # Singleton instance
 minio_client = MinIOClient()
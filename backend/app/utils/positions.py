@@ -0,0 +1,26 @@
+# Sparse ordering keys. Rows are kept POSITION_GAP apart, so a row can be placed between
+# two neighbours by writing its own key only. When two neighbours have no room left the
+# whole list is spaced out again.
+
+POSITION_GAP = 1024
+
+
+def spaced_positions(count: int) -> list[int]:
+    """Evenly spaced keys for a list of `count` rows."""
+    return [index * POSITION_GAP for index in range(count)]
+
+
+def position_between(before: int | None, after: int | None) -> int | None:
+    """
+    A key ordering strictly between two neighbours (either may be missing at the ends of
+    the list), or None when they are adjacent and the list needs spacing out.
+    """
+    if before is None and after is None:
+        return 0
+    if before is None:
+        return after - POSITION_GAP
+    if after is None:
+        return before + POSITION_GAP
+    if after - before < 2:
+        return None
+    return (before + after) // 2
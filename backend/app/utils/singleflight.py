@@ -0,0 +1,52 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent loads of the same key within one worker: the first caller runs
+    the load, callers arriving while it is in flight await its outcome instead of running
+    their own. Results and errors are shared with the waiters but never kept afterwards.
+
+    Waiters get what the first caller's load produced, so the load must not depend on
+    who is asking.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Future] = {}
+        self.loads = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, load: Callable[[], Awaitable[Any]]) -> Any:
+        while (future := self._calls.get(key)) is not None:
+            self.coalesced += 1
+            try:
+                # Shielded, so that a waiter going away doesn't cancel the shared call
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The caller running the load went away; try again
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        self.loads += 1
+        try:
+            result = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # Nobody may be waiting; don't let asyncio report the error as unretrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+    def stats(self) -> dict[str, int]:
+        return {"in_flight": len(self._calls), "loads": self.loads, "coalesced": self.coalesced}
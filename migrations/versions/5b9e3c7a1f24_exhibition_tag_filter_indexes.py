@@ -0,0 +1,31 @@
+"""exhibition tag filter indexes
+
+Revision ID: 5b9e3c7a1f24
+Revises: e2b7f4a0d813
+Create Date: 2026-10-18 13:02:17.480362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5b9e3c7a1f24'
+down_revision: Union[str, None] = 'e2b7f4a0d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_exhibition_tags_tag_id_exhibition_id', 'exhibition_tags', ['tag_id', 'exhibition_id'], unique=False)
+    op.create_index('ix_tags_name', 'tags', ['name'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tags_name', table_name='tags')
+    op.drop_index('ix_exhibition_tags_tag_id_exhibition_id', table_name='exhibition_tags')
@@ -0,0 +1,134 @@
+"""exhibition catalogue cards
+
+Revision ID: 7c1f5d2e9a36
+Revises: 5b9e3c7a1f24
+Create Date: 2026-10-18 14:11:52.093415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1f5d2e9a36'
+down_revision: Union[str, None] = '5b9e3c7a1f24'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('exhibition_catalogue_cards',
+    sa.Column('exhibition_id', sa.Uuid(), nullable=False),
+    sa.Column('organization_id', sa.Uuid(), nullable=True),
+    sa.Column('title', sqlmodel.sql.sqltypes.AutoString(length=255), nullable=False),
+    sa.Column('rating', sa.Float(), nullable=False),
+    sa.Column('likes_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('tag_ids', postgresql.ARRAY(sa.Uuid()), nullable=False),
+    sa.Column('tag_names', postgresql.ARRAY(sa.String()), nullable=False),
+    sa.Column('document', postgresql.TSVECTOR(), nullable=False),
+    sa.Column('card', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.ForeignKeyConstraint(['exhibition_id'], ['exhibitions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('exhibition_id')
+    )
+    op.execute(
+        """
+        INSERT INTO exhibition_catalogue_cards (
+            exhibition_id, organization_id, title, rating, likes_count, created_at,
+            tag_ids, tag_names, document, card
+        )
+        SELECT
+            e.id,
+            e.organization_id,
+            e.title,
+            e.rating,
+            e.likes_count,
+            e.created_at,
+            coalesce((
+                SELECT array_agg(et.tag_id) FROM exhibition_tags et WHERE et.exhibition_id = e.id
+            ), '{}'),
+            coalesce((
+                SELECT array_agg(t.name)
+                FROM tags t JOIN exhibition_tags et ON et.tag_id = t.id
+                WHERE et.exhibition_id = e.id
+            ), '{}'),
+            d.document,
+            jsonb_build_object(
+                'title', e.title,
+                'description', e.description,
+                'cover_image_key', e.cover_image_key,
+                'cover_type', e.cover_type,
+                'status', e.status,
+                'rating', e.rating,
+                'settings', e.settings,
+                'id', e.id,
+                'organization_id', e.organization_id,
+                'created_at', e.created_at,
+                'updated_at', e.updated_at,
+                'participants', coalesce((
+                    SELECT json_agg(json_build_object(
+                        'name', p.name,
+                        'id', p.id,
+                        'exhibition_id', p.exhibition_id,
+                        'created_at', p.created_at
+                    ) ORDER BY p.created_at)
+                    FROM exhibition_participants p
+                    WHERE p.exhibition_id = e.id
+                ), '[]'::json),
+                'tags', coalesce((
+                    SELECT json_agg(json_build_object(
+                        'name', t.name,
+                        'id', t.id,
+                        'created_at', t.created_at
+                    ) ORDER BY t.name)
+                    FROM exhibition_tags et JOIN tags t ON et.tag_id = t.id
+                    WHERE et.exhibition_id = e.id
+                ), '[]'::json),
+                'is_liked_by_current_user', NULL,
+                'blocks', coalesce((
+                    SELECT json_agg(json_build_object(
+                        'type', b.type,
+                        'content', b.content,
+                        'settings', b.settings,
+                        'position', b.position,
+                        'id', b.id,
+                        'created_at', b.created_at,
+                        'updated_at', b.updated_at,
+                        'items', coalesce((
+                            SELECT json_agg(json_build_object(
+                                'image_key', i.image_key,
+                                'text', i.text,
+                                'position', i.position
+                            ) ORDER BY i.position)
+                            FROM exhibition_block_items i
+                            WHERE i.block_id = b.id
+                        ), '[]'::json)
+                    ) ORDER BY b.position)
+                    FROM exhibition_blocks b
+                    WHERE b.exhibition_id = e.id
+                ), '[]'::json)
+            )
+        FROM exhibitions e
+        JOIN exhibition_search_documents d ON d.exhibition_id = e.id
+        WHERE e.status = 'published'
+        """
+    )
+    op.create_index('ix_exhibition_catalogue_cards_created_at_id', 'exhibition_catalogue_cards', ['created_at', 'exhibition_id'], unique=False)
+    op.create_index('ix_exhibition_catalogue_cards_rating_id', 'exhibition_catalogue_cards', ['rating', 'exhibition_id'], unique=False)
+    op.create_index('ix_exhibition_catalogue_cards_title_id', 'exhibition_catalogue_cards', ['title', 'exhibition_id'], unique=False)
+    op.create_index('ix_exhibition_catalogue_cards_likes_count_id', 'exhibition_catalogue_cards', ['likes_count', 'exhibition_id'], unique=False)
+    op.create_index(op.f('ix_exhibition_catalogue_cards_organization_id'), 'exhibition_catalogue_cards', ['organization_id'], unique=False)
+    op.create_index('ix_exhibition_catalogue_cards_tag_ids', 'exhibition_catalogue_cards', ['tag_ids'], unique=False, postgresql_using='gin')
+    op.create_index('ix_exhibition_catalogue_cards_tag_names', 'exhibition_catalogue_cards', ['tag_names'], unique=False, postgresql_using='gin')
+    op.create_index('ix_exhibition_catalogue_cards_document', 'exhibition_catalogue_cards', ['document'], unique=False, postgresql_using='gin')
+    op.create_index('ix_exhibition_catalogue_cards_title_trgm', 'exhibition_catalogue_cards', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('exhibition_catalogue_cards')
@@ -0,0 +1,29 @@
+"""user exhibition likes user index
+
+Revision ID: 9d4e2b6c8f17
+Revises: 7c1f5d2e9a36
+Create Date: 2026-10-18 17:21:44.203915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4e2b6c8f17'
+down_revision: Union[str, None] = '7c1f5d2e9a36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_user_exhibition_likes_user_id_created_at', 'user_exhibition_likes', ['user_id', 'created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_exhibition_likes_user_id_created_at', table_name='user_exhibition_likes')
@@ -0,0 +1,94 @@
+"""unique tag names
+
+Revision ID: a3e6f0c2d5b8
+Revises: 9d4e2b6c8f17
+Create Date: 2026-10-18 18:05:12.640331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e6f0c2d5b8'
+down_revision: Union[str, None] = '9d4e2b6c8f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Names are now stored lowercased and stripped, and concurrent creates could store the
+    # same name twice: keep the oldest tag of each normalized name
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE tag_duplicates ON COMMIT DROP AS
+        SELECT id AS duplicate_id, keeper_id
+        FROM (
+            SELECT
+                id,
+                first_value(id) OVER (
+                    PARTITION BY lower(btrim(name)) ORDER BY created_at, id
+                ) AS keeper_id
+            FROM tags
+        ) AS ranked
+        WHERE id <> keeper_id
+        """
+    )
+    # Tags whose cards change: merged duplicates and kept tags that get renamed
+    op.execute(
+        """
+        CREATE TEMPORARY TABLE changed_tags ON COMMIT DROP AS
+        SELECT duplicate_id AS tag_id FROM tag_duplicates
+        UNION
+        SELECT id FROM tags
+        WHERE name <> lower(btrim(name))
+            AND id NOT IN (SELECT duplicate_id FROM tag_duplicates)
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO exhibition_tags (exhibition_id, tag_id)
+        SELECT et.exhibition_id, d.keeper_id
+        FROM exhibition_tags et JOIN tag_duplicates d ON d.duplicate_id = et.tag_id
+        ON CONFLICT DO NOTHING
+        """
+    )
+    op.execute("DELETE FROM tags WHERE id IN (SELECT duplicate_id FROM tag_duplicates)")
+    op.execute("UPDATE tags SET name = lower(btrim(name)) WHERE name <> lower(btrim(name))")
+    op.execute(
+        """
+        UPDATE exhibition_catalogue_cards c
+        SET
+            tag_ids = coalesce((
+                SELECT array_agg(et.tag_id) FROM exhibition_tags et
+                WHERE et.exhibition_id = c.exhibition_id
+            ), '{}'),
+            tag_names = coalesce((
+                SELECT array_agg(t.name)
+                FROM tags t JOIN exhibition_tags et ON et.tag_id = t.id
+                WHERE et.exhibition_id = c.exhibition_id
+            ), '{}'),
+            card = jsonb_set(c.card, '{tags}', coalesce((
+                SELECT jsonb_agg(jsonb_build_object(
+                    'name', t.name,
+                    'id', t.id,
+                    'created_at', t.created_at
+                ) ORDER BY t.name)
+                FROM exhibition_tags et JOIN tags t ON et.tag_id = t.id
+                WHERE et.exhibition_id = c.exhibition_id
+            ), '[]'::jsonb))
+        WHERE c.tag_ids && ARRAY(SELECT tag_id FROM changed_tags)
+        """
+    )
+    op.drop_index('ix_tags_name', table_name='tags')
+    op.create_index('ix_tags_name', 'tags', ['name'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tags_name', table_name='tags')
+    op.create_index('ix_tags_name', 'tags', ['name'], unique=False)
@@ -0,0 +1,43 @@
+"""exhibition likes_count
+
+Revision ID: c47e9a13b5d8
+Revises: 8a2d4e6f1c90
+Create Date: 2026-10-18 11:40:05.617724
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47e9a13b5d8'
+down_revision: Union[str, None] = '8a2d4e6f1c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('exhibitions', sa.Column('likes_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE exhibitions
+        SET likes_count = likes.likes_count
+        FROM (
+            SELECT exhibition_id, count(user_id) AS likes_count
+            FROM user_exhibition_likes
+            GROUP BY exhibition_id
+        ) AS likes
+        WHERE exhibitions.id = likes.exhibition_id
+        """
+    )
+    op.create_index('ix_exhibitions_likes_count_id', 'exhibitions', ['likes_count', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_exhibitions_likes_count_id', table_name='exhibitions')
+    op.drop_column('exhibitions', 'likes_count')
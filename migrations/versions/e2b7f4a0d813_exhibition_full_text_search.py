@@ -0,0 +1,75 @@
+"""exhibition full-text search
+
+Revision ID: e2b7f4a0d813
+Revises: c47e9a13b5d8
+Create Date: 2026-10-18 12:25:41.203918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+from sqlalchemy.dialects import postgresql
+
+from backend.app.core.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2b7f4a0d813'
+down_revision: Union[str, None] = 'c47e9a13b5d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    op.create_table('exhibition_search_documents',
+    sa.Column('exhibition_id', sa.Uuid(), nullable=False),
+    sa.Column('document', postgresql.TSVECTOR(), nullable=False),
+    sa.ForeignKeyConstraint(['exhibition_id'], ['exhibitions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('exhibition_id')
+    )
+    # Same text search configuration as the documents the app writes later on
+    op.execute(sa.text(
+        """
+        INSERT INTO exhibition_search_documents (exhibition_id, document)
+        SELECT
+            e.id,
+            setweight(to_tsvector(CAST(:config AS regconfig), coalesce(e.title, '')), 'A')
+            || setweight(to_tsvector(CAST(:config AS regconfig), coalesce((
+                SELECT string_agg(t.name, ' ')
+                FROM tags t JOIN exhibition_tags et ON et.tag_id = t.id
+                WHERE et.exhibition_id = e.id
+            ), '')), 'B')
+            || setweight(to_tsvector(CAST(:config AS regconfig), coalesce((
+                SELECT string_agg(p.name, ' ')
+                FROM exhibition_participants p
+                WHERE p.exhibition_id = e.id
+            ), '')), 'B')
+            || setweight(to_tsvector(CAST(:config AS regconfig), coalesce(e.description, '')), 'C')
+            || setweight(to_tsvector(CAST(:config AS regconfig), coalesce((
+                SELECT string_agg(b.content, ' ')
+                FROM exhibition_blocks b
+                WHERE b.exhibition_id = e.id
+            ), '')), 'D')
+            || setweight(to_tsvector(CAST(:config AS regconfig), coalesce((
+                SELECT string_agg(i.text, ' ')
+                FROM exhibition_block_items i JOIN exhibition_blocks b ON i.block_id = b.id
+                WHERE b.exhibition_id = e.id
+            ), '')), 'D')
+        FROM exhibitions e
+        """
+    ).bindparams(config=settings.SEARCH_TEXT_CONFIG))
+    op.create_index('ix_exhibition_search_documents_document', 'exhibition_search_documents', ['document'], unique=False, postgresql_using='gin')
+    op.create_index('ix_exhibitions_title_trgm', 'exhibitions', ['title'], unique=False, postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_organizations_name_trgm', 'organizations', ['name'], unique=False, postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_organizations_name_trgm', table_name='organizations')
+    op.drop_index('ix_exhibitions_title_trgm', table_name='exhibitions')
+    op.drop_index('ix_exhibition_search_documents_document', table_name='exhibition_search_documents')
+    op.drop_table('exhibition_search_documents')
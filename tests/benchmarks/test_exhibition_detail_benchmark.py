@@ -0,0 +1,78 @@
+"""
+Benchmark for the exhibition detail loader.
+
+Shows how `get_exhibition` latency grows with the number of blocks and checks that
+the number of statements stays constant. Run with `pytest -s tests/benchmarks` to see
+the timings table.
+"""
+
+import statistics
+import time
+
+import pytest
+from backend.app.crud import exhibition as exhibition_crud
+from backend.app.db.models.exhibition import Exhibition
+from backend.app.db.models.exhibition_block import ExhibitionBlock
+from backend.app.db.models.exhibition_block_item import ExhibitionBlockItem
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+BLOCK_COUNTS = (1, 10, 40, 100)
+ITEMS_PER_BLOCK = 3
+RUNS = 10
+
+
+async def _create_exhibition(session: AsyncSession, block_count: int) -> Exhibition:
+    exhibition = Exhibition(
+        title=f"Benchmark {block_count}",
+        cover_image_key="cover-key",
+        settings={},
+    )
+    session.add(exhibition)
+    await session.flush()
+    for position in range(block_count):
+        block = ExhibitionBlock(
+            exhibition_id=exhibition.id,
+            type="CAROUSEL",
+            content=f"block {position}",
+            settings={},
+            position=position,
+        )
+        session.add(block)
+        await session.flush()
+        session.add_all(
+            ExhibitionBlockItem(block_id=block.id, image_key=f"image-{i}", position=i)
+            for i in range(ITEMS_PER_BLOCK)
+        )
+    await session.commit()
+    return exhibition
+
+
+@pytest.mark.asyncio
+async def test_exhibition_detail_latency_by_block_count(db_session: AsyncSession, test_engine):
+    statements = []
+
+    def _count_statement(*args, **kwargs):
+        statements.append(1)
+
+    results = []
+    for block_count in BLOCK_COUNTS:
+        exhibition = await _create_exhibition(db_session, block_count)
+
+        event.listen(test_engine.sync_engine, "before_cursor_execute", _count_statement)
+        statements.clear()
+        timings = []
+        for _ in range(RUNS):
+            started = time.perf_counter()
+            loaded = await exhibition_crud.get_exhibition(db_session, id=exhibition.id)
+            timings.append((time.perf_counter() - started) * 1000)
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _count_statement)
+
+        assert len(loaded.blocks) == block_count
+        results.append((block_count, statistics.median(timings), len(statements) // RUNS))
+
+    print("\nblocks | median ms | statements")
+    for block_count, median_ms, statements_per_call in results:
+        print(f"{block_count:>6} | {median_ms:>9.2f} | {statements_per_call:>10}")
+
+    assert all(statements_per_call == 1 for _, _, statements_per_call in results)
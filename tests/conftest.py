@@ -1,9 +1,11 @@
 import pytest
 import pytest_asyncio
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 from backend.app.core.config import settings
+from backend.app.utils.cache import clear_caches
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -25,6 +27,7 @@ def session_factory(test_engine):
 @pytest_asyncio.fixture(scope="function")
 async def setup_db(test_engine):
     async with test_engine.begin() as conn:
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
 
@@ -37,3 +40,4 @@ async def db_session(session_factory, setup_db):
         async with session.begin():
             for table in reversed(SQLModel.metadata.sorted_tables):
                 await session.execute(table.delete())
+        await clear_caches()
@@ -0,0 +1,694 @@
+import json
+from uuid import uuid4
+
+import pytest
+from backend.app.api.dependencies.exhibition.filters import FilterParams, SortParams
+from backend.app.api.dependencies.pagination import CountMode
+from backend.app.crud import exhibition as exhibition_crud
+from backend.app.crud import exhibition_block as exhibition_block_crud
+from backend.app.crud import user as user_crud
+from backend.app.crud.admin import exhibition as admin_exhibition_crud
+from backend.app.crud.exhibition_search import refresh_search_document
+from backend.app.crud.exhibition_tag import create_or_exist_exhibition_tags
+from backend.app.crud.tag import tag_cache
+from backend.app.db.models.exhibition import (
+    Exhibition,
+    ExhibitionCreate,
+    ExhibitionStatusEnum,
+    ExhibitionUpdate,
+)
+from backend.app.db.models.exhibition_block import (
+    ExhibitionBlock,
+    ExhibitionBlockCreate,
+    ExhibitionBlockImport,
+    ExhibitionBlockItemCreate,
+    ExhibitionBlockUpdate,
+)
+from backend.app.db.models.exhibition_block_item import ExhibitionBlockItem
+from backend.app.db.models.exhibition_participant import ExhibitionParticipant
+from backend.app.db.models.exhibition_tag import ExhibitionTag
+from backend.app.db.models.organization import Organization, OrganizationCreate
+from backend.app.db.models.tag import Tag
+from backend.app.db.models.user import User
+from backend.app.db.models.user_exhibition_like import UserExhibitionLike
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+TEST_EXHIBITION_TITLE = "Test Exhibition"
+TEST_EXHIBITION_COVER = "cover-key"
+TEST_PARTICIPANT_NAME = "Test Participant"
+TEST_TAG_NAME = "art"
+
+
+@pytest.fixture
+async def test_organization(db_session: AsyncSession) -> Organization:
+    org_data = OrganizationCreate(name="Test Organization", email="test@gmail.com")
+    org = Organization(**org_data.model_dump())
+    db_session.add(org)
+    await db_session.commit()
+    await db_session.refresh(org)
+    return org
+
+
+@pytest.fixture
+async def test_user(db_session: AsyncSession) -> User:
+    user = User(email="user@gmail.com", name="Test", surname="User", patronymic="Testovich")
+    db_session.add(user)
+    await db_session.commit()
+    await db_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+async def test_exhibition(db_session: AsyncSession, test_organization) -> Exhibition:
+    exhibition = Exhibition(
+        title=TEST_EXHIBITION_TITLE,
+        cover_image_key=TEST_EXHIBITION_COVER,
+        settings={},
+        organization_id=test_organization.id,
+    )
+    db_session.add(exhibition)
+    await db_session.flush()
+
+    tag = Tag(name=TEST_TAG_NAME)
+    db_session.add(tag)
+    await db_session.flush()
+    db_session.add(ExhibitionTag(exhibition_id=exhibition.id, tag_id=tag.id))
+    db_session.add(ExhibitionParticipant(name=TEST_PARTICIPANT_NAME, exhibition_id=exhibition.id))
+
+    for position in (1, 0):
+        block = ExhibitionBlock(
+            exhibition_id=exhibition.id,
+            type="IMAGES_2",
+            content=f"block {position}",
+            settings={},
+            position=position,
+        )
+        db_session.add(block)
+        await db_session.flush()
+        for item_position in (1, 0):
+            db_session.add(
+                ExhibitionBlockItem(
+                    block_id=block.id,
+                    image_key=f"image-{position}-{item_position}",
+                    position=item_position,
+                ),
+            )
+
+    await db_session.commit()
+    await db_session.refresh(exhibition)
+    return exhibition
+
+
+@pytest.mark.asyncio
+async def test_get_exhibition_aggregate(db_session: AsyncSession, test_exhibition):
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+
+    assert exhibition is not None
+    assert exhibition.id == test_exhibition.id
+    assert exhibition.title == TEST_EXHIBITION_TITLE
+    assert [p.name for p in exhibition.participants] == [TEST_PARTICIPANT_NAME]
+    assert [t.name for t in exhibition.tags] == [TEST_TAG_NAME]
+    assert exhibition.likes_count == 0
+    assert exhibition.is_liked_by_current_user is None
+    assert [b.position for b in exhibition.blocks] == [0, 1]
+    assert [i.position for i in exhibition.blocks[0].items] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_exhibition_liked_by_current_user(
+    db_session: AsyncSession,
+    test_exhibition,
+    test_user,
+):
+    await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+
+    exhibition = await exhibition_crud.get_exhibition(
+        db_session,
+        current_user_id=test_user.id,
+        id=test_exhibition.id,
+    )
+
+    assert exhibition.likes_count == 1
+    assert exhibition.is_liked_by_current_user is True
+
+
+@pytest.mark.asyncio
+async def test_get_exhibition_not_found(db_session: AsyncSession, test_exhibition):
+    assert await exhibition_crud.get_exhibition(db_session, id=uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_get_exhibitions_page(db_session: AsyncSession, test_exhibition, test_organization):
+    for title in ("B Exhibition", "A Exhibition"):
+        db_session.add(
+            Exhibition(
+                title=title,
+                cover_image_key=TEST_EXHIBITION_COVER,
+                settings={},
+                organization_id=test_organization.id,
+            ),
+        )
+    await db_session.commit()
+
+    exhibitions = await exhibition_crud.get_exhibitions(
+        db_session,
+        sort=SortParams(sortBy="title", sortOrder="asc"),
+        skip=0,
+        limit=2,
+    )
+
+    assert exhibitions.count == 3
+    assert [e.title for e in exhibitions.data] == ["A Exhibition", "B Exhibition"]
+    assert exhibitions.data[0].blocks == []
+
+
+@pytest.mark.asyncio
+async def test_get_exhibitions_cursor(db_session: AsyncSession, test_exhibition, test_organization):
+    for title in ("B Exhibition", "A Exhibition"):
+        db_session.add(
+            Exhibition(
+                title=title,
+                cover_image_key=TEST_EXHIBITION_COVER,
+                settings={},
+                organization_id=test_organization.id,
+            ),
+        )
+    await db_session.commit()
+    sort = SortParams(sortBy="title", sortOrder="asc")
+
+    first_page = await exhibition_crud.get_exhibitions(db_session, sort=sort, limit=2)
+    second_page = await exhibition_crud.get_exhibitions(
+        db_session,
+        sort=sort,
+        limit=2,
+        cursor=first_page.next_cursor,
+    )
+
+    assert first_page.next_cursor is not None
+    assert [e.title for e in second_page.data] == [TEST_EXHIBITION_TITLE]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_unlike_exhibition_decrements_likes_count(
+    db_session: AsyncSession,
+    test_exhibition,
+    test_user,
+):
+    await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+    await user_crud.unlike_exhibition(db_session, test_exhibition.id, test_user.id)
+
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+
+    assert exhibition.likes_count == 0
+
+
+@pytest.mark.asyncio
+async def test_recount_likes(db_session: AsyncSession, test_exhibition, test_user):
+    db_session.add(UserExhibitionLike(exhibition_id=test_exhibition.id, user_id=test_user.id))
+    await db_session.commit()
+
+    fixed = await exhibition_crud.recount_likes(db_session)
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+
+    assert fixed == 1
+    assert exhibition.likes_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_exhibitions_full_text_search(
+    db_session: AsyncSession,
+    test_exhibition,
+    test_organization,
+):
+    db_session.add(
+        Exhibition(
+            title="Other Exhibition",
+            cover_image_key=TEST_EXHIBITION_COVER,
+            settings={},
+            organization_id=test_organization.id,
+        ),
+    )
+    await db_session.commit()
+    await refresh_search_document(db_session, test_exhibition.id)
+    await db_session.commit()
+
+    by_participant = await exhibition_crud.get_exhibitions(db_session, search="participant")
+    by_block = await exhibition_crud.get_exhibitions(
+        db_session,
+        filters=FilterParams(q="block"),
+    )
+
+    assert [e.id for e in by_participant.data] == [test_exhibition.id]
+    assert by_participant.count == 1
+    assert [e.id for e in by_block.data] == [test_exhibition.id]
+
+
+@pytest.mark.asyncio
+async def test_get_exhibitions_by_tags(
+    db_session: AsyncSession,
+    test_exhibition,
+    test_organization,
+):
+    other = Exhibition(
+        title="Other Exhibition",
+        cover_image_key=TEST_EXHIBITION_COVER,
+        settings={},
+        organization_id=test_organization.id,
+    )
+    tag = Tag(name="science")
+    db_session.add_all([other, tag])
+    await db_session.flush()
+    db_session.add(ExhibitionTag(exhibition_id=other.id, tag_id=tag.id))
+    await db_session.commit()
+
+    any_tag = await exhibition_crud.get_exhibitions(
+        db_session,
+        filters=FilterParams(tag_names=[TEST_TAG_NAME, "science"]),
+    )
+    all_tags = await exhibition_crud.get_exhibitions(
+        db_session,
+        filters=FilterParams(tag_names=[TEST_TAG_NAME, "science"], tag_match="all"),
+    )
+    by_id = await exhibition_crud.get_exhibitions(
+        db_session,
+        filters=FilterParams(tag_ids=[tag.id]),
+    )
+    by_raw_name = await exhibition_crud.get_exhibitions(
+        db_session,
+        filters=FilterParams(tag_names=[" Science "]),
+    )
+
+    assert any_tag.count == 2
+    assert all_tags.count == 0
+    assert all_tags.data == []
+    assert [e.id for e in by_id.data] == [other.id]
+    assert by_id.count == 1
+    assert [e.id for e in by_raw_name.data] == [other.id]
+
+
+@pytest.mark.asyncio
+async def test_get_exhibitions_count_modes(
+    db_session: AsyncSession,
+    test_exhibition,
+    test_organization,
+):
+    db_session.add(
+        Exhibition(
+            title="Other Exhibition",
+            cover_image_key=TEST_EXHIBITION_COVER,
+            settings={},
+            organization_id=test_organization.id,
+        ),
+    )
+    await db_session.commit()
+
+    without_count = await exhibition_crud.get_exhibitions(
+        db_session,
+        limit=1,
+        count_mode=CountMode.none,
+    )
+    estimated = await exhibition_crud.get_exhibitions(
+        db_session,
+        limit=1,
+        count_mode=CountMode.estimate,
+    )
+    last_page = await exhibition_crud.get_exhibitions(
+        db_session,
+        skip=1,
+        limit=10,
+        count_mode=CountMode.estimate,
+    )
+    last_page_without_count = await exhibition_crud.get_exhibitions(
+        db_session,
+        skip=1,
+        limit=10,
+        count_mode=CountMode.none,
+    )
+
+    assert without_count.count is None
+    assert isinstance(estimated.count, int)
+    # The last offset page gives the exact total without counting
+    assert last_page.count == 2
+    assert last_page_without_count.count is None
+
+
+@pytest.mark.asyncio
+async def test_get_exhibitions_json_matches_models(db_session: AsyncSession, test_exhibition):
+    document = json.loads(await exhibition_crud.get_exhibitions_json(db_session))
+    exhibitions = await exhibition_crud.get_exhibitions(db_session)
+
+    expected = exhibitions.model_dump(mode="json")
+    assert document["count"] == expected["count"] == 1
+    assert document["next_cursor"] is None
+    row, expected_row = document["data"][0], expected["data"][0]
+    assert list(row) == list(expected_row)
+    assert row["id"] == expected_row["id"]
+    assert row["tags"][0].keys() == expected_row["tags"][0].keys()
+    assert row["participants"][0].keys() == expected_row["participants"][0].keys()
+    assert row["blocks"][0].keys() == expected_row["blocks"][0].keys()
+    assert row["blocks"][0]["items"] == expected_row["blocks"][0]["items"]
+
+
+@pytest.mark.asyncio
+async def test_published_catalogue(db_session: AsyncSession, test_exhibition, test_user):
+    draft_page = json.loads(await exhibition_crud.get_published_exhibitions_json(db_session))
+
+    await admin_exhibition_crud.update_exhibition_status(
+        db_session,
+        test_exhibition.id,
+        test_user.id,
+        ExhibitionStatusEnum.published,
+    )
+    await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+    published_page = json.loads(
+        await exhibition_crud.get_published_exhibitions_json(
+            db_session,
+            filters=FilterParams(tag_names=[TEST_TAG_NAME], q="participant"),
+        ),
+    )
+
+    assert draft_page["data"] == []
+    assert published_page["count"] == 1
+    card = published_page["data"][0]
+    assert card["id"] == str(test_exhibition.id)
+    assert card["likes_count"] == 1
+    assert [b["position"] for b in card["blocks"]] == [0, 1]
+
+
+@pytest.mark.asyncio
+async def test_get_exhibition_detail_cache(db_session: AsyncSession, test_exhibition, test_user):
+    await exhibition_crud.exhibition_cache.clear()
+    hits = exhibition_crud.exhibition_cache.local.hits
+
+    first = await exhibition_crud.get_exhibition_detail(db_session, test_exhibition.id)
+    second = await exhibition_crud.get_exhibition_detail(
+        db_session,
+        test_exhibition.id,
+        current_user_id=test_user.id,
+    )
+    await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+    liked = await exhibition_crud.get_exhibition_detail(
+        db_session,
+        test_exhibition.id,
+        current_user_id=test_user.id,
+    )
+
+    assert exhibition_crud.exhibition_cache.local.hits == hits + 1
+    assert first.is_liked_by_current_user is None
+    assert second.is_liked_by_current_user is False
+    assert liked.is_liked_by_current_user is True
+    assert liked.likes_count == 1
+
+
+@pytest.mark.asyncio
+async def test_like_exhibition_is_idempotent(db_session: AsyncSession, test_exhibition, test_user):
+    first = await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+    again = await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+    likes = await user_crud.get_exhibition_likes(
+        db_session,
+        test_user.id,
+        [uuid4(), test_exhibition.id],
+    )
+    unliked = await user_crud.unlike_exhibition(db_session, test_exhibition.id, test_user.id)
+    unliked_again = await user_crud.unlike_exhibition(
+        db_session,
+        test_exhibition.id,
+        test_user.id,
+    )
+
+    assert (first.likes_count, again.likes_count) == (1, 1)
+    assert [like.model_dump() for like in likes.data] == [
+        {
+            "exhibition_id": test_exhibition.id,
+            "likes_count": 1,
+            "is_liked_by_current_user": True,
+        },
+    ]
+    assert (unliked.likes_count, unliked_again.likes_count) == (0, 0)
+    assert unliked_again.is_liked_by_current_user is False
+    with pytest.raises(HTTPException):
+        await user_crud.like_exhibition(db_session, uuid4(), test_user.id)
+
+
+@pytest.mark.asyncio
+async def test_get_liked_exhibitions_pages_by_like_time(
+    db_session: AsyncSession,
+    test_exhibition,
+    test_organization,
+    test_user,
+):
+    other = Exhibition(
+        title="Other",
+        cover_image_key=TEST_EXHIBITION_COVER,
+        settings={},
+        organization_id=test_organization.id,
+    )
+    db_session.add(other)
+    await db_session.commit()
+    await user_crud.like_exhibition(db_session, other.id, test_user.id)
+    await user_crud.like_exhibition(db_session, test_exhibition.id, test_user.id)
+
+    first_page = await user_crud.get_liked_exhibitions(db_session, test_user.id, limit=1)
+    second_page = await user_crud.get_liked_exhibitions(
+        db_session,
+        test_user.id,
+        limit=1,
+        cursor=first_page.next_cursor,
+    )
+
+    assert first_page.count == 2
+    assert [e.id for e in first_page.data] == [test_exhibition.id]
+    assert first_page.data[0].is_liked_by_current_user is True
+    assert [t.name for t in first_page.data[0].tags] == [TEST_TAG_NAME]
+    assert [e.id for e in second_page.data] == [other.id]
+    assert second_page.next_cursor is None
+
+
+@pytest.mark.asyncio
+async def test_create_or_exist_exhibition_tags(db_session: AsyncSession, test_exhibition):
+    tags = await create_or_exist_exhibition_tags(
+        db_session,
+        tags=[" Art", "science", "SCIENCE", "", "history"],
+        exhibition_id=test_exhibition.id,
+    )
+    await db_session.commit()
+
+    assert [tag.name for tag in tags] == [TEST_TAG_NAME, "science", "history"]
+    # Only tags that were already committed get cached
+    assert (await tag_cache.get(TEST_TAG_NAME)).id == tags[0].id
+    assert await tag_cache.get("history") is None
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+    assert sorted(tag.name for tag in exhibition.tags) == ["art", "history", "science"]
+    again = await create_or_exist_exhibition_tags(
+        db_session,
+        tags=["history", "art"],
+        exhibition_id=test_exhibition.id,
+    )
+    assert [tag.id for tag in again] == [tags[2].id, tags[0].id]
+    assert (await tag_cache.get("history")).id == tags[2].id
+
+
+@pytest.mark.asyncio
+async def test_create_and_update_exhibition(db_session: AsyncSession, test_organization):
+    created = await exhibition_crud.create_exhibition(
+        db_session,
+        ExhibitionCreate(
+            title="New Exhibition",
+            cover_image_key=TEST_EXHIBITION_COVER,
+            settings={},
+            organization_id=test_organization.id,
+            participants=["Second", "First"],
+            tags=["Science", "art"],
+        ),
+    )
+
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=created.id)
+    assert [p.name for p in exhibition.participants] == ["Second", "First"]
+    assert [t.name for t in exhibition.tags] == ["art", "science"]
+    assert exhibition.updated_at == created.updated_at
+
+    renamed = await exhibition_crud.update_exhibition(
+        db_session,
+        created.id,
+        ExhibitionUpdate(title="Renamed", cover_image_key=TEST_EXHIBITION_COVER, settings={}),
+    )
+    assert renamed.title == "Renamed"
+    assert [p.name for p in renamed.participants] == ["Second", "First"]
+    assert [t.name for t in renamed.tags] == ["art", "science"]
+
+    retagged = await exhibition_crud.update_exhibition(
+        db_session,
+        created.id,
+        ExhibitionUpdate(
+            title="Renamed",
+            cover_image_key=TEST_EXHIBITION_COVER,
+            settings={},
+            participants=["Only"],
+            tags=["history"],
+        ),
+    )
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=created.id)
+    assert [p.name for p in exhibition.participants] == ["Only"] == [
+        p.name for p in retagged.participants
+    ]
+    assert [t.name for t in exhibition.tags] == ["history"]
+
+
+@pytest.mark.asyncio
+async def test_insert_move_and_reorder_blocks(db_session: AsyncSession, test_exhibition):
+    async def block_contents() -> list[str]:
+        exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+        return [block.content for block in exhibition.blocks]
+
+    inserted = await exhibition_block_crud.create_exhibition_block(
+        db_session,
+        ExhibitionBlockCreate(
+            exhibition_id=test_exhibition.id,
+            type="TEXT",
+            content="inserted",
+            settings={},
+            position=1,
+        ),
+    )
+    assert await block_contents() == ["block 0", "inserted", "block 1"]
+
+    await exhibition_block_crud.move_exhibition_block(
+        db_session,
+        test_exhibition.id,
+        inserted.id,
+        position=5,
+    )
+    assert await block_contents() == ["block 0", "block 1", "inserted"]
+
+    with pytest.raises(ValueError):
+        await exhibition_block_crud.move_exhibition_block(
+            db_session,
+            uuid4(),
+            inserted.id,
+            position=0,
+        )
+
+    block_ids = await db_session.scalars(
+        select(ExhibitionBlock.id)
+        .where(ExhibitionBlock.exhibition_id == test_exhibition.id)
+        .order_by(ExhibitionBlock.position.desc()),
+    )
+    await exhibition_block_crud.reorder_exhibition_blocks(
+        db_session,
+        test_exhibition.id,
+        list(block_ids),
+    )
+    assert await block_contents() == ["inserted", "block 1", "block 0"]
+
+    with pytest.raises(HTTPException):
+        await exhibition_block_crud.reorder_exhibition_blocks(
+            db_session,
+            test_exhibition.id,
+            [inserted.id],
+        )
+
+
+@pytest.mark.asyncio
+async def test_update_block_position_is_an_index(db_session: AsyncSession, test_exhibition):
+    async def blocks() -> list[ExhibitionBlock]:
+        exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+        return list(exhibition.blocks)
+
+    await exhibition_block_crud.create_exhibition_block(
+        db_session,
+        ExhibitionBlockCreate(
+            exhibition_id=test_exhibition.id,
+            type="TEXT",
+            content="block 2",
+            settings={},
+            position=2,
+        ),
+    )
+    first = (await blocks())[0]
+    assert first.content == "block 0"
+
+    await exhibition_block_crud.update_exhibition_block(
+        db_session,
+        ExhibitionBlockUpdate(
+            type=first.type,
+            content=first.content,
+            settings=first.settings,
+            position=2,
+        ),
+        first.id,
+    )
+    assert [block.content for block in await blocks()] == ["block 1", "block 2", "block 0"]
+
+
+@pytest.mark.asyncio
+async def test_update_block_items_writes_the_difference(db_session: AsyncSession, test_exhibition):
+    block = await db_session.scalar(
+        select(ExhibitionBlock).where(
+            ExhibitionBlock.exhibition_id == test_exhibition.id,
+            ExhibitionBlock.position == 0,
+        ),
+    )
+    kept_id = await db_session.scalar(
+        select(ExhibitionBlockItem.id).where(
+            ExhibitionBlockItem.block_id == block.id,
+            ExhibitionBlockItem.image_key == "image-0-1",
+        ),
+    )
+
+    await exhibition_block_crud.update_exhibition_block(
+        db_session,
+        ExhibitionBlockUpdate(
+            type=block.type,
+            content=block.content,
+            settings=block.settings,
+            position=block.position,
+            items=[
+                ExhibitionBlockItemCreate(image_key="image-0-1", text="caption"),
+                ExhibitionBlockItemCreate(image_key="image-new"),
+            ],
+        ),
+        block.id,
+    )
+
+    items = (
+        await db_session.execute(
+            select(ExhibitionBlockItem.id, ExhibitionBlockItem.image_key, ExhibitionBlockItem.text)
+            .where(ExhibitionBlockItem.block_id == block.id)
+            .order_by(ExhibitionBlockItem.position),
+        )
+    ).all()
+    assert [(item.image_key, item.text) for item in items] == [
+        ("image-0-1", "caption"),
+        ("image-new", None),
+    ]
+    assert items[0].id == kept_id
+
+
+@pytest.mark.asyncio
+async def test_import_exhibition_blocks(db_session: AsyncSession, test_exhibition):
+    blocks = [
+        ExhibitionBlockImport(
+            type="IMAGES_2",
+            content=f"<p>imported {index}</p><script>alert(1)</script>",
+            settings={},
+            items=[ExhibitionBlockItemCreate(image_key=f"imported-{index}-{i}") for i in range(3)],
+        )
+        for index in range(50)
+    ]
+
+    block_ids = await exhibition_block_crud.import_exhibition_blocks(
+        db_session,
+        test_exhibition.id,
+        blocks,
+    )
+
+    exhibition = await exhibition_crud.get_exhibition(db_session, id=test_exhibition.id)
+    assert [block.id for block in exhibition.blocks[2:]] == block_ids
+    assert exhibition.blocks[2].content.startswith("<p>imported 0</p>")
+    assert "<script>" not in exhibition.blocks[2].content
+    assert [item.image_key for item in exhibition.blocks[-1].items] == [
+        f"imported-49-{i}" for i in range(3)
+    ]
@@ -0,0 +1,199 @@
+import asyncio
+import fnmatch
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from backend.app.db.models.tag import TagPublic
+from backend.app.utils.cache import (
+    CacheBackend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+    SharedCache,
+    _encode_command,
+    _read_reply,
+)
+
+
+class FakeRedisServer:
+    """Just enough of a Redis server for the cache: strings with expiry, MGET, INCR, SCAN
+    and pub/sub."""
+
+    def __init__(self):
+        self.values: dict[bytes, tuple[bytes, float | None]] = {}
+        self.subscribers: dict[bytes, list[asyncio.StreamWriter]] = {}
+        self.server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        self.server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def stop(self) -> None:
+        self.server.close()
+        for writers in self.subscribers.values():
+            for writer in writers:
+                writer.close()
+
+    def _value(self, key: bytes) -> bytes | None:
+        value, expires_at = self.values.get(key, (None, None))
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.values[key]
+            return None
+        return value
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                command, *args = await _read_reply(reader)
+                writer.write(self._reply(command.upper(), args, writer))
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            writer.close()
+
+    def _reply(self, command: bytes, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        handler = getattr(self, f"_command_{command.decode().lower()}", None)
+        if handler is None:
+            return b"-ERR unknown command\r\n"
+        return handler(args, writer)
+
+    @staticmethod
+    def _bulk(value: bytes | None) -> bytes:
+        return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+
+    def _command_get(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        return self._bulk(self._value(args[0]))
+
+    def _command_mget(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        return b"*%d\r\n" % len(args) + b"".join(self._bulk(self._value(key)) for key in args)
+
+    def _command_set(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        expires_at = time.monotonic() + int(args[3]) / 1000 if len(args) > 2 else None
+        self.values[args[0]] = (args[1], expires_at)
+        return b"+OK\r\n"
+
+    def _command_del(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        return b":%d\r\n" % sum(self.values.pop(key, None) is not None for key in args)
+
+    def _command_incr(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        value = int(self._value(args[0]) or 0) + 1
+        self.values[args[0]] = (str(value).encode(), None)
+        return b":%d\r\n" % value
+
+    def _command_scan(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        pattern = args[2].decode()
+        keys = [key for key in self.values if fnmatch.fnmatchcase(key.decode(), pattern)]
+        return b"*2\r\n$1\r\n0\r\n" + _encode_command(*keys)
+
+    def _command_subscribe(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        self.subscribers.setdefault(args[0], []).append(writer)
+        return _encode_command(b"subscribe", args[0]).replace(b"*2", b"*3", 1) + b":1\r\n"
+
+    def _command_publish(self, args: list[bytes], writer: asyncio.StreamWriter) -> bytes:
+        subscribers = self.subscribers.get(args[0], [])
+        for subscriber in subscribers:
+            subscriber.write(_encode_command(b"message", args[0], args[1]))
+        return b":%d\r\n" % len(subscribers)
+
+
+async def _wait_for(condition) -> None:
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not met")
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_across_workers():
+    server = FakeRedisServer()
+    url = await server.start()
+    backends = [RedisCacheBackend(url, channel="test:invalidate") for _ in range(2)]
+    first, second = (SharedCache("tag", TagPublic, backend=backend) for backend in backends)
+    for backend in backends:
+        await backend.start()
+    await _wait_for(lambda: len(server.subscribers.get(b"test:invalidate", [])) == 2)
+    tag = TagPublic(id=uuid4(), name="art", created_at=datetime.now())
+    try:
+        await first.set("art", tag)
+        assert await second.get("art") == tag
+        assert second.hits == 1
+
+        await first.invalidate("art")
+        await _wait_for(lambda: len(second.local) == 0)
+        assert await second.get("art") is None
+        assert await second.get_or_load("art", lambda: asyncio.sleep(0, tag)) == tag
+        assert await first.get("art") == tag
+
+        generation = await second.generation("group")
+        await first.set(("group", generation), tag)
+        assert await second.get(("group", generation)) == tag
+        await first.bump("group")
+        await _wait_for(lambda: second.local.get(second.key(("generation", "group"))) is None)
+        assert await second.generation("group") == generation + 1
+    finally:
+        for backend in backends:
+            await backend.close()
+        await server.stop()
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_reads_as_empty_when_backend_is_down():
+    server = FakeRedisServer()
+    url = await server.start()
+    await server.stop()
+    await server.server.wait_closed()
+    cache = SharedCache(
+        "tag",
+        TagPublic,
+        backend=RedisCacheBackend(url, channel="test"),
+        local_size=0,
+    )
+
+    assert await cache.get("art") is None
+    assert await cache.generation("group") is None
+    await cache.invalidate("art")
+    assert cache.errors == 3
+
+
+async def _load_racing(cache: SharedCache, key: str, value: TagPublic, during) -> TagPublic:
+    """Loads `value` into the cache while `during` runs, after the load read its data."""
+    loading = asyncio.Event()
+    committed = asyncio.Event()
+
+    async def load() -> TagPublic:
+        loading.set()
+        await committed.wait()
+        return value
+
+    pending = asyncio.create_task(cache.get_or_load(key, load))
+    await loading.wait()
+    await during()
+    committed.set()
+    return await pending
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_load_racing_an_invalidation_is_not_stored():
+    cache = SharedCache("tag", TagPublic, backend=MemoryCacheBackend(16, 60))
+    stale = TagPublic(id=uuid4(), name="art", created_at=datetime.now())
+
+    assert await _load_racing(cache, "art", stale, lambda: cache.invalidate("art")) == stale
+    assert await cache.get("art") is None
+    assert await _load_racing(cache, "art", stale, cache.clear) == stale
+    assert await cache.get("art") is None
+
+    # Invalidating other keys doesn't keep this one from being stored
+    fresh = stale.model_copy(update={"name": "fresh"})
+    assert await _load_racing(cache, "art", fresh, lambda: cache.invalidate("science")) == fresh
+    assert await cache.get("art") == fresh
+
+
+def test_incomplete_cache_backend_fails_on_creation():
+    class GetOnlyBackend(CacheBackend):
+        async def get(self, key: str) -> bytes | None:
+            return None
+
+    with pytest.raises(TypeError):
+        GetOnlyBackend()
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+from backend.app.core.config import settings
+from backend.app.utils.concurrency import gather_reads, has_uncommitted_writes
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(Base):
+    __tablename__ = "notes"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'reads.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(insert(Note).values(id=1))
+    yield engine
+    await engine.dispose()
+
+
+def recording_read(seen: list, name: str, release: asyncio.Event | None = None):
+    """Read answering its name after recording the session it ran on (and, given an event,
+    waiting for it)."""
+
+    async def read(session: AsyncSession) -> str:
+        seen.append((name, session))
+        await session.execute(select(Note.id))
+        if release is not None:
+            await release.wait()
+        return name
+
+    return read
+
+
+@pytest.mark.asyncio
+async def test_gather_reads_runs_extra_reads_on_their_own_connections(engine):
+    seen = []
+    async with AsyncSession(engine) as session:
+        results = await gather_reads(
+            session,
+            *(recording_read(seen, name) for name in ("page", "count", "facets")),
+        )
+
+    assert results == ["page", "count", "facets"]
+    sessions = dict(seen)
+    assert sessions["page"] is session
+    assert sessions["count"] is not session
+    assert sessions["facets"] is not session
+
+
+@pytest.mark.asyncio
+async def test_gather_reads_is_parallel_after_a_read_only_transaction(engine):
+    seen = []
+    async with AsyncSession(engine) as session:
+        # Like loading the current user before a list
+        await session.get(Note, 1)
+        assert session.in_transaction()
+        assert not has_uncommitted_writes(session)
+        await gather_reads(session, recording_read(seen, "page"), recording_read(seen, "count"))
+
+    sessions = dict(seen)
+    assert sessions["page"] is session
+    assert sessions["count"] is not session
+
+
+@pytest.mark.asyncio
+async def test_gather_reads_is_sequential_with_uncommitted_writes(engine):
+    seen = []
+    async with AsyncSession(engine) as session:
+        session.add(Note(id=2))
+        await session.flush()
+        assert has_uncommitted_writes(session)
+        results = await gather_reads(
+            session,
+            recording_read(seen, "page"),
+            recording_read(seen, "count"),
+        )
+        assert all(read_session is session for _, read_session in seen)
+
+        await session.commit()
+        assert not has_uncommitted_writes(session)
+        await session.execute(insert(Note).values(id=3))
+        assert has_uncommitted_writes(session)
+
+    assert results == ["page", "count"]
+    assert [name for name, _ in seen] == ["page", "count"]
+
+
+@pytest.mark.asyncio
+async def test_gather_reads_respects_the_limit_without_waiting(engine, monkeypatch):
+    # The slots are counted per event loop, and every test runs on a fresh one
+    monkeypatch.setattr(settings, "CONCURRENT_READS_LIMIT", 1)
+    seen = []
+    async with AsyncSession(engine) as session:
+        results = await gather_reads(
+            session,
+            *(recording_read(seen, name) for name in ("page", "count", "facets")),
+        )
+    sessions = dict(seen)
+    assert results == ["page", "count", "facets"]
+    assert sessions["count"] is not session
+    assert sessions["facets"] is session
+
+    # While another request holds the only slot, the reads run on the session at once
+    release = asyncio.Event()
+    busy_seen = []
+    async with AsyncSession(engine) as busy_session:
+        busy = asyncio.create_task(
+            gather_reads(
+                busy_session,
+                recording_read(busy_seen, "page"),
+                recording_read(busy_seen, "count", release),
+            ),
+        )
+        while len(busy_seen) < 2:
+            await asyncio.sleep(0)
+        seen.clear()
+        async with AsyncSession(engine) as session:
+            results = await asyncio.wait_for(
+                gather_reads(session, recording_read(seen, "page"), recording_read(seen, "count")),
+                timeout=1,
+            )
+        assert results == ["page", "count"]
+        assert all(read_session is session for _, read_session in seen)
+
+        release.set()
+        await busy
+
+    # The slot is given back once the read is done
+    seen.clear()
+    async with AsyncSession(engine) as session:
+        await gather_reads(session, recording_read(seen, "page"), recording_read(seen, "count"))
+    assert dict(seen)["count"] is not session
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import pytest
+from backend.app.utils.http_cache import (
+    is_not_modified,
+    make_etag,
+    parse_byte_range,
+    validator_headers,
+)
+from fastapi import HTTPException
+from starlette.requests import Request
+
+
+def _request(**headers: str) -> Request:
+    raw_headers = [
+        (name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()
+    ]
+    return Request({"type": "http", "method": "GET", "headers": raw_headers})
+
+
+def test_if_none_match():
+    etag = make_etag("exhibition", 1)
+
+    assert is_not_modified(_request(if_none_match=etag), etag)
+    assert is_not_modified(_request(if_none_match=f'"other", {etag.removeprefix("W/")}'), etag)
+    assert is_not_modified(_request(if_none_match="*"), etag)
+    assert not is_not_modified(_request(if_none_match=make_etag("exhibition", 2)), etag)
+
+
+def test_if_modified_since():
+    updated_at = datetime(2024, 5, 1, 12, 30, 15, 500)
+    headers = validator_headers(make_etag(updated_at), updated_at)
+    last_modified = headers["Last-Modified"]
+
+    assert last_modified == "Wed, 01 May 2024 12:30:15 GMT"
+    assert is_not_modified(_request(if_modified_since=last_modified), headers["ETag"], updated_at)
+    assert not is_not_modified(
+        _request(if_modified_since="Wed, 01 May 2024 12:30:14 GMT"),
+        headers["ETag"],
+        updated_at,
+    )
+    # If-None-Match wins over If-Modified-Since
+    assert not is_not_modified(
+        _request(if_none_match='"stale"', if_modified_since=last_modified),
+        headers["ETag"],
+        updated_at,
+    )
+    assert not is_not_modified(_request(if_modified_since="garbage"), headers["ETag"], updated_at)
+
+
+def test_parse_byte_range():
+    assert parse_byte_range(None, 100) is None
+    assert parse_byte_range("bytes=0-9", 100) == (0, 9)
+    assert parse_byte_range("bytes=90-", 100) == (90, 99)
+    assert parse_byte_range("bytes=90-500", 100) == (90, 99)
+    assert parse_byte_range("bytes=-10", 100) == (90, 99)
+    assert parse_byte_range("bytes=-500", 100) == (0, 99)
+    assert parse_byte_range("bytes=0-1,5-6", 100) is None
+    assert parse_byte_range("items=0-1", 100) is None
+    assert parse_byte_range("bytes=9-0", 100) is None
+
+    with pytest.raises(HTTPException) as error:
+        parse_byte_range("bytes=100-", 100)
+    assert error.value.status_code == 416
+    assert error.value.headers == {"Content-Range": "bytes */100"}
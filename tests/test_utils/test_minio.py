@@ -0,0 +1,210 @@
+import asyncio
+import base64
+import hashlib
+import io
+from types import SimpleNamespace
+
+import pytest
+from backend.app.core.config import settings
+from backend.app.db.models.exhibition_block_item import ExhibitionBlockItemCreate
+from backend.app.db.schemas import CompletedUploadPart, PresignedUploadComplete
+from backend.app.utils.minio import MinIOClient
+from botocore.exceptions import ClientError
+from fastapi import HTTPException, UploadFile
+from pydantic import ValidationError
+
+PART_SIZE = 5 * 1024 * 1024
+
+
+class FakeS3Client:
+    """Records the upload calls and checks each body against its Content-MD5."""
+
+    exceptions = SimpleNamespace(ClientError=ClientError)
+
+    def __init__(self):
+        self.lifecycle_rules: list[dict] | None = None
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.aborted: list[str] = []
+        self.content_types: dict[str, str] = {}
+        self.presigned = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    @staticmethod
+    def _check_md5(body: bytes, content_md5: str) -> None:
+        assert base64.b64decode(content_md5) == hashlib.md5(body).digest()
+
+    async def put_object(self, *, Bucket, Key, Body, ContentType, ContentMD5):
+        self._check_md5(Body, ContentMD5)
+        self.objects[Key] = Body
+
+    async def create_multipart_upload(self, *, Bucket, Key, ContentType):
+        self.uploads[Key] = {}
+        self.content_types[Key] = ContentType
+        return {"UploadId": Key}
+
+    async def upload_part(self, *, Bucket, Key, UploadId, PartNumber, Body, ContentMD5):
+        self._check_md5(Body, ContentMD5)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f'"{PartNumber}"'}
+
+    async def complete_multipart_upload(self, *, Bucket, Key, UploadId, MultipartUpload):
+        parts = self.uploads.pop(UploadId)
+        numbers = [part["PartNumber"] for part in MultipartUpload["Parts"]]
+        assert numbers == sorted(parts)
+        self.objects[Key] = b"".join(parts[number] for number in numbers)
+
+    async def abort_multipart_upload(self, *, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId)
+        self.aborted.append(UploadId)
+
+    async def generate_presigned_url(self, *, ClientMethod, Params, ExpiresIn):
+        self.presigned += 1
+        if ClientMethod == "get_object":
+            return f"https://storage/{Params['Key']}?signature={self.presigned}"
+        return f"https://storage/{Params['Key']}?part={Params['PartNumber']}"
+
+    async def head_object(self, *, Bucket, Key):
+        body, content_type = self.objects[Key], self.content_types[Key]
+        return {"ContentLength": len(body), "ContentType": content_type}
+
+    async def copy_object(self, *, Bucket, Key, CopySource):
+        self.objects[Key] = self.objects[CopySource["Key"]]
+
+    async def delete_object(self, *, Bucket, Key):
+        del self.objects[Key]
+
+    async def head_bucket(self, *, Bucket):
+        return {}
+
+    async def get_bucket_lifecycle_configuration(self, *, Bucket):
+        if self.lifecycle_rules is None:
+            error = {"Error": {"Code": "NoSuchLifecycleConfiguration"}}
+            raise ClientError(error, "GetBucketLifecycleConfiguration")
+        return {"Rules": self.lifecycle_rules}
+
+    async def put_bucket_lifecycle_configuration(self, *, Bucket, LifecycleConfiguration):
+        self.lifecycle_rules = LifecycleConfiguration["Rules"]
+
+
+@pytest.fixture
+def s3(monkeypatch) -> tuple[MinIOClient, FakeS3Client]:
+    monkeypatch.setattr(settings, "MINIO_UPLOAD_PART_SIZE", PART_SIZE)
+    monkeypatch.setattr(settings, "MINIO_UPLOAD_CONCURRENCY", 2)
+    fake = FakeS3Client()
+    return MinIOClient(client=fake), fake
+
+
+def _upload(content: bytes) -> UploadFile:
+    return UploadFile(io.BytesIO(content), filename="scan.tiff")
+
+
+@pytest.mark.asyncio
+async def test_upload_file_streams_large_files_in_parts(s3):
+    minio_client, fake = s3
+    small = b"small file"
+    large = bytes(range(256)) * (PART_SIZE * 5 // 256 + 100)
+
+    small_key = await minio_client.upload_file(_upload(small))
+    large_key = await minio_client.upload_file(_upload(large))
+
+    assert fake.objects == {small_key: small, large_key: large}
+    assert fake.max_in_flight == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_file_aborts_above_size_limit(s3, monkeypatch):
+    minio_client, fake = s3
+    monkeypatch.setattr(settings, "MINIO_MAX_UPLOAD_SIZE", 3 * PART_SIZE)
+
+    with pytest.raises(HTTPException) as error:
+        await minio_client.upload_file(_upload(b"\0" * (4 * PART_SIZE)))
+
+    assert error.value.status_code == 413
+    assert len(fake.aborted) == 1
+    assert fake.uploads == {}
+    assert fake.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_presigned_multipart_upload_is_verified_on_completion(s3):
+    minio_client, fake = s3
+    upload = await minio_client.create_presigned_upload("image/tiff", 2 * PART_SIZE + 1)
+    assert [part.part_number for part in upload.parts] == [1, 2, 3]
+
+    # What the client does with the presigned part URLs
+    body = b"\1" * (2 * PART_SIZE + 1)
+    etags = []
+    for part in upload.parts:
+        chunk = body[(part.part_number - 1) * PART_SIZE : part.part_number * PART_SIZE]
+        response = await fake.upload_part(
+            Bucket="bucket",
+            Key=upload.upload_key,
+            UploadId=upload.upload_id,
+            PartNumber=part.part_number,
+            Body=chunk,
+            ContentMD5=base64.b64encode(hashlib.md5(chunk).digest()).decode(),
+        )
+        etags.append(CompletedUploadPart(part_number=part.part_number, etag=response["ETag"]))
+
+    object_key = await minio_client.complete_presigned_upload(
+        PresignedUploadComplete(
+            upload_key=upload.upload_key,
+            upload_id=upload.upload_id,
+            parts=etags,
+        ),
+    )
+    assert fake.objects == {object_key: body}
+    assert not object_key.startswith("pending/")
+    # Only the key returned by the completion may be stored
+    assert ExhibitionBlockItemCreate(image_key=object_key).image_key == object_key
+    with pytest.raises(ValidationError):
+        ExhibitionBlockItemCreate(image_key=upload.upload_key)
+
+
+@pytest.mark.asyncio
+async def test_presigned_upload_of_wrong_type_is_rejected(s3):
+    minio_client, fake = s3
+    with pytest.raises(HTTPException):
+        await minio_client.create_presigned_upload("text/html", 100)
+
+    fake.objects["pending/key"] = b"<html></html>"
+    fake.content_types["pending/key"] = "text/html"
+    with pytest.raises(HTTPException) as error:
+        await minio_client.complete_presigned_upload(
+            PresignedUploadComplete(upload_key="pending/key"),
+        )
+    assert error.value.status_code == 400
+    assert fake.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_presigned_file_urls_are_cached(s3):
+    minio_client, fake = s3
+
+    url, max_age = await minio_client.get_cached_file_url("image")
+    assert (await minio_client.get_cached_file_url("image"))[0] == url
+    assert fake.presigned == 1
+    expected = settings.MINIO_PRESIGNED_URL_EXPIRES - settings.MINIO_PRESIGNED_URL_SLACK
+    assert expected - 1 <= max_age <= expected
+
+    minio_client.url_cache.clear()
+    assert (await minio_client.get_cached_file_url("image"))[0] != url
+
+
+@pytest.mark.asyncio
+async def test_pending_upload_rule_is_merged_into_the_bucket_lifecycle(s3):
+    minio_client, fake = s3
+    await minio_client.initialize_bucket()
+    assert [rule["ID"] for rule in fake.lifecycle_rules] == ["expire-pending-uploads"]
+
+    archive = {"ID": "archive", "Filter": {"Prefix": "old/"}, "Status": "Enabled"}
+    fake.lifecycle_rules = [archive, {**fake.lifecycle_rules[0], "Status": "Disabled"}]
+    await minio_client.initialize_bucket()
+    assert fake.lifecycle_rules[0] == archive
+    assert [rule["Status"] for rule in fake.lifecycle_rules] == ["Enabled", "Enabled"]
@@ -0,0 +1,20 @@
+from backend.app.utils.positions import POSITION_GAP, position_between, spaced_positions
+
+
+def test_position_between():
+    assert position_between(None, None) == 0
+    assert position_between(None, 0) == -POSITION_GAP
+    assert position_between(POSITION_GAP, None) == 2 * POSITION_GAP
+    assert position_between(0, POSITION_GAP) == POSITION_GAP // 2
+    assert position_between(4, 5) is None
+
+
+def test_repeated_inserts_exhaust_the_gap():
+    positions = spaced_positions(2)
+    inserts = 0
+    while (position := position_between(positions[0], positions[1])) is not None:
+        positions.insert(1, position)
+        inserts += 1
+
+    assert positions == sorted(positions)
+    assert inserts == 10
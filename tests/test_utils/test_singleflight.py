@@ -0,0 +1,45 @@
+import asyncio
+
+import pytest
+from backend.app.utils.singleflight import SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_one_load():
+    flights = SingleFlight()
+    release = asyncio.Event()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await release.wait()
+        return "payload"
+
+    waiters = [asyncio.create_task(flights.do("key", load)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+
+    assert await asyncio.gather(*waiters) == ["payload"] * 5
+    assert len(calls) == 1
+    assert flights.stats() == {"in_flight": 0, "loads": 1, "coalesced": 4}
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_every_waiter_and_are_not_kept():
+    flights = SingleFlight()
+    release = asyncio.Event()
+
+    async def failing_load():
+        await release.wait()
+        raise RuntimeError("database is down")
+
+    async def load():
+        return "payload"
+
+    waiters = [asyncio.create_task(flights.do("key", failing_load)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await flights.do("key", load) == "payload"